@@ -0,0 +1,60 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+"""Vectorized vs. scalar-loop Gram evaluation of the univariate kernels.
+
+Run from the repository root with ``python benchmarks/bench_kernel_evaluate.py``.
+The scalar loop is timed on a subset of rows and extrapolated to the full matrix for large n.
+"""
+
+import time
+
+import numpy as np
+
+from kernel_embedding_dictionary.kernels import (
+    ExpQuadKernelUni,
+    Matern12KernelUni,
+    Matern32KernelUni,
+    Matern52KernelUni,
+    Matern72KernelUni,
+    MaternKernelUni,
+    UnivariateKernel,
+    Wendland0KernelUni,
+    Wendland2KernelUni,
+)
+
+kernel_uni_dict = {
+    "expquad": ExpQuadKernelUni(ell=1.0),
+    "matern": MaternKernelUni(nu=4.5, ell=1.0),
+    "matern12": Matern12KernelUni(ell=1.0),
+    "matern32": Matern32KernelUni(ell=1.0),
+    "matern52": Matern52KernelUni(ell=1.0),
+    "matern72": Matern72KernelUni(ell=1.0),
+    "wendland0": Wendland0KernelUni(ell=1.0),
+    "wendland2": Wendland2KernelUni(ell=1.0),
+}
+
+
+def time_func(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+
+    # max number of rows the scalar loop is run on before extrapolating
+    max_loop_rows = 50
+
+    print(f"{'kernel':<10} {'n':>6} {'vectorized [s]':>15} {'loop [s]':>12} {'speedup':>10}")
+    for n in [100, 1000, 10000]:
+        x1 = np.random.randn(n)
+        x2 = np.random.randn(n)
+        for name, k in kernel_uni_dict.items():
+            t_vec = time_func(k.evaluate, x1, x2)
+
+            n_rows = min(n, max_loop_rows)
+            t_loop = time_func(UnivariateKernel._evaluate_loop, k, x1[:n_rows], x2) * n / n_rows
+
+            print(f"{name:<10} {n:>6} {t_vec:>15.2e} {t_loop:>12.2e} {t_loop / t_vec:>10.0f}")
@@ -0,0 +1,71 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+"""NumPy vs. Numba-compiled Gram matrices and kernel mean embeddings in one dimension.
+
+Run from the repository root with ``python benchmarks/bench_numba.py``; the Numba columns need ``pip install numba``.
+The compiled functions are called once before timing, which compiles them or loads them from the on-disk cache.
+"""
+
+import time
+
+import numpy as np
+
+from kernel_embedding_dictionary.embeddings.mean_funcs_1d import (
+    expquad_lebesgue_mean_func_1d,
+    matern32_gaussian_mean_func_1d,
+    matern_lebesgue_mean_func_1d,
+    wendland2_gaussian_mean_func_1d,
+)
+from kernel_embedding_dictionary.embeddings.mean_funcs_1d_numba import mean_1d
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d import (
+    expquad_kernel_func_1d,
+    matern32_kernel_func_1d,
+    matern_kernel_func_1d,
+    wendland2_kernel_func_1d,
+)
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d_numba import NUMBA_AVAILABLE, kernel_gram_1d
+
+kernel_funcs = {
+    "expquad": (expquad_kernel_func_1d, {"ell": 1.0}),
+    "matern32": (matern32_kernel_func_1d, {"ell": 1.0, "nu": 1.5}),
+    "matern": (matern_kernel_func_1d, {"ell": 1.0, "nu": 4.5}),
+    "wendland2": (wendland2_kernel_func_1d, {"ell": 1.0, "order": 2}),
+}
+
+mean_funcs = {
+    "expquad-lebesgue": (expquad_lebesgue_mean_func_1d, {"ell": 1.0, "lb": 0.0, "ub": 1.0, "density": 1.0}),
+    "matern32-gaussian": (matern32_gaussian_mean_func_1d, {"ell": 1.0, "nu": 1.5, "mean": 0.0, "variance": 1.0}),
+    "matern-lebesgue": (matern_lebesgue_mean_func_1d, {"ell": 1.0, "nu": 4.5, "lb": 0.0, "ub": 1.0, "density": 1.0}),
+    "wendland2-gaussian": (wendland2_gaussian_mean_func_1d, {"ell": 1.0, "order": 2, "mean": 0.0, "variance": 1.0}),
+}
+
+
+def time_func(func, *args, **kwargs) -> float:
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    print(f"numba available: {NUMBA_AVAILABLE}")
+
+    print(f"{'gram':<20} {'n':>8} {'numpy [s]':>10} {'numba [s]':>10} {'speedup':>8}")
+    for n in [1000, 4000]:
+        x1 = np.random.randn(n)
+        x2 = np.random.randn(n)
+        for name, (func, params) in kernel_funcs.items():
+            t_numpy = time_func(func, x1[:, None], x2[None, :], **params)
+            kernel_gram_1d(func, x1[:10], x2[:10], **params)
+            t_numba = time_func(kernel_gram_1d, func, x1, x2, **params)
+            print(f"{name:<20} {n:>8} {t_numpy:>10.2e} {t_numba:>10.2e} {t_numpy / t_numba:>8.1f}")
+
+    print(f"{'mean':<20} {'n':>8} {'numpy [s]':>10} {'numba [s]':>10} {'speedup':>8}")
+    for n in [100000, 1000000]:
+        x = np.random.randn(n)
+        for name, (func, params) in mean_funcs.items():
+            t_numpy = time_func(func, x, **params)
+            mean_1d(func, x[:10], **params)
+            t_numba = time_func(mean_1d, func, x, **params)
+            print(f"{name:<20} {n:>8} {t_numpy:>10.2e} {t_numba:>10.2e} {t_numpy / t_numba:>8.1f}")
@@ -0,0 +1,47 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+"""Thread scaling of Gram and kernel mean evaluation.
+
+Run from the repository root with ``python benchmarks/bench_parallel.py``. Limit BLAS to one thread per worker
+(e.g. ``OPENBLAS_NUM_THREADS=1``) to measure the scaling of the thread pool alone.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from kernel_embedding_dictionary import get_embedding
+
+
+def time_func(func, *args, **kwargs) -> float:
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+
+    ndim = 4
+    n_gram = 4000
+    n_mean = 2000000
+    tile_size = 64
+    workers_list = [w for w in [1, 2, 4, 8, 16, 32] if w <= 2 * (os.cpu_count() or 1)]
+
+    ke = get_embedding("matern52", "lebesgue", {"ndim": ndim}, {"ndim": ndim})
+    x_gram = np.random.rand(n_gram, ndim)
+    x_mean = np.random.rand(n_mean, ndim)
+    K = np.empty([n_gram, n_gram])
+
+    print(f"cpu count: {os.cpu_count()}")
+    print(f"{'workers':>7} {'gram [s]':>10} {'speedup':>8} {'mean [s]':>10} {'speedup':>8}")
+    t_gram_1 = None
+    t_mean_1 = None
+    for num_workers in workers_list:
+        t_gram = time_func(ke.kernel.evaluate, x_gram, x_gram, out=K, tile_size=tile_size, num_workers=num_workers)
+        t_mean = time_func(ke.mean, x_mean, num_workers=num_workers)
+        t_gram_1 = t_gram_1 or t_gram
+        t_mean_1 = t_mean_1 or t_mean
+        print(f"{num_workers:>7} {t_gram:>10.3f} {t_gram_1 / t_gram:>8.2f} {t_mean:>10.3f} {t_mean_1 / t_mean:>8.2f}")
@@ -2,5 +2,6 @@
 # SPDX-License-Identifier: MIT
 
 from .embedding import KernelEmbedding
+from .random_fourier_features import RandomFourierFeatures
 
-__all__ = ["KernelEmbedding"]
+__all__ = ["KernelEmbedding", "RandomFourierFeatures"]
@@ -2,25 +2,36 @@
 # SPDX-License-Identifier: MIT
 
 
-from typing import Callable
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from ..kernels import ProductKernel
 from ..measures import ProductMeasure
+from ..parallel import BACKENDS, get_blocks, run_blocks, run_blocks_in_processes
+from ..utils import check_dtype
 from .mean_funcs_1d import (
     expquad_gaussian_mean_func_1d,
+    expquad_gaussian_mean_of_mean_func_1d,
     expquad_lebesgue_mean_func_1d,
+    expquad_lebesgue_mean_of_mean_func_1d,
     matern12_gaussian_mean_func_1d,
+    matern12_gaussian_mean_of_mean_func_1d,
     matern12_lebesgue_mean_func_1d,
     matern32_gaussian_mean_func_1d,
+    matern32_gaussian_mean_of_mean_func_1d,
     matern32_lebesgue_mean_func_1d,
     matern52_lebesgue_mean_func_1d,
     matern72_lebesgue_mean_func_1d,
     matern_lebesgue_mean_func_1d,
+    matern_lebesgue_mean_of_mean_func_1d,
     wendland0_gaussian_mean_func_1d,
+    wendland0_gaussian_mean_of_mean_func_1d,
     wendland0_lebesgue_mean_func_1d,
+    wendland0_lebesgue_mean_of_mean_func_1d,
     wendland2_gaussian_mean_func_1d,
+    wendland2_gaussian_mean_of_mean_func_1d,
 )
 
 
@@ -35,6 +46,8 @@ class KernelEmbedding:
 
         # kernel and measure must be set first
         self._mean_func_1d = self._get_1d_funcs()
+        self._mean_of_mean_func_1d = self._get_1d_mean_of_mean_funcs()
+        self._mean_of_mean = None
 
     @property
     def kernel(self) -> ProductKernel:
@@ -50,20 +63,101 @@ class KernelEmbedding:
     def __repr__(self) -> str:
         return f"Kernel embedding for {self._kernel.__repr__()} and {self._measure.__repr__()}."
 
-    def mean(self, x: np.ndarray) -> np.ndarray:
+    def mean(
+        self,
+        x: np.ndarray,
+        num_workers: int = 1,
+        chunk_size: Optional[int] = None,
+        backend: str = "thread",
+        dtype: DTypeLike = np.float64,
+        lengthscales: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Kernel mean at x with shape (n, d), or at B independent sets of points x with shape (B, n, d) with result
+        of shape (B, n). Chunks and workers then split the sets instead of the points.
+
+        :param num_workers: Number of workers the points are distributed to in chunks. The result is bitwise
+            identical to the serial evaluation.
+        :param chunk_size: Optional number of points per chunk. Defaults to DEFAULT_BLOCK_SIZE of
+            kernel_embedding_dictionary.parallel, independent of num_workers.
+        :param backend: "thread" or "process". Processes share the points and the result via shared memory.
+        :param dtype: Floating point type of the computation and the result, e.g., np.float32. See the README for
+            the accuracy of float32 per kernel and measure.
+        :param lengthscales: Optional lengthscales of shape (B, d) that replace those of the kernel. The kernel means
+            of all B lengthscale vectors are evaluated in one vectorized call per dimension, with the parameters of
+            the measure shared across the batch, and the result has shape (B, n). The points are not distributed to
+            workers in this case, and x must have shape (n, d).
+        """
+
+        self._check_x(x, allow_stacked=lengthscales is None)
+
+        if backend not in BACKENDS:
+            raise ValueError(f"backend ({backend}) must be one of {BACKENDS}.")
+
+        dtype = check_dtype(dtype)
+
+        if lengthscales is not None:
+            return self._mean_batch(x, self._kernel.get_batch_param_dicts(lengthscales), dtype)
+
+        if num_workers < 1:
+            raise ValueError(f"num_workers ({num_workers}) must be a positive integer.")
+
+        blocks = get_blocks(x.shape[0], chunk_size)
+        arrays = {"x": x.astype(dtype, copy=False), "kernel_mean": np.empty(x.shape[:-1], dtype=dtype)}
+        if backend == "process" and num_workers > 1:
+            run_blocks_in_processes(_mean_chunk, self, arrays, ["kernel_mean"], blocks, num_workers)
+        else:
+            run_blocks(lambda start, stop: _mean_chunk(self, arrays, start, stop), blocks, num_workers)
+        return arrays["kernel_mean"]
+
+    def mean_batch(self, x: np.ndarray, dtype: DTypeLike = np.float64, **measure_params) -> np.ndarray:
+        """Kernel means at x with shape (n, d) for a batch of B measures of the family of the measure.
+
+        All measures are evaluated in one vectorized call of the closed forms per dimension.
+
+        :param dtype: Floating point type of the computation and the result.
+        :param measure_params: Parameters of the measures with leading dimension B, i.e., means and/or variances of
+            shape (B, d) for the gaussian measure and bounds of shape (B, d, 2) for the lebesgue measure. Parameters
+            not given are those of the measure.
+        :return: The kernel means, of shape (B, n).
+        """
+        self._check_x(x)
+        return self._mean_batch(x, self._measure.get_batch_param_dicts(**measure_params), check_dtype(dtype))
+
+    def _mean_batch(self, x: np.ndarray, batch_params: List[dict], dtype: np.dtype) -> np.ndarray:
+        """Kernel means at x for batch_params[dim], which maps parameter names to arrays of shape (B,)."""
+        x = x.astype(dtype, copy=False)
+        batch_size = next(iter(batch_params[0].values())).shape[0]
+
+        kernel_mean = np.ones([batch_size, x.shape[0]], dtype=dtype)
+        for dim in range(self.ndim):
+            params_dim = {**self._kernel.get_param_dict_from_dim(dim), **self._measure.get_param_dict_from_dim(dim)}
+            params_dim = {key: dtype.type(value) for key, value in params_dim.items()}
+            # batched parameters as columns, which broadcast against the points
+            params_dim.update({key: value.astype(dtype)[:, None] for key, value in batch_params[dim].items()})
+            kernel_mean *= self._mean_func_1d(x[:, dim], **params_dim)
+        return kernel_mean
 
+    def mean_of_mean(self) -> float:
+        """Integral of the kernel over both arguments under the measure, i.e., the mean of the kernel mean.
+
+        This is the initial error of kernel quadrature, and the constant term of the MMD. It is the product of the
+        closed forms per dimension, computed on the first call and cached.
+        """
+        if self._mean_of_mean is None:
+            mean_of_mean = 1.0
+            for dim in range(self.ndim):
+                params_dim = {**self._kernel.get_param_dict_from_dim(dim), **self._measure.get_param_dict_from_dim(dim)}
+                mean_of_mean *= self._mean_of_mean_func_1d(**params_dim)
+            self._mean_of_mean = mean_of_mean
+        return self._mean_of_mean
+
+    def _check_x(self, x: np.ndarray, allow_stacked: bool = False) -> None:
         e_msg = f"x has wrong shape {x.shape}. Perhaps the dimensionality does not match the kernel embedding."
-        if len(x.shape) != 2:
+        if len(x.shape) != 2 and not (allow_stacked and len(x.shape) == 3):
             raise ValueError(e_msg)
-        if self.ndim != x.shape[1]:
+        if self.ndim != x.shape[-1]:
             raise ValueError(e_msg)
 
-        kernel_mean = np.ones(x.shape[0])
-        for dim in range(x.shape[1]):
-            params_dim = {**self._kernel.get_param_dict_from_dim(dim), **self._measure.get_param_dict_from_dim(dim)}
-            kernel_mean *= self._mean_func_1d(x[:, dim], **params_dim)
-        return kernel_mean
-
     def _get_1d_funcs(self) -> Callable:
 
         mean_func_1d_dict = {
@@ -90,3 +184,36 @@ class KernelEmbedding:
             )
 
         return mean_func_1d
+
+    def _get_1d_mean_of_mean_funcs(self) -> Callable:
+
+        # the Matern kernels with fixed nu share the form of the matern kernel
+        mean_of_mean_func_1d_dict = {
+            "expquad-lebesgue": expquad_lebesgue_mean_of_mean_func_1d,
+            "expquad-gaussian": expquad_gaussian_mean_of_mean_func_1d,
+            "matern-lebesgue": matern_lebesgue_mean_of_mean_func_1d,
+            "matern12-lebesgue": matern_lebesgue_mean_of_mean_func_1d,
+            "matern12-gaussian": matern12_gaussian_mean_of_mean_func_1d,
+            "matern32-lebesgue": matern_lebesgue_mean_of_mean_func_1d,
+            "matern32-gaussian": matern32_gaussian_mean_of_mean_func_1d,
+            "matern52-lebesgue": matern_lebesgue_mean_of_mean_func_1d,
+            "matern72-lebesgue": matern_lebesgue_mean_of_mean_func_1d,
+            "wendland0-lebesgue": wendland0_lebesgue_mean_of_mean_func_1d,
+            "wendland0-gaussian": wendland0_gaussian_mean_of_mean_func_1d,
+            "wendland2-gaussian": wendland2_gaussian_mean_of_mean_func_1d,
+        }
+
+        return mean_of_mean_func_1d_dict[self._kernel.name + "-" + self._measure.name]
+
+
+def _mean_chunk(embedding: KernelEmbedding, arrays: Dict[str, np.ndarray], start: int, stop: int) -> None:
+    """Kernel mean at points start to stop, or at sets of points start to stop if the points are batched; module
+    level so that process workers can unpickle it."""
+    x = arrays["x"][start:stop]
+    kernel_mean = arrays["kernel_mean"][start:stop]
+    kernel_mean.fill(1.0)
+    for dim in range(x.shape[-1]):
+        params_dim = {**embedding.kernel.get_param_dict_from_dim(dim), **embedding.measure.get_param_dict_from_dim(dim)}
+        # parameters in the type of x so that expressions in them do not promote the computation to float64
+        params_dim = {key: x.dtype.type(value) for key, value in params_dim.items()}
+        kernel_mean *= embedding._mean_func_1d(x[..., dim], **params_dim)
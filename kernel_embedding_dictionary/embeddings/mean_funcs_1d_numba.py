@@ -0,0 +1,258 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import math
+from typing import Callable
+
+import numpy as np
+
+from kernel_embedding_dictionary.backend import _ERFCX_CHEBYSHEV_COEFS
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d import wendland0_kernel_func_1d, wendland2_kernel_func_1d
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d_numba import NUMBA_AVAILABLE, njit, njit_parallel, prange
+
+from .mean_funcs_1d import (
+    _WENDLAND_QUADRATURE_MAX_RATIO,
+    _WENDLAND_QUADRATURE_NODES,
+    _WENDLAND_QUADRATURE_WEIGHTS,
+    expquad_gaussian_mean_func_1d,
+    expquad_lebesgue_mean_func_1d,
+    matern12_gaussian_mean_func_1d,
+    matern12_lebesgue_mean_func_1d,
+    matern32_gaussian_mean_func_1d,
+    matern32_lebesgue_mean_func_1d,
+    matern52_lebesgue_mean_func_1d,
+    matern72_lebesgue_mean_func_1d,
+    matern_lebesgue_mean_coefs,
+    matern_lebesgue_mean_func_1d,
+    wendland0_gaussian_mean_func_1d,
+    wendland0_lebesgue_mean_func_1d,
+    wendland2_gaussian_mean_func_1d,
+)
+
+# Numba-compiled elementwise loops of the mean embeddings in mean_funcs_1d, with the same numerically safe
+# formulations evaluated per point. Without Numba, mean_1d falls back to the NumPy functions.
+_ERFCX_COEFS = np.array(_ERFCX_CHEBYSHEV_COEFS)
+_SQRT2 = math.sqrt(2)
+_SQRT2PI = math.sqrt(2 * math.pi)
+
+
+# scalar building blocks
+@njit
+def _erfcx_nonneg(x: float) -> float:
+    t = 2.0 / (2.0 + x)
+    ty = 4.0 * t - 2.0
+    d = 0.0
+    dd = 0.0
+    for k in range(_ERFCX_COEFS.shape[0] - 1, 0, -1):
+        d, dd = ty * d - dd + _ERFCX_COEFS[k], d
+    return t * math.exp(0.5 * (_ERFCX_COEFS[0] + ty * d) - dd)
+
+
+@njit
+def _erf_diff(a: float, b: float) -> float:
+    if a > 0:
+        return math.erfc(a) - math.erfc(b)
+    if b < 0:
+        return math.erfc(-b) - math.erfc(-a)
+    return math.erf(b) - math.erf(a)
+
+
+@njit
+def _exp_ndtr(log_scale: float, z: float, log_gauss: float) -> float:
+    if z < 0:
+        return math.exp(log_gauss) * _erfcx_nonneg(-z / _SQRT2) / 2
+    return math.exp(log_scale + math.log1p(-math.erfc(z / _SQRT2) / 2))
+
+
+@njit
+def _matern32_gaussian_term(log_scale: float, z: float, log_gauss: float, ratio: float) -> float:
+    gauss = math.exp(log_gauss) / _SQRT2PI
+    if z < 0:
+        t = -z
+        mills = math.sqrt(math.pi / 2) * _erfcx_nonneg(t / _SQRT2)
+        if t > 4.0:
+            tail = t
+            for k in range(40, 1, -1):
+                tail = t + k / tail
+            one_minus_t_mills = mills / tail
+        else:
+            one_minus_t_mills = 1 - t * mills
+        return gauss * (mills + ratio * one_minus_t_mills)
+    cdf_term = math.exp(log_scale + math.log1p(-math.erfc(z / _SQRT2) / 2)) * (1 + ratio * z)
+    return cdf_term + ratio * gauss
+
+
+@njit
+def _wendland0_antiderivative(t: float, ell: float) -> float:
+    clipped = min(abs(t), ell)
+    return math.copysign(clipped * (1 - clipped / (2 * ell)), t)
+
+
+@njit
+def _wendland0_gaussian(x: float, ell: float, s: float) -> float:
+    phi_p = math.exp(-((ell + x) ** 2) / s**2)
+    phi_m = math.exp(-((ell - x) ** 2) / s**2)
+    erf_terms = (ell - x) * math.erf((ell - x) / s) + (ell + x) * math.erf((ell + x) / s) - 2 * x * math.erf(x / s)
+    gauss_terms = (phi_m + phi_p - 2 * math.exp(-(x**2) / s**2)) * s / math.sqrt(math.pi)
+    return (erf_terms + gauss_terms) / (2 * ell)
+
+
+@njit
+def _wendland2_gaussian(x: float, ell: float, variance: float, s: float) -> float:
+    phi_p = math.exp(-((x + ell) ** 2) / s**2)
+    phi_m = math.exp(-((x - ell) ** 2) / s**2)
+    term_1 = (phi_p + phi_m) * (ell**3 - ell * (7 * variance + 5 * x**2))
+    term_2 = (phi_p - phi_m) * (ell**2 * x + 3 * x * (5 * variance + x**2))
+    term_3 = math.exp(-(x**2) / s**2) * 16 * ell * (2 * variance + x**2)
+    exp_term = (term_1 - term_2 + term_3) * s / math.sqrt(math.pi)
+
+    c_0 = ell**4
+    c_1 = 6 * ell**2 * (x**2 + variance)
+    c_2 = 8 * ell * (3 * variance * x + x**3)
+    c_3 = 3 * (3 * variance**2 + 6 * variance * x**2 + x**4)
+    erf_term = (
+        (c_0 - c_1 - c_2 - c_3) * math.erf((ell + x) / s)
+        + (c_0 - c_1 + c_2 - c_3) * math.erf((ell - x) / s)
+        + 16 * ell * x * (3 * variance + x**2) * math.erf(x / s)
+    )
+    return (exp_term + erf_term) / (2 * ell**4)
+
+
+# elementwise loops with the parameters of the NumPy functions, out has the shape of x
+@njit_parallel
+def _expquad_lebesgue_loop(x: np.ndarray, out: np.ndarray, ell: float, lb: float, ub: float, density: float) -> None:
+    for i in prange(x.shape[0]):
+        erf_diff = _erf_diff((lb - x[i]) / (ell * _SQRT2), (ub - x[i]) / (ell * _SQRT2))
+        out[i] = density * math.sqrt(math.pi / 2.0) * ell * erf_diff
+
+
+@njit_parallel
+def _expquad_gaussian_loop(x: np.ndarray, out: np.ndarray, ell: float, mean: float, variance: float) -> None:
+    factor = math.sqrt(ell**2 / (ell**2 + variance))
+    scale = math.sqrt(2 * (ell**2 + variance))
+    for i in prange(x.shape[0]):
+        out[i] = factor * math.exp(-(((x[i] - mean) / scale) ** 2))
+
+
+@njit_parallel
+def _matern_lebesgue_loop(
+    x: np.ndarray, out: np.ndarray, alpha: float, cs: np.ndarray, lb: float, ub: float, density: float
+) -> None:
+    for i in prange(x.shape[0]):
+        x_lb = (x[i] - lb) / alpha
+        x_ub = (ub - x[i]) / alpha
+        poly_lb = cs[-1]
+        poly_ub = cs[-1]
+        for m in range(cs.shape[0] - 2, -1, -1):
+            poly_lb = poly_lb * x_lb + cs[m]
+            poly_ub = poly_ub * x_ub + cs[m]
+        out[i] = density * alpha * (2 * cs[0] - math.exp(-x_lb) * poly_lb - math.exp(-x_ub) * poly_ub)
+
+
+@njit_parallel
+def _matern12_gaussian_loop(
+    x: np.ndarray, out: np.ndarray, ell: float, nu: float, mean: float, variance: float
+) -> None:
+    ratio = math.sqrt(variance) / ell
+    for i in prange(x.shape[0]):
+        arg_var = (x[i] - mean) / math.sqrt(variance)
+        log_gauss = -(arg_var**2) / 2
+        term_1 = _exp_ndtr(ratio**2 / 2 + arg_var * ratio, -arg_var - ratio, log_gauss)
+        term_2 = _exp_ndtr(ratio**2 / 2 - arg_var * ratio, arg_var - ratio, log_gauss)
+        out[i] = term_1 + term_2
+
+
+@njit_parallel
+def _matern32_gaussian_loop(
+    x: np.ndarray, out: np.ndarray, ell: float, nu: float, mean: float, variance: float
+) -> None:
+    ratio = math.sqrt(3 * variance) / ell
+    for i in prange(x.shape[0]):
+        arg_var = (x[i] - mean) / math.sqrt(variance)
+        log_gauss = -(arg_var**2) / 2
+        term_1 = _matern32_gaussian_term(ratio**2 / 2 + arg_var * ratio, -arg_var - ratio, log_gauss, ratio)
+        term_2 = _matern32_gaussian_term(ratio**2 / 2 - arg_var * ratio, arg_var - ratio, log_gauss, ratio)
+        out[i] = term_1 + term_2
+
+
+@njit_parallel
+def _wendland0_lebesgue_loop(
+    x: np.ndarray, out: np.ndarray, ell: float, order: int, lb: float, ub: float, density: float
+) -> None:
+    for i in prange(x.shape[0]):
+        kernel_mean = _wendland0_antiderivative(ub - x[i], ell) - _wendland0_antiderivative(lb - x[i], ell)
+        out[i] = density * kernel_mean
+
+
+@njit_parallel
+def _wendland_gaussian_loop(
+    x: np.ndarray, out: np.ndarray, ell: float, order: int, variance: float, r: np.ndarray, weights: np.ndarray
+) -> None:
+    sd = math.sqrt(variance)
+    quadrature = ell < _WENDLAND_QUADRATURE_MAX_RATIO * sd
+    for i in prange(x.shape[0]):
+        if quadrature:
+            x_scaled = x[i] / sd
+            res = 0.0
+            for k in range(r.shape[0]):
+                r_scaled = r[k] * ell / sd
+                res += weights[k] * (
+                    math.exp(-((x_scaled - r_scaled) ** 2) / 2) + math.exp(-((x_scaled + r_scaled) ** 2) / 2)
+                )
+            out[i] = ell / (sd * _SQRT2PI) * res
+        elif order == 0:
+            out[i] = _wendland0_gaussian(x[i], ell, math.sqrt(2 * variance))
+        else:
+            out[i] = _wendland2_gaussian(x[i], ell, variance, math.sqrt(2 * variance))
+
+
+# wrappers from the parameters of the NumPy functions to the loops
+def _matern_lebesgue(x: np.ndarray, out: np.ndarray, ell: float, nu: float, lb: float, ub: float, density: float):
+    cs = np.asarray(matern_lebesgue_mean_coefs(int(nu)))
+    _matern_lebesgue_loop(x, out, ell / math.sqrt(2 * nu), cs, lb, ub, density)
+
+
+def _wendland_gaussian(kernel_func: Callable) -> Callable:
+    def wendland_gaussian(x: np.ndarray, out: np.ndarray, ell: float, order: int, mean: float, variance: float):
+        if mean != 0.0:
+            raise ValueError("Only mean=0 is supported.")
+        r = (_WENDLAND_QUADRATURE_NODES + 1) / 2
+        weights = _WENDLAND_QUADRATURE_WEIGHTS / 2 * kernel_func(r, 0.0, 1.0, order)
+        _wendland_gaussian_loop(x, out, ell, order, variance, r, weights)
+
+    return wendland_gaussian
+
+
+_LOOPS = {
+    expquad_lebesgue_mean_func_1d: _expquad_lebesgue_loop,
+    expquad_gaussian_mean_func_1d: _expquad_gaussian_loop,
+    matern_lebesgue_mean_func_1d: _matern_lebesgue,
+    matern12_lebesgue_mean_func_1d: _matern_lebesgue,
+    matern32_lebesgue_mean_func_1d: _matern_lebesgue,
+    matern52_lebesgue_mean_func_1d: _matern_lebesgue,
+    matern72_lebesgue_mean_func_1d: _matern_lebesgue,
+    matern12_gaussian_mean_func_1d: _matern12_gaussian_loop,
+    matern32_gaussian_mean_func_1d: _matern32_gaussian_loop,
+    wendland0_lebesgue_mean_func_1d: _wendland0_lebesgue_loop,
+    wendland0_gaussian_mean_func_1d: _wendland_gaussian(wendland0_kernel_func_1d),
+    wendland2_gaussian_mean_func_1d: _wendland_gaussian(wendland2_kernel_func_1d),
+}
+
+
+def mean_1d(mean_func: Callable, x: np.ndarray, **params) -> np.ndarray:
+    """Mean embedding mean_func(x, **params) of shape (n,), computed by a compiled loop if Numba is available.
+
+    :param mean_func: A mean embedding of mean_funcs_1d.
+    :param x: The points, of n elements.
+    """
+    if mean_func not in _LOOPS:
+        raise ValueError(f"No compiled version of mean embedding {mean_func.__name__}.")
+
+    x = np.ascontiguousarray(x).reshape(-1)
+    if not NUMBA_AVAILABLE:
+        return mean_func(x, **params)
+
+    out = np.empty(x.shape[0], dtype=np.result_type(x, np.float32))
+    _LOOPS[mean_func](x, out, **params)
+    return out
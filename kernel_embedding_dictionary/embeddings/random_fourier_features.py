@@ -0,0 +1,174 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from typing import Optional
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+from ..kernels import ProductKernel
+from ..measures import ProductMeasure
+
+
+class RandomFourierFeatures:
+    def __init__(self, kernel: ProductKernel, measure: ProductMeasure, num_features: int):
+        """Random Fourier features phi(x) = sqrt(2 / D) cos(W x + b) of a stationary product kernel and their mean
+        embedding under a product measure.
+
+        The frequencies W are drawn from the spectral density of the kernel, which is Gaussian for the
+        exponentiated quadratic kernel and Student-t for the Matern kernels. The mean embedding of the features is
+        available in closed form via the characteristic function of the measure.
+
+        :param kernel: Stationary product kernel.
+        :param measure: Product measure.
+        :param num_features: Number of features D.
+        """
+        if kernel.ndim != measure.ndim:
+            raise ValueError(f"kernel ({kernel.ndim}) and measure ({measure.ndim}) need to have same dimensionality.")
+
+        if kernel.name not in _spectral_samplers:
+            raise ValueError(
+                f"Random Fourier features for kernel '{kernel.name}' are not available. "
+                f"Available kernels are {list(_spectral_samplers.keys())}."
+            )
+
+        if measure.name not in _characteristic_funcs:
+            raise ValueError(
+                f"Random Fourier features for measure '{measure.name}' are not available. "
+                f"Available measures are {list(_characteristic_funcs.keys())}."
+            )
+
+        if num_features < 1:
+            raise ValueError(f"num_features ({num_features}) must be positive.")
+
+        self.ndim = kernel.ndim
+        self.num_features = num_features
+        self._kernel = kernel
+        self._measure = measure
+
+        sampler = _spectral_samplers[kernel.name]
+        self.frequencies = np.column_stack(
+            [sampler(num_features, **kernel.get_param_dict_from_dim(dim)) for dim in range(self.ndim)]
+        )
+        self.phases = np.random.rand(num_features) * 2 * np.pi
+
+        # kernel and measure as well as the frequencies must be set first
+        self._mean_features = self._compute_mean_features()
+
+    @property
+    def kernel(self) -> ProductKernel:
+        return self._kernel
+
+    @property
+    def measure(self) -> ProductMeasure:
+        return self._measure
+
+    @property
+    def mean_features(self) -> np.ndarray:
+        """Mean embedding of the features of shape (D, )."""
+        return self._mean_features
+
+    def features(self, x: np.ndarray) -> np.ndarray:
+        """Features at x with shape (n, d). The approximate kernel is features(x1) @ features(x2).T.
+
+        :return: The features of shape (n, D).
+        """
+        self._check_points(x)
+        res = x @ self.frequencies.T
+        res += self.phases
+        np.cos(res, out=res)
+        res *= np.sqrt(2 / self.num_features)
+        return res
+
+    def mean(self, x: np.ndarray) -> np.ndarray:
+        """Approximate kernel mean at x with shape (n, d)."""
+        return self.features(x) @ self._mean_features
+
+    def quadrature_weights(self, x: np.ndarray, nugget: float = 1e-10) -> np.ndarray:
+        """Kernel quadrature weights at the nodes x with shape (n, d) for the approximate kernel.
+
+        The weights solve (Phi Phi^T + nugget I) w = Phi m, with features Phi and mean features m. The solve is
+        carried out in feature space in O(n D^2) via the Woodbury identity.
+
+        :param nugget: Positive regularizer added to the diagonal of the approximate Gram matrix.
+        :return: The weights of shape (n, ).
+        """
+        if nugget <= 0:
+            raise ValueError(f"nugget ({nugget}) must be positive.")
+
+        phi = self.features(x)
+        gram = phi.T @ phi
+        gram[np.diag_indices_from(gram)] += nugget
+        return phi @ cho_solve(cho_factor(gram), self._mean_features)
+
+    def mmd(self, x: np.ndarray, weights: Optional[np.ndarray] = None) -> float:
+        """Maximum mean discrepancy between the weighted points x with shape (n, d) and the measure for the
+        approximate kernel.
+
+        :param weights: Weights of shape (n, ). Defaults to uniform weights 1 / n.
+        """
+        phi = self.features(x)
+        if weights is None:
+            weights = np.full(x.shape[0], 1 / x.shape[0])
+        if weights.shape != (x.shape[0],):
+            raise ValueError(f"weights ({weights.shape}) must have shape ({x.shape[0]},).")
+        return float(np.linalg.norm(phi.T @ weights - self._mean_features))
+
+    def _check_points(self, x: np.ndarray) -> None:
+        e_msg = f"x has wrong shape {x.shape}. Perhaps the dimensionality does not match the features."
+        if len(x.shape) != 2:
+            raise ValueError(e_msg)
+        if self.ndim != x.shape[1]:
+            raise ValueError(e_msg)
+
+    def _compute_mean_features(self) -> np.ndarray:
+        char_func = _characteristic_funcs[self._measure.name]
+        res = np.exp(1j * self.phases)
+        for dim in range(self.ndim):
+            res *= char_func(self.frequencies[:, dim], **self._measure.get_param_dict_from_dim(dim))
+        return np.sqrt(2 / self.num_features) * res.real
+
+    def __str__(self) -> str:
+        return (
+            f"Random Fourier features for\n\n{self._kernel.__str__()}\n\nand\n\n{self._measure.__str__()}\n\n"
+            f"number of features: {self.num_features}"
+        )
+
+    def __repr__(self) -> str:
+        return f"Random Fourier features for {self._kernel.__repr__()} and {self._measure.__repr__()}."
+
+
+# spectral densities of the univariate kernels
+def _expquad_spectral_sample(num_points: int, ell: float) -> np.ndarray:
+    return np.random.randn(num_points) / ell
+
+
+def _matern_spectral_sample(num_points: int, ell: float, nu: float) -> np.ndarray:
+    return np.random.standard_t(2 * nu, num_points) / ell
+
+
+_spectral_samplers = {
+    "expquad": _expquad_spectral_sample,
+    "matern": _matern_spectral_sample,
+    "matern12": _matern_spectral_sample,
+    "matern32": _matern_spectral_sample,
+    "matern52": _matern_spectral_sample,
+    "matern72": _matern_spectral_sample,
+}
+
+
+# characteristic functions E[exp(i w x)] of the univariate measures (times the total mass)
+def _gaussian_characteristic_func(w: np.ndarray, mean: float, variance: float) -> np.ndarray:
+    return np.exp(1j * w * mean - 0.5 * variance * w**2)
+
+
+def _lebesgue_characteristic_func(w: np.ndarray, lb: float, ub: float, density: float) -> np.ndarray:
+    # np.sinc(t) = sin(pi t) / (pi t) is well-defined at w = 0
+    return density * (ub - lb) * np.exp(0.5j * w * (ub + lb)) * np.sinc(w * (ub - lb) / (2 * np.pi))
+
+
+_characteristic_funcs = {
+    "gaussian": _gaussian_characteristic_func,
+    "lebesgue": _lebesgue_characteristic_func,
+}
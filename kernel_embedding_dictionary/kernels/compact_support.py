@@ -0,0 +1,42 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+
+from .kernel import ProductKernel
+
+
+def evaluate_sparse_compact(kernel: ProductKernel, x1: np.ndarray, x2: np.ndarray) -> csr_matrix:
+    """Sparse Gram matrix of a product kernel whose univariate kernels vanish for |x1 - x2| >= ell.
+
+    Candidate pairs are those within distance 1 in the ell-scaled infinity norm, which is exactly the support of
+    the product. They are enumerated with a KD-tree, so the cost scales with the number of non-zeros instead of
+    n1 * n2. A pair is not evaluated in the remaining dimensions once one factor is zero.
+
+    :param kernel: Product kernel with compactly supported univariate kernels and lengthscales kernel.ell.
+    :param x1: Points of shape (n1, d).
+    :param x2: Points of shape (n2, d).
+    :return: The Gram matrix of shape (n1, n2) in CSR format.
+    """
+    kernel._check_inputs(x1, x2)
+    n1 = x1.shape[0]
+    n2 = x2.shape[0]
+
+    ell = np.array(kernel.ell)
+    tree1 = cKDTree(x1 / ell)
+    tree2 = cKDTree(x2 / ell)
+    pairs = tree1.sparse_distance_matrix(tree2, max_distance=1.0, p=np.inf, output_type="ndarray")
+    rows = pairs["i"]
+    cols = pairs["j"]
+
+    values = np.ones(rows.shape[0])
+    active = np.arange(rows.shape[0])
+    for dim, k in enumerate(kernel._kernels):
+        values[active] *= k.evaluate_paired(x1[rows[active], dim], x2[cols[active], dim])
+        active = active[values[active] != 0]
+
+    nonzero = values != 0
+    return csr_matrix((values[nonzero], (rows[nonzero], cols[nonzero])), shape=(n1, n2))
@@ -2,7 +2,10 @@
 # SPDX-License-Identifier: MIT
 
 
-from typing import List, Optional
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from .kernel import ProductKernel, UnivariateKernel
 from .kernel_funcs_1d import expquad_kernel_func_1d
@@ -54,6 +57,114 @@ class ExpQuadKernel(ProductKernel):
     def ell(self) -> List[float]:
         return [k.ell for k in self._kernels]
 
+    def _prepare(self, x2: np.ndarray) -> Dict[str, np.ndarray]:
+        """Lengthscales and, in double precision, the centered and scaled x2 with its squared norms.
+
+        The center is the mean of x2, per problem if the points are batched.
+        """
+        # lengthscales per problem if the points are batched, so that they are split with the problems
+        ell = np.array(self.ell, dtype=x2.dtype)
+        prepared = {"ell": np.broadcast_to(ell, x2.shape[:-2] + ell.shape)}
+        if x2.dtype.itemsize < 8:
+            return prepared
+
+        # centering reduces the cancellation in the expansion when points are far from the origin
+        prepared["center"] = x2.mean(axis=-2, keepdims=True)
+        prepared["x2_scaled"] = (x2 - prepared["center"]) / ell
+        prepared["x2_sq_norm"] = np.sum(prepared["x2_scaled"] ** 2, axis=-1)
+        return prepared
+
+    def _work_size(self, shape: Tuple[int, ...], dtype: np.dtype) -> int:
+        """One tile of squared differences in single precision, the scaled x1 and its squared norms otherwise."""
+        if np.dtype(dtype).itemsize < 8:
+            return math.prod(shape)
+        return math.prod(shape[:-1]) * (self.ndim + 1)
+
+    def _evaluate(
+        self, x1: np.ndarray, x2: np.ndarray, out: np.ndarray, work: np.ndarray, prepared: Dict[str, np.ndarray]
+    ) -> None:
+        """Fused evaluation via ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a^T b on lengthscale-scaled inputs.
+
+        The cross term is a single matrix product written to out, hence one GEMM and one exp instead of a pass
+        per dimension. In single precision, the expansion loses too many digits for points far apart relative to
+        the lengthscales; there, the squared distances are accumulated from the differences per dimension.
+        """
+        ell = prepared["ell"]
+        if out.dtype.itemsize < 8:
+            out.fill(0.0)
+            scratch = work[: out.size].reshape(out.shape)
+            for dim in range(self.ndim):
+                np.subtract(x1[:, dim, None], x2[None, :, dim], out=scratch)
+                scratch /= ell[dim]
+                np.square(scratch, out=scratch)
+                out += scratch
+            out *= -0.5
+            np.exp(out, out=out)
+            return
+
+        n1 = x1.shape[0]
+        x1_scaled = work[: n1 * self.ndim].reshape(n1, self.ndim)
+        x1_sq_norm = work[n1 * self.ndim : n1 * (self.ndim + 1)]
+        np.subtract(x1, prepared["center"][0], out=x1_scaled)
+        x1_scaled /= ell
+
+        np.matmul(x1_scaled, prepared["x2_scaled"].T, out=out)
+        np.square(x1_scaled, out=x1_scaled)
+        np.sum(x1_scaled, axis=1, out=x1_sq_norm)
+        out *= -2.0
+        out += x1_sq_norm[:, None]
+        out += prepared["x2_sq_norm"][None, :]
+        np.maximum(out, 0.0, out=out)
+        out *= -0.5
+        np.exp(out, out=out)
+
+    def _evaluate_stacked(
+        self, x1: np.ndarray, x2: np.ndarray, out: np.ndarray, work: np.ndarray, prepared: Dict[str, np.ndarray]
+    ) -> None:
+        """Fused evaluation of B independent problems as in _evaluate, with one batched matrix product."""
+        if out.dtype.itemsize < 8:
+            ell = prepared["ell"][0]
+            out.fill(0.0)
+            scratch = work[: out.size].reshape(out.shape)
+            for dim in range(self.ndim):
+                np.subtract(x1[:, :, dim, None], x2[:, None, :, dim], out=scratch)
+                scratch /= ell[dim]
+                np.square(scratch, out=scratch)
+                out += scratch
+            out *= -0.5
+            np.exp(out, out=out)
+            return
+
+        batch_size, n1 = x1.shape[:2]
+        x1_scaled = work[: batch_size * n1 * self.ndim].reshape(batch_size, n1, self.ndim)
+        x1_sq_norm = work[batch_size * n1 * self.ndim : batch_size * n1 * (self.ndim + 1)].reshape(batch_size, n1)
+        np.subtract(x1, prepared["center"], out=x1_scaled)
+        x1_scaled /= prepared["ell"][:, None, :]
+
+        np.matmul(x1_scaled, prepared["x2_scaled"].transpose(0, 2, 1), out=out)
+        np.square(x1_scaled, out=x1_scaled)
+        np.sum(x1_scaled, axis=2, out=x1_sq_norm)
+        out *= -2.0
+        out += x1_sq_norm[:, :, None]
+        out += prepared["x2_sq_norm"][:, None, :]
+        np.maximum(out, 0.0, out=out)
+        out *= -0.5
+        np.exp(out, out=out)
+
+    def _evaluate_batch(self, x1: np.ndarray, x2: np.ndarray, params: List[dict], out: np.ndarray) -> None:
+        """Fused batch evaluation with one matrix product and one exp for all Gram matrices.
+
+        The exponents are the product of the inverse squared lengthscales, of shape (B, d), with the squared
+        differences per dimension, of shape (d, n1 * n2). The sums have positive terms only, hence relative errors
+        of order d machine epsilons, the same as in the evaluation per dimension.
+        """
+        inv_sq_ell = np.stack([1.0 / params[dim]["ell"] ** 2 for dim in range(self.ndim)], axis=1).astype(out.dtype)
+        sq_diff = np.square(x1[:, None, :] - x2[None, :, :]).reshape(-1, self.ndim)
+        exponents = out.reshape(out.shape[0], -1)
+        np.matmul(inv_sq_ell, sq_diff.T, out=exponents)
+        exponents *= -0.5
+        np.exp(exponents, out=exponents)
+
     def __str__(self) -> str:
         return f"exponentiated quadratic kernel \n" f"dimensionality: {self.ndim} \n" f"lengthscales: {list(self.ell)}"
 
@@ -3,12 +3,26 @@
 
 
 import abc
-from typing import List, Union
+import json
+import math
+import os
+import queue
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+from ..parallel import BACKENDS, get_blocks, run_blocks, run_blocks_in_processes
+from ..utils import check_dtype
+from .kernel_funcs_1d import KERNEL_FUNCS_INTO
 
 
 class UnivariateKernel(abc.ABC):
+    # Vectorized kernel function k(x1, x2, **param_dict) that broadcasts over x1 and x2, e.g., one of kernel_funcs_1d.
+    # Set by the built-in kernels; custom kernels may leave it None and implement _evaluate_pair only, in which case
+    # the kernel is evaluated by the scalar reference loops.
+    _kernel_func: Optional[Callable] = None
+
     @property
     @abc.abstractmethod
     def param_dict(self) -> dict:
@@ -20,18 +34,35 @@ class UnivariateKernel(abc.ABC):
         pass
 
     def _evaluate(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
-        """Reference implementation via scalar loop over all (x1[i], x2[j]) pairs.
+        """Gram matrix via self._kernel_func, or via the scalar loop _evaluate_loop if there is none.
 
-        Correct by construction but O(n1 * n2) Python iterations — slow for large inputs.
-        Override with a vectorized numpy implementation for performance, e.g.:
-            diff = (x1[:, None] - x2[None, :]) / self.ell
-            return np.exp(-0.5 * diff**2)  # expquad example
-        The loop body is the ground truth to validate any override against.
         x1 and x2 have shape (n1,) and (n2,).
         """
+        if self._kernel_func is None:
+            return self._evaluate_loop(x1, x2)
+        return self._kernel_func(x1[:, None], x2[None, :], **self.param_dict)
+
+    def _evaluate_into(self, x1: np.ndarray, x2: np.ndarray, out: np.ndarray, work: np.ndarray) -> None:
+        """Gram matrix written to out of shape (n1, n2), with work of the same shape as scratch space.
+
+        In place without temporaries if self._kernel_func has an in-place version in KERNEL_FUNCS_INTO, else via
+        _evaluate.
+        """
+        kernel_func_into = KERNEL_FUNCS_INTO.get(self._kernel_func)
+        if kernel_func_into is None:
+            out[...] = self._evaluate(x1, x2)
+            return
+        kernel_func_into(x1[:, None], x2[None, :], out=out, work=work, **self.param_dict)
+
+    def _evaluate_loop(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+        """Reference implementation via scalar loop over all (x1[i], x2[j]) pairs.
+
+        Correct by construction but O(n1 * n2) Python iterations — slow for large inputs. The loop body is the
+        ground truth to validate the vectorized evaluation against. x1 and x2 have shape (n1,) and (n2,).
+        """
         n1 = x1.shape[0]
         n2 = x2.shape[0]
-        K = np.zeros([n1, n2])
+        K = np.zeros([n1, n2], dtype=_result_dtype(x1, x2))
         for i in range(n1):
             for j in range(n2):
                 K[i, j] = self._evaluate_pair(x1[i], x2[j])
@@ -44,6 +75,54 @@ class UnivariateKernel(abc.ABC):
 
         return self._evaluate(x1, x2)
 
+    def _evaluate_paired(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+        """Kernel values of the aligned pairs (x1[i], x2[i]) via self._kernel_func, or via a scalar loop if there is
+        none. x1 and x2 have shape (n,).
+        """
+        if self._kernel_func is None:
+            return np.array(
+                [self._evaluate_pair(x1_i, x2_i) for x1_i, x2_i in zip(x1, x2)], dtype=_result_dtype(x1, x2)
+            )
+        return self._kernel_func(x1, x2, **self.param_dict)
+
+    def evaluate_paired(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+        """Kernel values k(x1[i], x2[i]) of aligned pairs. x1 and x2 have shape (n, )."""
+        if (len(x1.shape)) != 1 or (len(x2.shape) != 1):
+            raise ValueError(f"x1 ({x1.shape}) and x2 ({x2.shape}) must be one-dimensional arrays.")
+
+        if x1.shape != x2.shape:
+            raise ValueError(f"x1 ({x1.shape}) and x2 ({x2.shape}) must have the same number of points.")
+
+        return self._evaluate_paired(x1, x2)
+
+    def diag(self, x: np.ndarray) -> np.ndarray:
+        """Diagonal k(x[i], x[i]) of the Gram matrix. x has shape (n, )."""
+        return self.evaluate_paired(x, x)
+
+    def _evaluate_dist(self, dist: np.ndarray, params: dict) -> np.ndarray:
+        """Kernel values at distances dist = |x1 - x2| with params in place of param_dict, e.g., another ell.
+
+        Used for batches of parameters, which are arrays of shape (B, 1, 1) that broadcast against dist of shape
+        (n1, n2). Valid for stationary, symmetric kernels with a kernel function self._kernel_func; override otherwise.
+        """
+        return self._kernel_func(dist, 0.0, **params)
+
+    def _evaluate_stacked(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+        """Gram matrices of B independent sets of points via self._kernel_func, or via _evaluate per set if there is
+        none. x1 and x2 have shape (B, n1) and (B, n2), the result has shape (B, n1, n2).
+        """
+        if self._kernel_func is None:
+            return np.stack([self._evaluate(x1_b, x2_b) for x1_b, x2_b in zip(x1, x2)])
+        return self._kernel_func(x1[:, :, None], x2[:, None, :], **self.param_dict)
+
+    def _evaluate_stacked_into(self, x1: np.ndarray, x2: np.ndarray, out: np.ndarray, work: np.ndarray) -> None:
+        """Gram matrices of B independent sets of points written to out of shape (B, n1, n2), see _evaluate_into."""
+        kernel_func_into = KERNEL_FUNCS_INTO.get(self._kernel_func)
+        if kernel_func_into is None:
+            out[...] = self._evaluate_stacked(x1, x2)
+            return
+        kernel_func_into(x1[:, :, None], x2[:, None, :], out=out, work=work, **self.param_dict)
+
 
 class ProductKernel(abc.ABC):
     def __init__(self, name: str, kernel_list: List[UnivariateKernel]):
@@ -65,12 +144,317 @@ class ProductKernel(abc.ABC):
     def get_param_dict_from_dim(self, dim: int) -> dict:
         return self._kernels[dim].param_dict
 
-    def evaluate(self, x1: np.ndarray, x2: np.ndarray) -> np.ndarray:
+    def get_kernel_from_dim(self, dim: int) -> UnivariateKernel:
+        return self._kernels[dim]
+
+    def evaluate(
+        self,
+        x1: np.ndarray,
+        x2: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        tile_size: Optional[int] = None,
+        num_workers: int = 1,
+        backend: str = "thread",
+        dtype: Optional[DTypeLike] = None,
+    ) -> np.ndarray:
+        """Gram matrix of x1 with shape (n1, d) and x2 with shape (n2, d).
+
+        For B independent problems, x1 and x2 have shape (B, n1, d) and (B, n2, d), and the result holds the Gram
+        matrices of shape (B, n1, n2) of x1[b] and x2[b]. Tiles and workers then split the problems instead of
+        the rows.
+
+        :param out: Optional buffer of shape (n1, n2), or (B, n1, n2), and type dtype the result is written to. It
+            is returned.
+        :param tile_size: Optional number of rows evaluated at a time. The extra memory is bounded by
+            2 * tile_size * n2 per worker, allocated once per call. Defaults to DEFAULT_BLOCK_SIZE of
+            kernel_embedding_dictionary.parallel, independent of num_workers.
+        :param num_workers: Number of workers the row tiles are distributed to. The result is bitwise identical to
+            the serial evaluation.
+        :param backend: "thread" or "process". Processes share inputs and output via shared memory and suit
+            kernels whose evaluation holds the GIL, e.g., the scalar fallback of custom univariate kernels.
+        :param dtype: Floating point type of the computation and the result, e.g., np.float32 to halve memory and
+            bandwidth. Defaults to the type of out if given, else to np.float64.
+        """
+        if len(x1.shape) == 3 or len(x2.shape) == 3:
+            self._check_stacked_inputs(x1, x2)
+            shape = (x1.shape[0], x1.shape[1], x2.shape[1])
+        else:
+            self._check_inputs(x1, x2)
+            shape = (x1.shape[0], x2.shape[0])
+
+        if dtype is None:
+            dtype = np.float64 if out is None else out.dtype
+        dtype = check_dtype(dtype)
+
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"out has wrong shape {out.shape}, expected {shape}.")
+        elif out.dtype != dtype:
+            raise ValueError(f"out has wrong dtype {out.dtype}, expected {dtype}.")
+
+        if tile_size is not None and tile_size < 1:
+            raise ValueError(f"tile_size ({tile_size}) must be a positive integer.")
+
+        if backend not in BACKENDS:
+            raise ValueError(f"backend ({backend}) must be one of {BACKENDS}.")
+
+        if num_workers < 1:
+            raise ValueError(f"num_workers ({num_workers}) must be a positive integer.")
+
+        blocks = get_blocks(shape[0], tile_size)
+        x2 = x2.astype(dtype, copy=False)
+        arrays = {"x1": x1.astype(dtype, copy=False), "x2": x2, "out": out, **self._prepare(x2)}
+        if backend == "process" and num_workers > 1:
+            run_blocks_in_processes(_evaluate_tile, self, arrays, ["out"], blocks, num_workers)
+            return out
+
+        # one scratch buffer per concurrent tile, allocated once for the largest tile
+        work_pool = queue.SimpleQueue()
+        if blocks:
+            work_size = self._work_size(out[: blocks[0][1]].shape, dtype)
+            for _ in range(min(num_workers, len(blocks))):
+                work_pool.put(np.empty(work_size, dtype=dtype))
+        run_blocks(lambda start, stop: _evaluate_tile(self, arrays, start, stop, work_pool), blocks, num_workers)
+        return out
+
+    def evaluate_paired(self, x1: np.ndarray, x2: np.ndarray, dtype: DTypeLike = np.float64) -> np.ndarray:
+        """Kernel values k(x1[i], x2[i]) of aligned pairs in O(n * d). x1 and x2 have shape (n, d).
+
+        :param dtype: Floating point type of the computation and the result.
+        """
+        self._check_inputs(x1, x2)
+
+        if x1.shape[0] != x2.shape[0]:
+            raise ValueError(f"x1 ({x1.shape[0]}) and x2 ({x2.shape[0]}) must have the same number of points.")
+
+        dtype = check_dtype(dtype)
+        x1 = x1.astype(dtype, copy=False)
+        x2 = x2.astype(dtype, copy=False)
+
+        k_values = np.ones(x1.shape[0], dtype=dtype)
+        for dim, k in enumerate(self._kernels):
+            k_values *= k.evaluate_paired(x1[:, dim], x2[:, dim])
+        return k_values
+
+    def diag(self, x: np.ndarray, dtype: DTypeLike = np.float64) -> np.ndarray:
+        """Diagonal k(x[i], x[i]) of the Gram matrix in O(n * d). x has shape (n, d).
+
+        :param dtype: Floating point type of the computation and the result.
+        """
+        return self.evaluate_paired(x, x, dtype=dtype)
+
+    def evaluate_column(self, x1: np.ndarray, x2: np.ndarray, index: int, dtype: DTypeLike = np.float64) -> np.ndarray:
+        """Column k(x1[i], x2[index]) of the Gram matrix in O(n1 * d). x1 and x2 have shape (n1, d) and (n2, d).
+
+        :param dtype: Floating point type of the computation and the result.
+        """
+        self._check_inputs(x1, x2)
+
+        if not -x2.shape[0] <= index < x2.shape[0]:
+            raise ValueError(f"index ({index}) is out of range for {x2.shape[0]} points.")
+
+        return self.evaluate(x1, x2[[index]], dtype=dtype)[:, 0]
+
+    def evaluate_rows(
+        self,
+        x1: np.ndarray,
+        x2: np.ndarray,
+        rows: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        dtype: Optional[DTypeLike] = None,
+    ) -> np.ndarray:
+        """Rows k(x1[rows], x2) of the Gram matrix in O(len(rows) * n2 * d).
+
+        :param rows: Integer indices into x1.
+        :param out: Optional buffer of shape (len(rows), n2) the result is written to. It is returned.
+        :param dtype: Floating point type of the computation and the result, see evaluate.
+        """
+        self._check_inputs(x1, x2)
+
+        rows = np.asarray(rows)
+        if rows.ndim != 1:
+            raise ValueError(f"rows ({rows.shape}) must be a one-dimensional array of indices.")
+
+        return self.evaluate(x1[rows], x2, out=out, dtype=dtype)
+
+    def get_batch_param_dicts(self, lengthscales: np.ndarray, nu: Optional[np.ndarray] = None) -> List[dict]:
+        """Parameters per dimension for a batch of B kernels of the family of the kernel.
+
+        :param lengthscales: Lengthscales of shape (B, d).
+        :param nu: Optional smoothness parameters of shape (B,), only for the matern kernel.
+        :return: Dicts per dimension that map the parameter names to arrays of shape (B,).
+        """
+        lengthscales = np.asarray(lengthscales, dtype=np.float64)
+        if lengthscales.ndim != 2 or lengthscales.shape[1] != self.ndim:
+            raise ValueError(f"lengthscales ({lengthscales.shape}) must have shape (B, {self.ndim}).")
+
+        if np.any(lengthscales <= 0):
+            raise ValueError("lengthscales must be positive.")
+
+        batch_size = lengthscales.shape[0]
+        params = [{"ell": lengthscales[:, dim]} for dim in range(self.ndim)]
+
+        if nu is not None:
+            if self.name != "matern":
+                raise ValueError(f"nu can only be batched for the matern kernel, not for {self.name}.")
+
+            nu = np.asarray(nu, dtype=np.float64)
+            if nu.shape != (batch_size,):
+                raise ValueError(f"nu ({nu.shape}) must have shape ({batch_size},).")
+
+            if not np.all((nu > 0) & (nu + 0.5 == np.round(nu + 0.5))):
+                raise ValueError(f"only kernels for positive half-integer nu ({nu}) are implemented.")
+
+            for params_dim in params:
+                params_dim["nu"] = nu
+
+        return params
+
+    def evaluate_batch(
+        self,
+        x1: np.ndarray,
+        x2: np.ndarray,
+        lengthscales: np.ndarray,
+        nu: Optional[np.ndarray] = None,
+        dtype: DTypeLike = np.float64,
+    ) -> np.ndarray:
+        """Gram matrices of x1 with shape (n1, d) and x2 with shape (n2, d) for a batch of B parameters.
+
+        The differences of the points are computed once per dimension, and only the scaling and the kernel function
+        are evaluated per lengthscale vector. The parameters of the kernel itself are not used except for those not
+        batched, e.g., nu if nu is None.
+
+        :param lengthscales: Lengthscales of shape (B, d).
+        :param nu: Optional smoothness parameters of shape (B,), only for the matern kernel.
+        :param dtype: Floating point type of the computation and the result.
+        :return: The Gram matrices, of shape (B, n1, n2).
+        """
+        self._check_inputs(x1, x2)
+        params = self.get_batch_param_dicts(lengthscales, nu)
+        batch_size = params[0]["ell"].shape[0]
+
+        dtype = check_dtype(dtype)
+        out = np.empty([batch_size, x1.shape[0], x2.shape[0]], dtype=dtype)
+        self._evaluate_batch(x1.astype(dtype, copy=False), x2.astype(dtype, copy=False), params, out)
+        return out
+
+    def gram(
+        self, x: np.ndarray, packed: bool = False, tile_size: int = 256, dtype: DTypeLike = np.float64
+    ) -> np.ndarray:
+        """Symmetric Gram matrix of x with shape (n, d).
+
+        Only the upper triangle is evaluated, row tile by row tile, which roughly halves the number of kernel
+        evaluations compared to evaluate(x, x).
+
+        :param packed: If True, the upper triangle is returned row by row as an array of size n * (n + 1) / 2,
+            i.e., in the order of np.triu_indices(n). Otherwise, the triangle is mirrored into a full
+            (n, n) matrix.
+        :param tile_size: Number of rows evaluated at a time. The triangle is resolved at tile granularity, so
+            smaller tiles evaluate fewer redundant entries below the diagonal.
+        :param dtype: Floating point type of the computation and the result.
+        """
+        self._check_inputs(x, x)
+
+        if tile_size < 1:
+            raise ValueError(f"tile_size ({tile_size}) must be a positive integer.")
+
+        dtype = check_dtype(dtype)
+        x = x.astype(dtype, copy=False)
+        n = x.shape[0]
+
+        if not packed:
+            K = np.empty([n, n], dtype=dtype)
+            for start in range(0, n, tile_size):
+                stop = min(start + tile_size, n)
+                self.evaluate(x[start:stop], x[start:], out=K[start:stop, start:])
+                K[stop:, start:stop] = K[start:stop, stop:].T
+                # the diagonal block is mirrored from its upper triangle only
+                K_diag = K[start:stop, start:stop]
+                lower = np.tril_indices(stop - start, -1)
+                K_diag[lower] = K_diag.T[lower]
+            return K
+
+        K_packed = np.empty(n * (n + 1) // 2, dtype=dtype)
+        K_tile = np.empty([min(tile_size, n), n], dtype=dtype)
+        offset = 0
+        for start in range(0, n, tile_size):
+            stop = min(start + tile_size, n)
+            K_block = self.evaluate(x[start:stop], x[start:], out=K_tile[: stop - start, : n - start])
+            for i in range(stop - start):
+                row = K_block[i, i:]
+                K_packed[offset : offset + row.shape[0]] = row
+                offset += row.shape[0]
+        return K_packed
+
+    def evaluate_to_file(
+        self,
+        x1: np.ndarray,
+        x2: np.ndarray,
+        filename: str,
+        tile_size: int = 1024,
+        progress: Optional[Callable[[int, int], None]] = None,
+        dtype: DTypeLike = np.float64,
+    ) -> np.memmap:
+        """Gram matrix of x1 with shape (n1, d) and x2 with shape (n2, d) written row block by row block to a
+        memory-mapped .npy file.
+
+        The number of finished rows is recorded in a sidecar file "<filename>.progress" that is removed once the
+        matrix is complete. Calling the method again with the same inputs after an interruption resumes from the
+        first unfinished tile. An existing file without a progress record is overwritten.
+
+        :param filename: Path of the .npy file. It can be loaded with np.load(filename, mmap_mode="r").
+        :param tile_size: Number of rows evaluated and flushed to disk at a time.
+        :param progress: Optional callback called with (number of finished rows, n1) after each tile.
+        :param dtype: Floating point type of the computation and the stored matrix.
+        :return: The memory-mapped Gram matrix.
+        """
+        self._check_inputs(x1, x2)
+
+        if tile_size < 1:
+            raise ValueError(f"tile_size ({tile_size}) must be a positive integer.")
+
+        dtype = check_dtype(dtype)
+
+        shape = (x1.shape[0], x2.shape[0])
+        progress_filename = filename + ".progress"
+
+        rows_done = 0
+        if os.path.exists(filename) and os.path.exists(progress_filename):
+            with open(progress_filename) as f:
+                record = json.load(f)
+            if tuple(record["shape"]) != shape:
+                raise ValueError(f"{filename} holds a Gram matrix of shape {tuple(record['shape'])}, not {shape}.")
+            K = np.lib.format.open_memmap(filename, mode="r+")
+            if K.dtype != dtype:
+                raise ValueError(f"{filename} holds a Gram matrix of dtype {K.dtype}, not {dtype}.")
+            rows_done = record["rows_done"]
+        else:
+            K = np.lib.format.open_memmap(filename, mode="w+", dtype=dtype, shape=shape)
+
+        for start in range(rows_done, shape[0], tile_size):
+            stop = min(start + tile_size, shape[0])
+            self.evaluate(x1[start:stop], x2, out=K[start:stop])
+            K.flush()
+
+            # write-then-rename so that an interruption never leaves a corrupt record behind
+            with open(progress_filename + ".tmp", "w") as f:
+                json.dump({"rows_done": stop, "shape": shape}, f)
+            os.replace(progress_filename + ".tmp", progress_filename)
+
+            if progress is not None:
+                progress(stop, shape[0])
+
+        if os.path.exists(progress_filename):
+            os.remove(progress_filename)
+        return K
+
+    def _check_inputs(self, x1: np.ndarray, x2: np.ndarray) -> None:
         if (len(x1.shape) != 2) or (len(x2.shape) != 2):
             raise ValueError(f"x1 or x2 have wrong shape.")
 
-        n1, d1 = x1.shape
-        n2, d2 = x2.shape
+        d1 = x1.shape[1]
+        d2 = x2.shape[1]
 
         if d1 != d2:
             raise ValueError(f"x1 ({d1}) and x2 ({d2}) must have matching dimensionality.")
@@ -78,7 +462,118 @@ class ProductKernel(abc.ABC):
         if d1 != self.ndim:
             raise ValueError(f"x1 and x2 have wrong dimensionality ({d1}).")
 
-        K = np.ones([n1, n2])
+    def _check_stacked_inputs(self, x1: np.ndarray, x2: np.ndarray) -> None:
+        if (len(x1.shape) != 3) or (len(x2.shape) != 3):
+            raise ValueError(f"x1 ({x1.shape}) and x2 ({x2.shape}) must both have shape (B, n, d) for batched points.")
+
+        if x1.shape[0] != x2.shape[0]:
+            raise ValueError(f"x1 ({x1.shape[0]}) and x2 ({x2.shape[0]}) must have the same number of problems.")
+
+        if x1.shape[2] != x2.shape[2]:
+            raise ValueError(f"x1 ({x1.shape[2]}) and x2 ({x2.shape[2]}) must have matching dimensionality.")
+
+        if x1.shape[2] != self.ndim:
+            raise ValueError(f"x1 and x2 have wrong dimensionality ({x1.shape[2]}).")
+
+    def _prepare(self, x2: np.ndarray) -> Dict[str, np.ndarray]:
+        """Arrays that depend on x2 only, computed once per evaluate call and shared by all tiles.
+
+        x2 has shape (n2, d), or (B, n2, d) for batched points, in which case the arrays have B as leading axis and
+        are split with the problems. Override together with _evaluate and _evaluate_stacked.
+        """
+        return {}
+
+    def _work_size(self, shape: Tuple[int, ...], dtype: np.dtype) -> int:
+        """Number of elements of the scratch space of _evaluate and _evaluate_stacked for a tile of the given shape,
+        i.e., (n1, n2) or (B, n1, n2). Two tiles for the product over the dimensions.
+        """
+        return 2 * math.prod(shape)
+
+    def _evaluate(
+        self, x1: np.ndarray, x2: np.ndarray, out: np.ndarray, work: np.ndarray, prepared: Dict[str, np.ndarray]
+    ) -> None:
+        """Product over the univariate kernels, one dimension at a time, accumulated in out.
+
+        The first dimension is written to out directly; the others to a scratch tile that is multiplied into out.
+        Override if the product has a fused closed form. x1 and x2 have shape (n1, d) and (n2, d), out has
+        shape (n1, n2). work is the scratch space of at least _work_size elements, prepared the result of _prepare.
+        """
+        scratch = work[: 2 * out.size].reshape((2,) + out.shape)
         for dim, k in enumerate(self._kernels):
-            K *= k.evaluate(x1[:, dim], x2[:, dim])
-        return K
+            if dim == 0:
+                k._evaluate_into(x1[:, dim], x2[:, dim], out, scratch[1])
+            else:
+                k._evaluate_into(x1[:, dim], x2[:, dim], scratch[0], scratch[1])
+                np.multiply(out, scratch[0], out=out)
+
+    def _evaluate_stacked(
+        self, x1: np.ndarray, x2: np.ndarray, out: np.ndarray, work: np.ndarray, prepared: Dict[str, np.ndarray]
+    ) -> None:
+        """Products over the univariate kernels for B independent problems, accumulated in out.
+
+        Scratch space as in _evaluate. Override if the product has a fused closed form. x1 and x2 have shape
+        (B, n1, d) and (B, n2, d), out has shape (B, n1, n2).
+        """
+        scratch = work[: 2 * out.size].reshape((2,) + out.shape)
+        for dim, k in enumerate(self._kernels):
+            if dim == 0:
+                k._evaluate_stacked_into(x1[:, :, dim], x2[:, :, dim], out, scratch[1])
+            else:
+                k._evaluate_stacked_into(x1[:, :, dim], x2[:, :, dim], scratch[0], scratch[1])
+                np.multiply(out, scratch[0], out=out)
+
+    def _evaluate_batch(self, x1: np.ndarray, x2: np.ndarray, params: List[dict], out: np.ndarray) -> None:
+        """Products over the univariate kernels for a batch of parameters, accumulated in out.
+
+        params[dim] maps parameter names of the univariate kernel of dimension dim to arrays of shape (B,). These
+        broadcast against the distances, hence one kernel evaluation per dimension for all B. Override if the product
+        has a fused closed form. out has shape (B, n1, n2).
+        """
+        out.fill(1.0)
+        for dim, k in enumerate(self._kernels):
+            dist = np.abs(x1[:, dim, None] - x2[None, :, dim])
+            params_dim = {name: value.astype(out.dtype)[:, None, None] for name, value in params[dim].items()}
+            out *= k._evaluate_dist(dist, {**k.param_dict, **params_dim})
+
+
+# arrays of evaluate that are not the result of _prepare
+_TILE_ARRAYS = ("x1", "x2", "out", "work")
+
+
+def _result_dtype(x1: np.ndarray, x2: np.ndarray) -> np.dtype:
+    """Floating point type of kernel values of x1 and x2; float32 inputs stay float32, others become float64."""
+    return np.result_type(x1.dtype, x2.dtype, np.float32)
+
+
+def _evaluate_tile(
+    kernel: ProductKernel,
+    arrays: Dict[str, np.ndarray],
+    start: int,
+    stop: int,
+    work_pool: Optional[queue.SimpleQueue] = None,
+) -> None:
+    """Rows start to stop of the Gram matrix, or problems start to stop if the points are batched; module level so
+    that process workers can unpickle it.
+
+    The scratch space is borrowed from work_pool. Process workers have no pool and keep one buffer in their own
+    copy of arrays, grown if a tile needs more.
+    """
+    out = arrays["out"][start:stop]
+    if work_pool is None:
+        work_size = kernel._work_size(out.shape, out.dtype)
+        if "work" not in arrays or arrays["work"].shape[0] < work_size:
+            arrays["work"] = np.empty(work_size, dtype=out.dtype)
+        work = arrays["work"]
+    else:
+        work = work_pool.get()
+
+    try:
+        prepared = {key: value for key, value in arrays.items() if key not in _TILE_ARRAYS}
+        if arrays["x1"].ndim == 3:
+            prepared = {key: value[start:stop] for key, value in prepared.items()}
+            kernel._evaluate_stacked(arrays["x1"][start:stop], arrays["x2"][start:stop], out, work, prepared)
+        else:
+            kernel._evaluate(arrays["x1"][start:stop], arrays["x2"], out, work, prepared)
+    finally:
+        if work_pool is not None:
+            work_pool.put(work)
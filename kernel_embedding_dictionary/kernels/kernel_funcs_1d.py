@@ -2,67 +2,179 @@
 # SPDX-License-Identifier: MIT
 
 
+import math
+from functools import lru_cache
+from typing import Union
+
 import numpy as np
-from scipy.special import factorial
+from scipy.special import gammaln
 
-from kernel_embedding_dictionary.utils import scaled_diff
+from kernel_embedding_dictionary.backend import get_namespace
+from kernel_embedding_dictionary.utils import horner, scaled_diff
 
 
-def expquad_kernel_func_1d(x1: float, x2: float, ell: float) -> float:
-    diff = 0.5 * scaled_diff(x1, x2, ell, np.sqrt(2))
-    kernel_value = np.exp(-(diff**2))
+def expquad_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float
+) -> Union[np.ndarray, float]:
+    xp = get_namespace(x1, x2)
+    diff = scaled_diff(x1, x2, ell, math.sqrt(2))
+    kernel_value = xp.exp(-(diff**2))
     return kernel_value
 
 
-def matern_kernel_func_1d(x1: float, x2: float, ell: float, nu: float) -> float:
-    n = int(nu)
-    ks = np.arange(n + 1)
-    coefs = factorial(n) / factorial(2 * n) * np.power(2, ks) * factorial(n + ks) / factorial(ks) / factorial(n - ks)
-    abs_diff = np.sqrt(2 * nu) * abs(scaled_diff(x1, x2, ell, 1))
-    abs_diff_powers = np.power(abs_diff, n - ks)
-    kernel_value = np.exp(-abs_diff) * np.sum(coefs * abs_diff_powers)
+def matern_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float, nu: float
+) -> Union[np.ndarray, float]:
+    xp = get_namespace(x1, x2)
+    abs_diff = math.sqrt(2 * nu) * abs(scaled_diff(x1, x2, ell, 1))
+    kernel_value = xp.exp(-abs_diff) * horner(matern_poly_coefs(int(nu)), abs_diff)
     return kernel_value
 
 
-def matern12_kernel_func_1d(x1: float, x2: float, ell: float, nu: float) -> float:
+@lru_cache(maxsize=None)
+def matern_poly_coefs(n: int) -> np.ndarray:
+    """Coefficients of the polynomial in r of the Matern kernel with nu = n + 1/2, lowest power first.
+
+    The coefficient of r^(n - k) is n! / (2n)! 2^(n - k) (n + k)! / (k! (n - k)!), computed in log space so that
+    large n does not overflow. The array is cached per n and read-only.
+    """
+    ks = np.arange(n + 1)
+    log_coefs = (
+        gammaln(n + 1)
+        - gammaln(2 * n + 1)
+        + (n - ks) * np.log(2)
+        + gammaln(n + ks + 1)
+        - gammaln(ks + 1)
+        - gammaln(n - ks + 1)
+    )
+    coefs = np.exp(log_coefs)[::-1].copy()
+    coefs.setflags(write=False)
+    return coefs
+
+
+def matern12_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float, nu: float
+) -> Union[np.ndarray, float]:
     # nu is hardcoded in the formula (nu=0.5); accepted to match matern_kernel_func_1d's signature.
+    xp = get_namespace(x1, x2)
     diff = scaled_diff(x1, x2, ell, 1)
-    kernel_value = np.exp(-abs(diff))
+    kernel_value = xp.exp(-abs(diff))
     return kernel_value
 
 
-def matern32_kernel_func_1d(x1: float, x2: float, ell: float, nu: float) -> float:
+def matern32_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float, nu: float
+) -> Union[np.ndarray, float]:
     # nu is hardcoded in the formula (nu=1.5); accepted to match matern_kernel_func_1d's signature.
-    abs_diff = np.sqrt(3) * abs(scaled_diff(x1, x2, ell, 1))
-    kernel_value = (1 + abs_diff) * np.exp(-abs_diff)
+    xp = get_namespace(x1, x2)
+    abs_diff = math.sqrt(3) * abs(scaled_diff(x1, x2, ell, 1))
+    kernel_value = (1 + abs_diff) * xp.exp(-abs_diff)
     return kernel_value
 
 
-def matern52_kernel_func_1d(x1: float, x2: float, ell: float, nu: float) -> float:
+def matern52_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float, nu: float
+) -> Union[np.ndarray, float]:
     # nu is hardcoded in the formula (nu=2.5); accepted to match matern_kernel_func_1d's signature.
-    abs_diff = np.sqrt(5) * abs(scaled_diff(x1, x2, ell, 1))
-    kernel_value = (1 + abs_diff + abs_diff**2 / 3) * np.exp(-abs_diff)
+    xp = get_namespace(x1, x2)
+    abs_diff = math.sqrt(5) * abs(scaled_diff(x1, x2, ell, 1))
+    kernel_value = (1 + abs_diff + abs_diff**2 / 3) * xp.exp(-abs_diff)
     return kernel_value
 
 
-def matern72_kernel_func_1d(x1: float, x2: float, ell: float, nu: float) -> float:
+def matern72_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float, nu: float
+) -> Union[np.ndarray, float]:
     # nu is hardcoded in the formula (nu=3.5); accepted to match matern_kernel_func_1d's signature.
-    abs_diff = np.sqrt(7) * abs(scaled_diff(x1, x2, ell, 1))
-    kernel_value = (1 + abs_diff + 2 * abs_diff**2 / 5 + abs_diff**3 / 15) * np.exp(-abs_diff)
+    xp = get_namespace(x1, x2)
+    abs_diff = math.sqrt(7) * abs(scaled_diff(x1, x2, ell, 1))
+    kernel_value = (1 + abs_diff + 2 * abs_diff**2 / 5 + abs_diff**3 / 15) * xp.exp(-abs_diff)
     return kernel_value
 
 
-def wendland0_kernel_func_1d(x1: float, x2: float, ell: float, order: int) -> float:
+def wendland0_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float, order: int
+) -> Union[np.ndarray, float]:
     # order is hardcoded in the formula (order=0); accepted to keep the Wendland family signature uniform.
+    xp = get_namespace(x1, x2)
     abs_diff = abs(scaled_diff(x1, x2, ell, 1))
-    # scalar max; these funcs are called with float inputs only
-    kernel_value = max(0, (1 - abs_diff))
+    kernel_value = xp.clip(1 - abs_diff, min=0.0)
     return kernel_value
 
 
-def wendland2_kernel_func_1d(x1: float, x2: float, ell: float, order: int) -> float:
+def wendland2_kernel_func_1d(
+    x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], ell: float, order: int
+) -> Union[np.ndarray, float]:
     # order is hardcoded in the formula (order=2); accepted to keep the Wendland family signature uniform.
+    xp = get_namespace(x1, x2)
     abs_diff = abs(scaled_diff(x1, x2, ell, 1))
-    # scalar max; these funcs are called with float inputs only
-    kernel_value = max(0, (1 - abs_diff)) ** 3 * (1 + 3 * abs_diff)
+    kernel_value = xp.clip(1 - abs_diff, min=0.0) ** 3 * (1 + 3 * abs_diff)
     return kernel_value
+
+
+# In-place NumPy versions of the kernel functions for tiled Gram evaluation. The kernel values of the broadcast x1 and
+# x2 are written to out, using work, an array of the same shape, as the only scratch space, so that nothing is
+# allocated per tile and dimension.
+def expquad_kernel_func_1d_into(
+    x1: np.ndarray, x2: np.ndarray, ell: float, out: np.ndarray, work: np.ndarray
+) -> np.ndarray:
+    np.subtract(x1, x2, out=out)
+    out /= ell
+    np.square(out, out=out)
+    out *= -0.5
+    return np.exp(out, out=out)
+
+
+def matern_kernel_func_1d_into(
+    x1: np.ndarray, x2: np.ndarray, ell: float, nu: float, out: np.ndarray, work: np.ndarray
+) -> np.ndarray:
+    # the scaled distance in out, the polynomial in it by the Horner scheme in work
+    np.subtract(x1, x2, out=out)
+    np.abs(out, out=out)
+    out *= math.sqrt(2 * nu) / ell
+    coefs = matern_poly_coefs(int(nu))
+    work.fill(coefs[-1])
+    for coef in coefs[-2::-1]:
+        work *= out
+        work += float(coef)
+    np.negative(out, out=out)
+    np.exp(out, out=out)
+    return np.multiply(out, work, out=out)
+
+
+def wendland0_kernel_func_1d_into(
+    x1: np.ndarray, x2: np.ndarray, ell: float, order: int, out: np.ndarray, work: np.ndarray
+) -> np.ndarray:
+    np.subtract(x1, x2, out=out)
+    np.abs(out, out=out)
+    out /= ell
+    np.subtract(1.0, out, out=out)
+    return np.maximum(out, 0.0, out=out)
+
+
+def wendland2_kernel_func_1d_into(
+    x1: np.ndarray, x2: np.ndarray, ell: float, order: int, out: np.ndarray, work: np.ndarray
+) -> np.ndarray:
+    # the scaled distance in out, the polynomial factor 1 + 3 r in work
+    np.subtract(x1, x2, out=out)
+    np.abs(out, out=out)
+    out /= ell
+    np.multiply(out, 3.0, out=work)
+    work += 1.0
+    np.subtract(1.0, out, out=out)
+    np.maximum(out, 0.0, out=out)
+    np.power(out, 3, out=out)
+    return np.multiply(out, work, out=out)
+
+
+# the Matern kernels with fixed nu share the in-place version of the matern kernel
+KERNEL_FUNCS_INTO = {
+    expquad_kernel_func_1d: expquad_kernel_func_1d_into,
+    matern_kernel_func_1d: matern_kernel_func_1d_into,
+    matern12_kernel_func_1d: matern_kernel_func_1d_into,
+    matern32_kernel_func_1d: matern_kernel_func_1d_into,
+    matern52_kernel_func_1d: matern_kernel_func_1d_into,
+    matern72_kernel_func_1d: matern_kernel_func_1d_into,
+    wendland0_kernel_func_1d: wendland0_kernel_func_1d_into,
+    wendland2_kernel_func_1d: wendland2_kernel_func_1d_into,
+}
@@ -0,0 +1,136 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import math
+from typing import Callable
+
+import numpy as np
+
+from .kernel_funcs_1d import (
+    expquad_kernel_func_1d,
+    matern12_kernel_func_1d,
+    matern32_kernel_func_1d,
+    matern52_kernel_func_1d,
+    matern72_kernel_func_1d,
+    matern_kernel_func_1d,
+    matern_poly_coefs,
+    wendland0_kernel_func_1d,
+    wendland2_kernel_func_1d,
+)
+
+# Numba-compiled Gram matrices of the kernel functions in kernel_funcs_1d. The pairwise loops run as fused, parallel
+# machine code without NumPy temporaries, and are compiled on first use and cached on disk, i.e., once per
+# environment. Numba is optional; without it, the functions fall back to the NumPy kernel functions.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+if NUMBA_AVAILABLE:
+    njit = numba.njit(cache=True)
+    njit_parallel = numba.njit(cache=True, parallel=True)
+    prange = numba.prange
+else:
+    # plain Python, only used to test the loops without Numba
+    def njit(func: Callable) -> Callable:
+        return func
+
+    njit_parallel = njit
+    prange = range
+
+# kernels as functions of the scaled distance r = |x1 - x2| / ell
+_EXPQUAD = 0
+_MATERN = 1
+_WENDLAND0 = 2
+_WENDLAND2 = 3
+
+
+@njit
+def _stationary_kernel(kind: int, r: float, matern_scale: float, matern_coefs: np.ndarray) -> float:
+    if kind == _EXPQUAD:
+        return math.exp(-0.5 * r * r)
+    if kind == _MATERN:
+        a = matern_scale * r
+        poly = matern_coefs[-1]
+        for m in range(matern_coefs.shape[0] - 2, -1, -1):
+            poly = poly * a + matern_coefs[m]
+        return math.exp(-a) * poly
+    t = max(0.0, 1.0 - r)
+    if kind == _WENDLAND0:
+        return t
+    return t**3 * (1.0 + 3.0 * r)
+
+
+@njit_parallel
+def _gram_loop(
+    x1: np.ndarray,
+    x2: np.ndarray,
+    ell: float,
+    kind: int,
+    matern_scale: float,
+    matern_coefs: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    for i in prange(x1.shape[0]):
+        for j in range(x2.shape[0]):
+            out[i, j] = _stationary_kernel(kind, abs(x1[i] - x2[j]) / ell, matern_scale, matern_coefs)
+
+
+@njit_parallel
+def _paired_loop(
+    x1: np.ndarray,
+    x2: np.ndarray,
+    ell: float,
+    kind: int,
+    matern_scale: float,
+    matern_coefs: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    for i in prange(x1.shape[0]):
+        out[i] = _stationary_kernel(kind, abs(x1[i] - x2[i]) / ell, matern_scale, matern_coefs)
+
+
+def _loop_args(kernel_func: Callable, params: dict) -> tuple:
+    """Arguments (ell, kind, matern_scale, matern_coefs) of the loops for a kernel function of kernel_funcs_1d."""
+    if kernel_func is expquad_kernel_func_1d:
+        return params["ell"], _EXPQUAD, 0.0, np.ones(1)
+
+    matern_nus = {
+        matern_kernel_func_1d: None,
+        matern12_kernel_func_1d: 0.5,
+        matern32_kernel_func_1d: 1.5,
+        matern52_kernel_func_1d: 2.5,
+        matern72_kernel_func_1d: 3.5,
+    }
+    if kernel_func in matern_nus:
+        nu = params["nu"] if matern_nus[kernel_func] is None else matern_nus[kernel_func]
+        return params["ell"], _MATERN, math.sqrt(2 * nu), np.asarray(matern_poly_coefs(int(nu)))
+
+    kinds = {wendland0_kernel_func_1d: _WENDLAND0, wendland2_kernel_func_1d: _WENDLAND2}
+    if kernel_func in kinds:
+        return params["ell"], kinds[kernel_func], 0.0, np.ones(1)
+
+    raise ValueError(f"No compiled version of kernel function {kernel_func.__name__}.")
+
+
+def kernel_gram_1d(kernel_func: Callable, x1: np.ndarray, x2: np.ndarray, **params) -> np.ndarray:
+    """Gram matrix kernel_func(x1[i], x2[j], **params) of shape (n1, n2). x1 and x2 have shape (n1,) and (n2,)."""
+    if not NUMBA_AVAILABLE:
+        return kernel_func(x1[:, None], x2[None, :], **params)
+
+    out = np.empty([x1.shape[0], x2.shape[0]], dtype=np.result_type(x1, x2, np.float32))
+    _gram_loop(x1, x2, *_loop_args(kernel_func, params), out)
+    return out
+
+
+def kernel_paired_1d(kernel_func: Callable, x1: np.ndarray, x2: np.ndarray, **params) -> np.ndarray:
+    """Kernel values kernel_func(x1[i], x2[i], **params) of aligned pairs. x1 and x2 have shape (n,)."""
+    if not NUMBA_AVAILABLE:
+        return kernel_func(x1, x2, **params)
+
+    out = np.empty(x1.shape[0], dtype=np.result_type(x1, x2, np.float32))
+    _paired_loop(x1, x2, *_loop_args(kernel_func, params), out)
+    return out
@@ -4,6 +4,8 @@
 
 from typing import List, Optional
 
+import numpy as np
+
 from .kernel import ProductKernel, UnivariateKernel
 from .kernel_funcs_1d import matern_kernel_func_1d
 
@@ -29,6 +31,21 @@ class MaternKernelUni(UnivariateKernel):
     def _evaluate_pair(self, x1: float, x2: float) -> float:
         return self._kernel_func(x1, x2, **self.param_dict)
 
+    def _evaluate_dist(self, dist: np.ndarray, params: dict) -> np.ndarray:
+        """As in the base class. The polynomial of the kernel depends on nu, hence one evaluation per distinct nu
+        if nu is batched.
+        """
+        nu = params["nu"]
+        if np.ndim(nu) == 0:
+            return super()._evaluate_dist(dist, params)
+
+        ell = np.broadcast_to(params["ell"], nu.shape)
+        values = np.empty(nu.shape[:1] + dist.shape, dtype=np.result_type(dist, ell))
+        for nu_value in np.unique(nu):
+            batch = nu[:, 0, 0] == nu_value
+            values[batch] = self._kernel_func(dist, 0.0, ell=ell[batch], nu=float(nu_value))
+        return values
+
 
 class MaternKernel(ProductKernel):
     def __init__(self, config: Optional[dict] = None):
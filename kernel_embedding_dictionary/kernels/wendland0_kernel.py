@@ -5,7 +5,9 @@
 from typing import List, Optional
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
+from .compact_support import evaluate_sparse_compact
 from .kernel import ProductKernel, UnivariateKernel
 from .kernel_funcs_1d import wendland0_kernel_func_1d
 
@@ -61,6 +63,14 @@ class Wendland0Kernel(ProductKernel):
     def order(self) -> float:
         return 0
 
+    def evaluate_sparse(self, x1: np.ndarray, x2: np.ndarray) -> csr_matrix:
+        """Gram matrix of x1 with shape (n1, d) and x2 with shape (n2, d) in sparse CSR format.
+
+        Only pairs within the support of the kernel are evaluated, so memory and cost scale with the number of
+        non-zeros.
+        """
+        return evaluate_sparse_compact(self, x1, x2)
+
     def __str__(self) -> str:
         return f"Wendland0 kernel \n" f"dimensionality: {self.ndim} \n" f"lengthscales: {list(self.ell)}"
 
@@ -0,0 +1,21 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from .banded import BandedGram, banded_quadrature_weights
+from .fast_gauss_transform import fast_gauss_transform
+from .nystrom import NystromApproximation
+from .operator import KernelLinearOperator
+from .pivoted_cholesky import PivotedCholesky
+from .state_space import StateSpaceGram, state_space_quadrature_weights
+
+__all__ = [
+    "BandedGram",
+    "banded_quadrature_weights",
+    "KernelLinearOperator",
+    "fast_gauss_transform",
+    "NystromApproximation",
+    "PivotedCholesky",
+    "StateSpaceGram",
+    "state_space_quadrature_weights",
+]
@@ -0,0 +1,118 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from typing import Optional
+
+import numpy as np
+from scipy.linalg import cho_solve_banded, cholesky_banded
+
+from ..embeddings import KernelEmbedding
+from ..kernels import UnivariateKernel, Wendland0KernelUni, Wendland2KernelUni
+
+
+class BandedGram:
+    def __init__(self, kernel: UnivariateKernel, x: np.ndarray):
+        """Gram matrix of a 1-D Wendland kernel in banded storage.
+
+        On sorted points, k(x_i, x_j) vanishes once x_j - x_i >= ell, so the Gram matrix is banded with a
+        bandwidth set by ell and the point density. Storage and matvecs cost O(n b), the Cholesky factorization
+        O(n b^2). All inputs and outputs are in the order of x; sorting is handled internally.
+
+        :param kernel: Univariate Wendland kernel.
+        :param x: Points of shape (n, ).
+        """
+        if not isinstance(kernel, (Wendland0KernelUni, Wendland2KernelUni)):
+            raise ValueError(f"Banded Gram matrices are only available for univariate Wendland kernels.")
+
+        if len(x.shape) != 1:
+            raise ValueError(f"x ({x.shape}) must be a one-dimensional array.")
+
+        self._kernel = kernel
+        self._order = np.argsort(x, kind="stable")
+        x_sorted = x[self._order]
+        n = x_sorted.shape[0]
+
+        # number of points to the right of x_i that lie within the support
+        support_end = np.searchsorted(x_sorted, x_sorted + kernel.ell, side="left")
+        bandwidth = int(np.max(support_end - np.arange(n) - 1, initial=0))
+
+        # upper banded storage as used by scipy.linalg: ab[bandwidth + i - j, j] = K[i, j] for i <= j
+        ab = np.zeros([bandwidth + 1, n])
+        for offset in range(bandwidth + 1):
+            ab[bandwidth - offset, offset:] = kernel.evaluate_paired(x_sorted[: n - offset], x_sorted[offset:])
+
+        self._ab = ab
+        self._cholesky_factor: Optional[np.ndarray] = None
+
+    @property
+    def n(self) -> int:
+        return self._ab.shape[1]
+
+    @property
+    def bandwidth(self) -> int:
+        return self._ab.shape[0] - 1
+
+    @property
+    def banded(self) -> np.ndarray:
+        """Upper banded storage of shape (bandwidth + 1, n) of the Gram matrix of the sorted points."""
+        return self._ab
+
+    @property
+    def order(self) -> np.ndarray:
+        """Permutation that sorts x."""
+        return self._order
+
+    def _cholesky(self) -> np.ndarray:
+        if self._cholesky_factor is None:
+            self._cholesky_factor = cholesky_banded(self._ab, lower=False)
+        return self._cholesky_factor
+
+    def matvec(self, v: np.ndarray) -> np.ndarray:
+        """Product K v in O(n b). v has shape (n, ) or (n, m)."""
+        v_sorted = v[self._order]
+        b = self.bandwidth
+
+        res = self._band(0, v.ndim) * v_sorted
+        for offset in range(1, b + 1):
+            band = self._band(offset, v.ndim)
+            res[:-offset] += band * v_sorted[offset:]
+            res[offset:] += band * v_sorted[:-offset]
+        return self._unsort(res)
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """Solution of K a = rhs via banded Cholesky in O(n b^2). rhs has shape (n, ) or (n, m)."""
+        a_sorted = cho_solve_banded((self._cholesky(), False), rhs[self._order])
+        return self._unsort(a_sorted)
+
+    def logdet(self) -> float:
+        """Log-determinant of K."""
+        return 2.0 * np.sum(np.log(self._cholesky()[-1]))
+
+    def to_dense(self) -> np.ndarray:
+        """Dense Gram matrix in the order of x. Use for small n only."""
+        return self.matvec(np.eye(self.n))
+
+    def _band(self, offset: int, ndim: int) -> np.ndarray:
+        """Entries K[i, i + offset] of the sorted Gram matrix, shaped to broadcast against v of dimension ndim."""
+        band = self._ab[self.bandwidth - offset, offset:]
+        return band.reshape((-1,) + (1,) * (ndim - 1))
+
+    def _unsort(self, v_sorted: np.ndarray) -> np.ndarray:
+        v = np.empty_like(v_sorted)
+        v[self._order] = v_sorted
+        return v
+
+
+def banded_quadrature_weights(embedding: KernelEmbedding, x: np.ndarray) -> np.ndarray:
+    """Bayesian quadrature weights K^{-1} z of a 1-D Wendland kernel embedding in O(n b^2).
+
+    :param embedding: One-dimensional kernel embedding of a Wendland kernel.
+    :param x: Nodes of shape (n, ).
+    :return: The weights of shape (n, ) such that the integral of f is approximated by weights @ f(x).
+    """
+    if embedding.ndim != 1:
+        raise ValueError(f"Banded quadrature weights require a one-dimensional embedding ({embedding.ndim}).")
+
+    gram = BandedGram(embedding.kernel.get_kernel_from_dim(0), x)
+    return gram.solve(embedding.mean(x[:, None]))
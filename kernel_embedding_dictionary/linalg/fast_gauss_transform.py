@@ -0,0 +1,154 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+from scipy.special import gammaln
+
+from ..kernels import ExpQuadKernel
+
+
+def fast_gauss_transform(
+    kernel: ExpQuadKernel,
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray,
+    tol: float = 1e-6,
+    cluster_radius: Optional[float] = None,
+) -> np.ndarray:
+    """Approximate kernel sums sum_j weights[j] k(x[i], y[j]) with the improved fast Gauss transform.
+
+    The sources y are clustered with farthest-point clustering, and the kernel is expanded in a multivariate
+    Taylor series around the cluster centers. Targets only interact with clusters within a cutoff radius. The
+    truncation order and the cutoff are chosen with the error bound of Raykar et al. (2005) such that
+
+        |result[i] - sum_j weights[j] k(x[i], y[j])| <= tol * sum_j |weights[j]|.
+
+    Lengthscales are handled by rescaling each dimension, after which the cost is O(n + m) for fixed
+    dimensionality, tolerance and cluster radius, instead of O(n m).
+
+    :param kernel: Exponentiated quadratic kernel.
+    :param x: Targets of shape (m, d).
+    :param y: Sources of shape (n, d).
+    :param weights: Source weights of shape (n, ).
+    :param tol: Error tolerance relative to sum_j |weights[j]|, in (0, 1).
+    :param cluster_radius: Optional maximal cluster radius in units of the lengthscales. Smaller radii give lower
+        truncation orders but more clusters. Defaults to 1 / sqrt(2).
+    :return: The approximate sums of shape (m, ).
+    """
+    if not isinstance(kernel, ExpQuadKernel):
+        raise ValueError("The fast Gauss transform is only available for the exponentiated quadratic kernel.")
+
+    kernel._check_inputs(x, y)
+
+    if weights.shape != (y.shape[0],):
+        raise ValueError(f"weights ({weights.shape}) must have shape ({y.shape[0]},).")
+
+    if not 0 < tol < 1:
+        raise ValueError(f"tol ({tol}) must lie in (0, 1).")
+
+    # in scaled coordinates the kernel reads exp(-||x - y||^2 / h^2)
+    h = np.sqrt(2)
+    ell = np.array(kernel.ell)
+    targets = x / ell
+    sources = y / ell
+
+    if cluster_radius is None:
+        cluster_radius = 0.5 * h
+
+    centers, labels, radius = _farthest_point_clustering(sources, cluster_radius)
+    cutoff = radius + h * np.sqrt(np.log(1 / tol))
+    order = _truncation_order(radius, cutoff, h, tol)
+    parents, dims, alphas = _multi_indices(x.shape[1], order)
+    constants = np.exp(np.sum(alphas, axis=1) * np.log(2) - np.sum(gammaln(alphas + 1), axis=1))
+
+    # Taylor coefficients of all clusters at once: (num_clusters, num_monomials)
+    diff = (sources - centers[labels]) / h
+    source_terms = _monomials(diff, parents, dims) * (weights * np.exp(-np.sum(diff**2, axis=1)))[:, None]
+    membership = csr_matrix((np.ones(labels.shape[0]), (labels, np.arange(labels.shape[0]))))
+    coefs = (membership @ source_terms) * constants
+
+    res = np.zeros(x.shape[0])
+    target_tree = cKDTree(targets)
+    for k, near in enumerate(target_tree.query_ball_point(centers, cutoff)):
+        if not near:
+            continue
+        diff = (targets[near] - centers[k]) / h
+        res[near] += np.exp(-np.sum(diff**2, axis=1)) * (_monomials(diff, parents, dims) @ coefs[k])
+    return res
+
+
+def _farthest_point_clustering(points: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Greedy farthest-point (Gonzalez) clustering until every point is within radius of its center.
+
+    :return: Centers, labels of the points and the actual maximal cluster radius.
+    """
+    center_indices = [0]
+    labels = np.zeros(points.shape[0], dtype=int)
+    dist = np.linalg.norm(points - points[0], axis=1)
+    while True:
+        farthest = int(np.argmax(dist))
+        if dist[farthest] <= radius:
+            break
+        center_indices.append(farthest)
+        dist_new = np.linalg.norm(points - points[farthest], axis=1)
+        closer = dist_new < dist
+        labels[closer] = len(center_indices) - 1
+        dist[closer] = dist_new[closer]
+    return points[center_indices], labels, float(dist.max())
+
+
+def _truncation_order(radius: float, cutoff: float, h: float, tol: float, max_order: int = 500) -> int:
+    """Smallest order p whose truncation error bound per unit weight is below tol.
+
+    The bound is (2^p / p!) (r_x r_y / h^2)^p exp(-(r_y - r_x)^2 / h^2) for source and target distances r_x and
+    r_y to the center, maximized over r_y up to the cutoff.
+    """
+    if radius == 0:
+        return 1
+
+    for p in range(1, max_order + 1):
+        r_y = min(cutoff, 0.5 * (radius + np.sqrt(radius**2 + 2 * p * h**2)))
+        log_bound = p * np.log(2 * radius * r_y / h**2) - gammaln(p + 1) - (r_y - radius) ** 2 / h**2
+        if log_bound <= np.log(tol):
+            return p
+    raise ValueError(f"No truncation order up to {max_order} reaches tol ({tol}). Reduce the cluster radius.")
+
+
+def _multi_indices(ndim: int, order: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Multi-indices of total degree < order in graded order.
+
+    Each multi-index except the first (all zeros) is its parent plus a unit vector in dimension dims[i], so the
+    monomials can be computed with one multiplication each.
+    """
+    alphas: List[np.ndarray] = [np.zeros(ndim, dtype=int)]
+    parents = [-1]
+    dims = [-1]
+    last_dims = [0]
+    level = [0]
+    for _ in range(1, order):
+        next_level = []
+        for i in level:
+            for dim in range(last_dims[i], ndim):
+                alpha = alphas[i].copy()
+                alpha[dim] += 1
+                next_level.append(len(alphas))
+                alphas.append(alpha)
+                parents.append(i)
+                dims.append(dim)
+                last_dims.append(dim)
+        level = next_level
+    return np.array(parents), np.array(dims), np.array(alphas)
+
+
+def _monomials(diff: np.ndarray, parents: np.ndarray, dims: np.ndarray) -> np.ndarray:
+    """Monomials diff^alpha of shape (n, num_monomials) for the multi-indices given by parents and dims."""
+    res = np.empty([diff.shape[0], parents.shape[0]])
+    res[:, 0] = 1.0
+    for i in range(1, parents.shape[0]):
+        res[:, i] = res[:, parents[i]] * diff[:, dims[i]]
+    return res
@@ -0,0 +1,113 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from typing import Optional
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+from ..embeddings import KernelEmbedding
+
+
+class NystromApproximation:
+    def __init__(
+        self,
+        embedding: KernelEmbedding,
+        num_landmarks: Optional[int] = None,
+        landmarks: Optional[np.ndarray] = None,
+        rtol: float = 1e-10,
+    ):
+        """Nystrom approximation k(x, y) ~ k(x, Z) k(Z, Z)^+ k(Z, y) of a kernel embedding with landmarks Z.
+
+        The approximation is stored as a factor F(x) = k(x, Z) U L^{-1/2} of rank r <= m, where U L U^T is the
+        eigendecomposition of k(Z, Z) truncated at rtol times its largest eigenvalue. The kernel mean of the
+        approximate kernel is F(x) c with c = L^{-1/2} U^T mean(Z), using the closed-form mean at the landmarks.
+        Quadrature weights, the integral variance and the MMD then cost O(n r^2) for n nodes.
+
+        :param embedding: Kernel embedding.
+        :param num_landmarks: Number of landmarks m sampled from the measure of the embedding.
+        :param landmarks: Landmarks of shape (m, d). Either this or num_landmarks must be given.
+        :param rtol: Relative threshold below which eigenvalues of k(Z, Z) are discarded.
+        """
+        if (num_landmarks is None) == (landmarks is None):
+            raise ValueError("Exactly one of num_landmarks and landmarks must be given.")
+
+        if landmarks is None:
+            if num_landmarks < 1:
+                raise ValueError(f"num_landmarks ({num_landmarks}) must be positive.")
+            landmarks = embedding.measure.sample(num_landmarks)
+
+        self._embedding = embedding
+        self._landmarks = landmarks
+
+        eigvals, eigvecs = np.linalg.eigh(embedding.kernel.evaluate(landmarks, landmarks))
+        keep = eigvals > rtol * eigvals[-1]
+        self._projection = eigvecs[:, keep] / np.sqrt(eigvals[keep])
+        self._mean_coefs = self._projection.T @ embedding.mean(landmarks)
+
+    @property
+    def embedding(self) -> KernelEmbedding:
+        return self._embedding
+
+    @property
+    def landmarks(self) -> np.ndarray:
+        return self._landmarks
+
+    @property
+    def rank(self) -> int:
+        return self._projection.shape[1]
+
+    @property
+    def mean_coefs(self) -> np.ndarray:
+        """Coefficients c of shape (r, ) of the low-rank kernel mean F(x) c."""
+        return self._mean_coefs
+
+    def factor(self, x: np.ndarray) -> np.ndarray:
+        """Factor F(x) of shape (n, r) at x with shape (n, d) such that k(x, x) ~ F(x) F(x)^T."""
+        return self._embedding.kernel.evaluate(x, self._landmarks) @ self._projection
+
+    def mean(self, x: np.ndarray) -> np.ndarray:
+        """Kernel mean of the approximate kernel at x with shape (n, d)."""
+        return self.factor(x) @ self._mean_coefs
+
+    def quadrature_weights(self, x: np.ndarray, nugget: float = 1e-10) -> np.ndarray:
+        """Kernel quadrature weights at the nodes x with shape (n, d) for the approximate kernel.
+
+        The weights solve (F F^T + nugget I) w = F c via the Woodbury identity in O(n r^2).
+
+        :param nugget: Positive regularizer added to the diagonal of the approximate Gram matrix.
+        :return: The weights of shape (n, ).
+        """
+        factor = self.factor(x)
+        return factor @ self._solve_inner(factor, nugget)
+
+    def integral_variance(self, x: np.ndarray, nugget: float = 1e-10) -> float:
+        """Posterior variance of the integral given the nodes x with shape (n, d) for the approximate kernel.
+
+        :param nugget: Positive regularizer added to the diagonal of the approximate Gram matrix.
+        """
+        # c^T c - c^T F^T (F F^T + s I)^{-1} F c = s c^T (F^T F + s I)^{-1} c
+        return float(nugget * self._mean_coefs @ self._solve_inner(self.factor(x), nugget))
+
+    def mmd(self, x: np.ndarray, weights: Optional[np.ndarray] = None) -> float:
+        """Maximum mean discrepancy between the weighted points x with shape (n, d) and the measure for the
+        approximate kernel.
+
+        :param weights: Weights of shape (n, ). Defaults to uniform weights 1 / n.
+        """
+        factor = self.factor(x)
+        if weights is None:
+            weights = np.full(x.shape[0], 1 / x.shape[0])
+        if weights.shape != (x.shape[0],):
+            raise ValueError(f"weights ({weights.shape}) must have shape ({x.shape[0]},).")
+        return float(np.linalg.norm(factor.T @ weights - self._mean_coefs))
+
+    def _solve_inner(self, factor: np.ndarray, nugget: float) -> np.ndarray:
+        """(F^T F + nugget I)^{-1} c"""
+        if nugget <= 0:
+            raise ValueError(f"nugget ({nugget}) must be positive.")
+
+        gram = factor.T @ factor
+        gram[np.diag_indices_from(gram)] += nugget
+        return cho_solve(cho_factor(gram), self._mean_coefs)
@@ -0,0 +1,78 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from typing import Optional
+
+import numpy as np
+from numpy.typing import DTypeLike
+from scipy.sparse.linalg import LinearOperator
+
+from ..kernels import ProductKernel
+from ..parallel import get_blocks
+
+
+class KernelLinearOperator(LinearOperator):
+    def __init__(
+        self,
+        kernel: ProductKernel,
+        x1: np.ndarray,
+        x2: Optional[np.ndarray] = None,
+        block_size: int = 1024,
+        num_workers: int = 1,
+        dtype: DTypeLike = np.float64,
+    ):
+        """Matrix-free Gram matrix K[i, j] = k(x1[i], x2[j]) as a scipy LinearOperator.
+
+        Products with K and K^T stream over row blocks of K that are evaluated on the fly, hence memory stays at
+        O(block_size * n2) and K is never formed. Usable with all iterative solvers of scipy.sparse.linalg, e.g.,
+        cg for kernel quadrature weights.
+
+        :param kernel: Product kernel.
+        :param x1: Points of shape (n1, d).
+        :param x2: Points of shape (n2, d). Defaults to x1, i.e., the symmetric Gram matrix.
+        :param block_size: Number of rows of K held in memory at a time.
+        :param num_workers: Number of threads each row block is evaluated with.
+        :param dtype: Floating point type of the row blocks and the products.
+        """
+        if x2 is None:
+            x2 = x1
+
+        kernel._check_inputs(x1, x2)
+
+        if block_size < 1:
+            raise ValueError(f"block_size ({block_size}) must be a positive integer.")
+
+        self.kernel = kernel
+        self.x1 = x1
+        self.x2 = x2
+        self.block_size = block_size
+        self.num_workers = num_workers
+        super().__init__(dtype=np.dtype(dtype), shape=(x1.shape[0], x2.shape[0]))
+
+    def _row_blocks(self):
+        """Yields (start, stop, K[start:stop]) reusing one buffer of block_size rows."""
+        buffer = np.empty([min(self.block_size, self.shape[0]), self.shape[1]], dtype=self.dtype)
+        for start, stop in get_blocks(self.shape[0], self.block_size):
+            K_block = self.kernel.evaluate(
+                self.x1[start:stop], self.x2, out=buffer[: stop - start], num_workers=self.num_workers
+            )
+            yield start, stop, K_block
+
+    def _matvec(self, v: np.ndarray) -> np.ndarray:
+        return self._matmat(v.reshape(-1, 1)).reshape(-1)
+
+    def _rmatvec(self, v: np.ndarray) -> np.ndarray:
+        return self._rmatmat(v.reshape(-1, 1)).reshape(-1)
+
+    def _matmat(self, V: np.ndarray) -> np.ndarray:
+        res = np.empty([self.shape[0], V.shape[1]], dtype=np.result_type(self.dtype, V.dtype))
+        for start, stop, K_block in self._row_blocks():
+            res[start:stop] = K_block @ V
+        return res
+
+    def _rmatmat(self, V: np.ndarray) -> np.ndarray:
+        res = np.zeros([self.shape[1], V.shape[1]], dtype=np.result_type(self.dtype, V.dtype))
+        for start, stop, K_block in self._row_blocks():
+            res += K_block.T @ V[start:stop]
+        return res
@@ -0,0 +1,103 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from typing import Optional
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.sparse.linalg import LinearOperator
+
+from ..kernels import ProductKernel
+
+
+class PivotedCholesky:
+    def __init__(self, kernel: ProductKernel, x: np.ndarray, max_rank: Optional[int] = None, tol: float = 1e-10):
+        """Partial Cholesky factorization K ~ L L^T of the Gram matrix with greedy diagonal pivoting.
+
+        Only the diagonal of K and one column per step are evaluated, so the cost is O(n r^2) for rank r and K is
+        never formed. The factorization stops once the trace of the residual K - L L^T falls below tol times the
+        trace of K, or once the rank reaches max_rank.
+
+        :param kernel: Product kernel.
+        :param x: Points of shape (n, d).
+        :param max_rank: Maximal rank. Defaults to n.
+        :param tol: Tolerance on the trace error relative to the trace of K.
+        """
+        kernel._check_inputs(x, x)
+        n = x.shape[0]
+
+        if max_rank is None:
+            max_rank = n
+
+        if not 0 < max_rank <= n:
+            raise ValueError(f"max_rank ({max_rank}) must lie in [1, {n}].")
+
+        if tol < 0:
+            raise ValueError(f"tol ({tol}) must be non-negative.")
+
+        residual = kernel.diag(x).copy()
+        trace = residual.sum()
+        L = np.zeros([n, max_rank])
+        pivots = []
+        for m in range(max_rank):
+            if residual.sum() <= tol * trace:
+                break
+
+            pivot = int(np.argmax(residual))
+            if residual[pivot] <= 0:
+                break
+
+            column = kernel.evaluate_column(x, x, pivot)
+            column -= L[:, :m] @ L[pivot, :m]
+            L[:, m] = column / np.sqrt(residual[pivot])
+            residual -= L[:, m] ** 2
+            residual[pivot] = 0.0
+            np.maximum(residual, 0.0, out=residual)
+            pivots.append(pivot)
+
+        self._factor = L[:, : len(pivots)]
+        self._pivots = np.array(pivots, dtype=int)
+        self._trace_error = float(residual.sum())
+
+    @property
+    def factor(self) -> np.ndarray:
+        """Factor L of shape (n, r)."""
+        return self._factor
+
+    @property
+    def pivots(self) -> np.ndarray:
+        """Indices of the points selected as pivots, in the order of selection."""
+        return self._pivots
+
+    @property
+    def rank(self) -> int:
+        return self._factor.shape[1]
+
+    @property
+    def trace_error(self) -> float:
+        """Trace of the residual K - L L^T."""
+        return self._trace_error
+
+    def preconditioner(self, nugget: float) -> LinearOperator:
+        """Inverse of L L^T + nugget I as a LinearOperator, applied in O(n r) via the Woodbury identity.
+
+        Use as preconditioner M of iterative solves with K + nugget I, e.g., scipy.sparse.linalg.cg.
+
+        :param nugget: Positive diagonal shift.
+        """
+        if nugget <= 0:
+            raise ValueError(f"nugget ({nugget}) must be positive.")
+
+        L = self._factor
+        inner = L.T @ L
+        inner[np.diag_indices_from(inner)] += nugget
+        inner_cho = cho_factor(inner)
+
+        # (L L^T + s I)^{-1} = (I - L (L^T L + s I)^{-1} L^T) / s
+        def matmat(V: np.ndarray) -> np.ndarray:
+            V = V.reshape(L.shape[0], -1)
+            return (V - L @ cho_solve(inner_cho, L.T @ V)) / nugget
+
+        n = L.shape[0]
+        return LinearOperator(shape=(n, n), matvec=matmat, rmatvec=matmat, matmat=matmat, dtype=np.dtype(float))
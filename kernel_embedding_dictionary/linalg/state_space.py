@@ -0,0 +1,187 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.linalg import solve_continuous_lyapunov
+from scipy.special import binom, factorial
+
+from ..embeddings import KernelEmbedding
+from ..kernels import (
+    Matern12KernelUni,
+    Matern32KernelUni,
+    Matern52KernelUni,
+    Matern72KernelUni,
+    MaternKernelUni,
+    UnivariateKernel,
+)
+
+# innovation variances are differences of terms of the size of the kernel variance P_inf[0, 0]; relative to it,
+# smaller values are dominated by rounding errors, i.e., the points nearly coincide
+_SINGULAR_RTOL = 1e-12
+
+
+class StateSpaceGram:
+    def __init__(self, kernel: UnivariateKernel, x: np.ndarray):
+        """Gram matrix of a 1-D half-integer Matern kernel in state-space form.
+
+        A Matern kernel of order nu = p + 1/2 is the covariance of a linear SDE with a state of dimension p + 1.
+        On sorted points, the Gram matrix can therefore be applied with two sweeps, and factorized with a Kalman
+        filter, at O(n p^2) cost without forming the matrix. All inputs and outputs are in the order of x; sorting
+        is handled internally.
+
+        :param kernel: Univariate Matern kernel.
+        :param x: Points of shape (n, ). Points must be distinct for solve and logdet, which raise a ValueError
+            for duplicate or near-duplicate points.
+        """
+        if not isinstance(
+            kernel, (MaternKernelUni, Matern12KernelUni, Matern32KernelUni, Matern52KernelUni, Matern72KernelUni)
+        ):
+            raise ValueError(f"State-space Gram matrices are only available for univariate Matern kernels.")
+
+        if len(x.shape) != 1:
+            raise ValueError(f"x ({x.shape}) must be a one-dimensional array.")
+
+        self._kernel = kernel
+        self._order = np.argsort(x, kind="stable")
+        x_sorted = x[self._order]
+
+        # state-space model (F, L) in time units of 1 / lam, whose feedback matrix has characteristic
+        # polynomial (s + 1)^(p + 1). The unit rate keeps the stationary covariance well scaled.
+        dim = int(kernel.nu) + 1
+        lam = np.sqrt(2 * kernel.nu) / kernel.ell
+        ks = np.arange(dim)
+        F = np.diag(np.ones(dim - 1), 1)
+        F[-1, :] = -binom(dim, ks)
+
+        # stationary covariance, normalized to unit kernel variance
+        L = np.zeros([dim, 1])
+        L[-1, 0] = 1.0
+        P_inf = solve_continuous_lyapunov(F, -L @ L.T)
+        self._P_inf = P_inf / P_inf[0, 0]
+
+        # transitions expm(F dt) = exp(-dt) * sum_j (N dt)^j / j! with the nilpotent N = F + I
+        dts = lam * np.diff(x_sorted, prepend=x_sorted[:1])
+        N_powers = np.array([np.linalg.matrix_power(F + np.eye(dim), j) for j in range(dim)])
+        dt_powers = dts[:, None] ** ks[None, :] / factorial(ks)
+        self._transitions = np.exp(-dts)[:, None, None] * np.einsum("nj,jab->nab", dt_powers, N_powers)
+
+        self._factorization: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @property
+    def n(self) -> int:
+        return self._order.shape[0]
+
+    @property
+    def state_dim(self) -> int:
+        return self._P_inf.shape[0]
+
+    @property
+    def order(self) -> np.ndarray:
+        """Permutation that sorts x."""
+        return self._order
+
+    def _kalman_gains(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Innovation variances and gains of the noise-free Kalman filter, i.e., the factorization K = L D L^T.
+
+        Computed on first use, so that matvec is available for points that are not distinct.
+        """
+        if self._factorization is not None:
+            return self._factorization
+
+        P_inf = self._P_inf
+        variances = np.empty(self.n)
+        gains = np.empty([self.n, self.state_dim])
+
+        P = P_inf
+        for i, A in enumerate(self._transitions):
+            P_pred = P_inf if i == 0 else A @ (P - P_inf) @ A.T + P_inf
+            variances[i] = P_pred[0, 0]
+            if variances[i] <= _SINGULAR_RTOL * P_inf[0, 0]:
+                raise ValueError(
+                    f"The Gram matrix is numerically singular: x[{self._order[i]}] is a duplicate or near-duplicate "
+                    f"point. solve and logdet require distinct points."
+                )
+            gains[i] = P_pred[:, 0] / variances[i]
+            P = P_pred - np.outer(gains[i], P_pred[0, :])
+            P = 0.5 * (P + P.T)
+
+        self._factorization = (variances, gains)
+        return self._factorization
+
+    def matvec(self, v: np.ndarray) -> np.ndarray:
+        """Product K v in O(n p^2). v has shape (n, ) or (n, m)."""
+        v_sorted = v[self._order].reshape(self.n, -1)
+        P_inf_col = self._P_inf[:, :1]
+        P_inf_row = self._P_inf[:1, :]
+
+        # forward sweep: contributions of x_j <= x_i
+        res = np.empty_like(v_sorted, dtype=float)
+        state = np.zeros([self.state_dim, v_sorted.shape[1]])
+        for i, A in enumerate(self._transitions):
+            state = A @ state + P_inf_col * v_sorted[i]
+            res[i] = state[0]
+
+        # backward sweep: contributions of x_j > x_i
+        state = np.zeros([self.state_dim, v_sorted.shape[1]])
+        for i in range(self.n - 2, -1, -1):
+            state[0] += v_sorted[i + 1]
+            state = self._transitions[i + 1].T @ state
+            res[i] += (P_inf_row @ state)[0]
+
+        return self._unsort(res.reshape(v.shape))
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """Solution of K a = rhs in O(n p^2). rhs has shape (n, ) or (n, m)."""
+        rhs_sorted = rhs[self._order].reshape(self.n, -1)
+        variances, gains = self._kalman_gains()
+
+        # Kalman filter: innovations L^{-1} rhs
+        innovations = np.empty_like(rhs_sorted, dtype=float)
+        state = np.zeros([self.state_dim, rhs_sorted.shape[1]])
+        for i, A in enumerate(self._transitions):
+            state = A @ state
+            innovations[i] = rhs_sorted[i] - state[0]
+            state += gains[i][:, None] * innovations[i]
+
+        innovations /= variances[:, None]
+
+        # adjoint of the filter: L^{-T} D^{-1} L^{-1} rhs
+        res = np.empty_like(innovations)
+        adjoint = np.zeros([self.state_dim, rhs_sorted.shape[1]])
+        for i in range(self.n - 1, -1, -1):
+            res[i] = innovations[i] + gains[i] @ adjoint
+            adjoint[0] -= res[i]
+            adjoint = self._transitions[i].T @ adjoint
+
+        return self._unsort(res.reshape(rhs.shape))
+
+    def logdet(self) -> float:
+        """Log-determinant of K."""
+        variances, _ = self._kalman_gains()
+        return np.sum(np.log(variances))
+
+    def to_dense(self) -> np.ndarray:
+        """Dense Gram matrix in the order of x. Use for small n only."""
+        return self.matvec(np.eye(self.n))
+
+    def _unsort(self, v_sorted: np.ndarray) -> np.ndarray:
+        v = np.empty_like(v_sorted)
+        v[self._order] = v_sorted
+        return v
+
+
+def state_space_quadrature_weights(embedding: KernelEmbedding, x: np.ndarray) -> np.ndarray:
+    """Bayesian quadrature weights K^{-1} z of a 1-D Matern kernel embedding in O(n).
+
+    :param embedding: One-dimensional kernel embedding of a Matern kernel.
+    :param x: Distinct nodes of shape (n, ).
+    :return: The weights of shape (n, ) such that the integral of f is approximated by weights @ f(x).
+    """
+    if embedding.ndim != 1:
+        raise ValueError(f"State-space quadrature weights require a one-dimensional embedding ({embedding.ndim}).")
+
+    gram = StateSpaceGram(embedding.kernel.get_kernel_from_dim(0), x)
+    return gram.solve(embedding.mean(x[:, None]))
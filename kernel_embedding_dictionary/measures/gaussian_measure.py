@@ -6,7 +6,7 @@ from typing import List, Optional
 
 import numpy as np
 
-from .measure import ProductMeasure, UnivariateMeasure
+from .measure import ProductMeasure, UnivariateMeasure, _broadcast_batch
 
 
 class GaussianMeasureUni(UnivariateMeasure):
@@ -74,6 +74,21 @@ class GaussianMeasure(ProductMeasure):
     def variances(self) -> List[float]:
         return [m.variance for m in self._measures]
 
+    def get_batch_param_dicts(
+        self, means: Optional[np.ndarray] = None, variances: Optional[np.ndarray] = None
+    ) -> List[dict]:
+        """Parameters of a batch of B Gaussian measures, per dimension as arrays of shape (B,).
+
+        :param means: Means of shape (B, d). Defaults to the means of this measure.
+        :param variances: Variances of shape (B, d). Defaults to the variances of this measure.
+        """
+        means, variances = _broadcast_batch([means, variances], [self.means, self.variances], self.ndim)
+
+        if np.any(variances <= 0.0):
+            raise ValueError("variances must be positive.")
+
+        return [{"mean": means[:, dim], "variance": variances[:, dim]} for dim in range(self.ndim)]
+
     def __str__(self) -> str:
         return (
             f"Gaussian measure \n"
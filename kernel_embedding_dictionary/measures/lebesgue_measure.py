@@ -76,6 +76,24 @@ class LebesgueMeasure(ProductMeasure):
     def density(self) -> float:
         return np.array([m.density for m in self._measures]).prod()
 
+    def get_batch_param_dicts(self, bounds: np.ndarray) -> List[dict]:
+        """Parameters of a batch of B Lebesgue measures, per dimension as arrays of shape (B,).
+
+        :param bounds: Bounds of shape (B, d, 2), i.e., (lb, ub) per measure and dimension. The measures are
+            normalized if this measure is.
+        """
+        bounds = np.asarray(bounds, dtype=np.float64)
+        if bounds.ndim != 3 or bounds.shape[0] == 0 or bounds.shape[1:] != (self.ndim, 2):
+            raise ValueError(f"bounds ({bounds.shape}) must have shape (B, {self.ndim}, 2) with B > 0.")
+
+        lb = bounds[:, :, 0]
+        ub = bounds[:, :, 1]
+        if np.any(lb >= ub):
+            raise ValueError("upper bounds must be larger than lower bounds.")
+
+        density = 1.0 / (ub - lb) if self.normalize else np.ones_like(lb)
+        return [{"lb": lb[:, dim], "ub": ub[:, dim], "density": density[:, dim]} for dim in range(self.ndim)]
+
     def __str__(self) -> str:
         return (
             f"Lebesgue measure \n"
@@ -3,7 +3,7 @@
 
 
 import abc
-from typing import List
+from typing import List, Optional, Sequence
 
 import numpy as np
 
@@ -27,6 +27,13 @@ class ProductMeasure(abc.ABC):
     def get_param_dict_from_dim(self, dim: int) -> dict:
         return self._measures[dim].param_dict
 
+    def get_batch_param_dicts(self, **params) -> List[dict]:
+        """Parameters of a batch of B measures of this family, per dimension as arrays of shape (B,).
+
+        Override to support batches of measures.
+        """
+        raise ValueError(f"Batches of parameters are not supported for the {self.name} measure.")
+
     def sample(self, num_points: int) -> np.ndarray:
         ndim = self.ndim
         x = np.zeros([num_points, ndim])
@@ -45,3 +52,21 @@ class ProductMeasure(abc.ABC):
     @abc.abstractmethod
     def __repr__(self) -> str:
         pass
+
+
+def _broadcast_batch(
+    arrays: Sequence[Optional[np.ndarray]], defaults: Sequence[List[float]], ndim: int
+) -> List[np.ndarray]:
+    """Batches of parameters of shape (B, ndim). Missing batches are filled with the default values of the measure."""
+    given = [np.asarray(a, dtype=np.float64) for a in arrays if a is not None]
+    if not given:
+        raise ValueError("At least one batch of parameters must be given.")
+
+    batch_size = given[0].shape[0] if given[0].ndim > 0 else 0
+    batches = []
+    for array, default in zip(arrays, defaults):
+        array = np.tile(default, (batch_size, 1)) if array is None else np.asarray(array, dtype=np.float64)
+        if array.shape != (batch_size, ndim) or batch_size == 0:
+            raise ValueError(f"batch of parameters ({array.shape}) must have shape (B, {ndim}) with B > 0.")
+        batches.append(array)
+    return batches
@@ -0,0 +1,122 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BACKENDS = ("thread", "process")
+
+# default number of rows or points per block; fixed so that the blocks, and hence the results, do not depend on the
+# number of workers
+DEFAULT_BLOCK_SIZE = 256
+
+# state of a worker process, set once by the pool initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def get_blocks(n: int, block_size: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Consecutive (start, stop) index ranges of at most block_size covering range(n).
+
+    If block_size is None, DEFAULT_BLOCK_SIZE is used.
+    """
+    if block_size is None:
+        block_size = DEFAULT_BLOCK_SIZE
+    elif block_size < 1:
+        raise ValueError(f"block size ({block_size}) must be a positive integer.")
+
+    return [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+
+
+def run_blocks(func: Callable[[int, int], None], blocks: List[Tuple[int, int]], num_workers: int = 1) -> None:
+    """Call func(start, stop) for each block, on a thread pool if num_workers > 1.
+
+    The blocks do not depend on num_workers, hence each block is computed by exactly the same operations in
+    serial and in parallel mode and the results are bitwise identical. func must write to disjoint outputs.
+    NumPy releases the GIL in its ufuncs and in BLAS, so threads scale for array-heavy blocks.
+    """
+    if num_workers < 1:
+        raise ValueError(f"num_workers ({num_workers}) must be a positive integer.")
+
+    if num_workers == 1 or len(blocks) <= 1:
+        for start, stop in blocks:
+            func(start, stop)
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(func, start, stop) for start, stop in blocks]
+        for future in futures:
+            future.result()
+
+
+def run_blocks_in_processes(
+    func: Callable[[Any, Dict[str, np.ndarray], int, int], None],
+    obj: Any,
+    arrays: Dict[str, np.ndarray],
+    outputs: Sequence[str],
+    blocks: List[Tuple[int, int]],
+    num_workers: int,
+) -> None:
+    """Call func(obj, arrays, start, stop) for each block on a process pool, with arrays in shared memory.
+
+    Use for blocks that hold the GIL, e.g., scalar Python loops, where threads do not scale. The arrays are placed
+    in multiprocessing.shared_memory once, so workers read inputs and write outputs without pickled copies. obj
+    (e.g. a kernel or an embedding) and func are sent to each worker once at startup; both must be picklable,
+    i.e., func must be defined at module level.
+
+    :param arrays: Named input and output arrays. Outputs are written back to these arrays in place.
+    :param outputs: Names of the output arrays. They are not copied to shared memory initially.
+    """
+    if num_workers < 1:
+        raise ValueError(f"num_workers ({num_workers}) must be a positive integer.")
+
+    shms = []
+    shared = {}
+    try:
+        specs = {}
+        for key, array in arrays.items():
+            shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+            shms.append(shm)
+            shared[key] = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            if key not in outputs:
+                shared[key][...] = array
+            specs[key] = (shm.name, array.shape, array.dtype.str)
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers, initializer=_init_worker, initargs=(func, obj, specs)
+        ) as executor:
+            futures = [executor.submit(_run_block, start, stop) for start, stop in blocks]
+            for future in futures:
+                future.result()
+
+        for key in outputs:
+            arrays[key][...] = shared[key]
+    finally:
+        # views into the buffers must be released before the shared memory can be closed
+        shared.clear()
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+
+def _open_shared_memory(name: str) -> SharedMemory:
+    try:
+        # the parent owns the memory; python >= 3.13 can skip the registration with the resource tracker
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        return SharedMemory(name=name)
+
+
+def _init_worker(func: Callable, obj: Any, specs: Dict[str, Tuple[str, tuple, str]]) -> None:
+    shms = {key: _open_shared_memory(name) for key, (name, _, _) in specs.items()}
+    arrays = {
+        key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shms[key].buf) for key, (_, shape, dtype) in specs.items()
+    }
+    _worker_state.update(func=func, obj=obj, arrays=arrays, shms=shms)
+
+
+def _run_block(start: int, stop: int) -> None:
+    _worker_state["func"](_worker_state["obj"], _worker_state["arrays"], start, stop)
@@ -5,9 +5,38 @@
 from typing import Union
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+from kernel_embedding_dictionary.backend import get_namespace
 
 
 def scaled_diff(
     x1: Union[np.ndarray, float], x2: Union[np.ndarray, float], scale: float, factor: float
 ) -> Union[np.ndarray, float]:
     return (x1 - x2) / (scale * factor)
+
+
+def horner(coefs: np.ndarray, x: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
+    """Polynomial sum_k coefs[k] x^k evaluated with the Horner scheme."""
+    xp = get_namespace(x)
+    if xp is np:
+        # full_like keeps the floating point type of x; the coefficients are added in place
+        res = np.full_like(x, coefs[-1], dtype=np.result_type(x, np.float32))
+        for coef in coefs[-2::-1]:
+            res *= x
+            res += coef
+        return res
+
+    # arrays of other namespaces may be immutable, e.g., in jax
+    res = xp.full_like(x, float(coefs[-1]))
+    for coef in coefs[-2::-1]:
+        res = res * x + float(coef)
+    return res
+
+
+def check_dtype(dtype: DTypeLike) -> np.dtype:
+    """Floating point type dtype as np.dtype; raises ValueError for other types."""
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError(f"dtype ({dtype}) must be a floating point type.")
+    return dtype
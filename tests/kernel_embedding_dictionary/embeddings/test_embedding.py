@@ -4,10 +4,14 @@
 
 import numpy as np
 import pytest
+from scipy.integrate import quad
+from scipy.stats import norm, uniform
 
+from kernel_embedding_dictionary._get_embedding import get_embedding
 from kernel_embedding_dictionary.embeddings import KernelEmbedding
 from kernel_embedding_dictionary.kernels import ExpQuadKernel
 from kernel_embedding_dictionary.measures import GaussianMeasure
+from kernel_embedding_dictionary.parallel import DEFAULT_BLOCK_SIZE
 
 
 def test_kernel_embedding_raises():
@@ -43,3 +47,222 @@ def test_kernel_embedding_mean_raises():
     wrong_x = np.ones(5)
     with pytest.raises(ValueError):
         ke_1d.mean(wrong_x)
+
+
+embedding_names = [
+    ("expquad", "lebesgue"),
+    ("expquad", "gaussian"),
+    ("matern", "lebesgue"),
+    ("matern12", "lebesgue"),
+    ("matern12", "gaussian"),
+    ("matern32", "lebesgue"),
+    ("matern32", "gaussian"),
+    ("matern52", "lebesgue"),
+    ("matern72", "lebesgue"),
+    ("wendland0", "lebesgue"),
+    ("wendland0", "gaussian"),
+    ("wendland2", "gaussian"),
+]
+
+
+@pytest.mark.parametrize("embedding", embedding_names)
+def test_kernel_embedding_mean_parallel(embedding):
+    kernel_name, measure_name = embedding
+    ke = get_embedding(kernel_name, measure_name, {"ndim": 2}, {"ndim": 2})
+
+    np.random.seed(0)
+    x = np.random.rand(2 * DEFAULT_BLOCK_SIZE + 11, 2) * 0.5
+    res = ke.mean(x)
+
+    # bitwise identical to the plain serial evaluation
+    for num_workers in [2, 3, 7]:
+        assert np.array_equal(ke.mean(x, num_workers=num_workers), res)
+        assert np.array_equal(ke.mean(x, num_workers=num_workers, chunk_size=4), res)
+
+    with pytest.raises(ValueError):
+        ke.mean(x, num_workers=0)
+
+    with pytest.raises(ValueError):
+        ke.mean(x, num_workers=2, backend="unknown_backend")
+
+
+@pytest.mark.parametrize("embedding", embedding_names)
+def test_kernel_embedding_mean_batch(embedding):
+    kernel_name, measure_name = embedding
+    config_kernel = {"ndim": 2, "lengthscales": [0.3, 1.5]}
+    ke = get_embedding(kernel_name, measure_name, config_kernel, {"ndim": 2})
+
+    np.random.seed(0)
+    x = np.random.rand(7, 2)
+    if measure_name == "gaussian":
+        # the Wendland embeddings need centered measures
+        means = np.zeros([4, 2]) if kernel_name.startswith("wendland") else np.random.randn(4, 2)
+        variances = np.random.rand(4, 2) + 0.1
+        variances[0, 0] = 0.001  # the Wendland embeddings switch to quadrature for small variance
+        measure_params = {"means": means, "variances": variances}
+        configs = [{"means": list(m), "variances": list(v)} for m, v in zip(means, variances)]
+    else:
+        lb = np.random.rand(4, 2) - 1.0
+        bounds = np.stack([lb, lb + np.random.rand(4, 2) + 0.5], axis=-1)
+        measure_params = {"bounds": bounds}
+        configs = [{"bounds": [tuple(b) for b in bounds_b], "normalize": True} for bounds_b in bounds]
+        ke = get_embedding(kernel_name, measure_name, config_kernel, {"ndim": 2, "normalize": True})
+
+    res = ke.mean_batch(x, **measure_params)
+    res_32 = ke.mean_batch(x, dtype=np.float32, **measure_params)
+    assert res.shape == (4, 7)
+    assert res_32.dtype == np.float32
+    for b, config_measure in enumerate(configs):
+        ke_b = get_embedding(kernel_name, measure_name, config_kernel, config_measure)
+        assert np.allclose(res[b], ke_b.mean(x), rtol=1e-12, atol=1e-14)
+        assert np.allclose(res_32[b], ke_b.mean(x, dtype=np.float32), rtol=1e-5, atol=1e-7)
+
+
+def test_kernel_embedding_mean_batch_raises():
+    ke = get_embedding("expquad", "gaussian", {"ndim": 2}, {"ndim": 2})
+    x = np.random.rand(7, 2)
+
+    # no parameters, wrong shapes and non-positive variances
+    with pytest.raises(ValueError):
+        ke.mean_batch(x)
+
+    with pytest.raises(ValueError):
+        ke.mean_batch(x, means=np.zeros([4, 3]))
+
+    with pytest.raises(ValueError):
+        ke.mean_batch(x, means=np.zeros([4, 2]), variances=np.ones([3, 2]))
+
+    with pytest.raises(ValueError):
+        ke.mean_batch(x, variances=np.zeros([4, 2]))
+
+    with pytest.raises(ValueError):
+        ke.mean_batch(np.random.rand(7, 3), means=np.zeros([4, 2]))
+
+    # the Wendland embeddings need centered measures
+    ke = get_embedding("wendland2", "gaussian", {"ndim": 2}, {"ndim": 2})
+    with pytest.raises(ValueError):
+        ke.mean_batch(x, means=np.ones([4, 2]))
+
+    ke = get_embedding("expquad", "lebesgue", {"ndim": 2}, {"ndim": 2})
+    with pytest.raises(ValueError):
+        ke.mean_batch(x, bounds=np.zeros([4, 2, 3]))
+
+    with pytest.raises(ValueError):
+        ke.mean_batch(x, bounds=np.stack([np.ones([4, 2]), np.zeros([4, 2])], axis=-1))
+
+
+@pytest.mark.parametrize("embedding", embedding_names)
+def test_kernel_embedding_mean_lengthscales(embedding):
+    kernel_name, measure_name = embedding
+    ke = get_embedding(kernel_name, measure_name, {"ndim": 2}, {"ndim": 2})
+
+    np.random.seed(0)
+    x = np.random.rand(7, 2)
+    # includes lengthscales that switch the Wendland embeddings to quadrature
+    lengthscales = np.array([[0.3, 1.5], [2.0, 0.5], [20.0, 0.1], [0.01, 5.0]])
+
+    res = ke.mean(x, lengthscales=lengthscales)
+    assert res.shape == (4, 7)
+    for b, lengthscales_b in enumerate(lengthscales):
+        ke_b = get_embedding(kernel_name, measure_name, {"ndim": 2, "lengthscales": list(lengthscales_b)}, {"ndim": 2})
+        assert np.allclose(res[b], ke_b.mean(x), rtol=1e-12, atol=1e-14)
+
+    with pytest.raises(ValueError):
+        ke.mean(x, lengthscales=np.ones([4, 3]))
+
+    with pytest.raises(ValueError):
+        ke.mean(x, lengthscales=-np.ones([4, 2]))
+
+
+@pytest.mark.parametrize("embedding", embedding_names)
+def test_kernel_embedding_mean_stacked(embedding):
+    kernel_name, measure_name = embedding
+    ke = get_embedding(kernel_name, measure_name, {"ndim": 2}, {"ndim": 2})
+
+    np.random.seed(0)
+    x = np.random.randn(5, 7, 2)
+
+    res = ke.mean(x)
+    assert res.shape == (5, 7)
+    for b in range(5):
+        assert np.array_equal(res[b], ke.mean(x[b]))
+
+    # chunks and workers split the sets of points
+    assert np.array_equal(ke.mean(x, num_workers=2, chunk_size=2), res)
+    assert ke.mean(x, dtype=np.float32).dtype == np.float32
+    assert ke.mean(x[:0]).shape == (0, 7)
+
+    # wrong dimensionality, and lengthscales need points of shape (n, d)
+    with pytest.raises(ValueError):
+        ke.mean(x[:, :, :1])
+
+    with pytest.raises(ValueError):
+        ke.mean(x, lengthscales=np.ones([3, 2]))
+
+
+def test_kernel_embedding_mean_process_backend():
+    ke = get_embedding("matern32", "gaussian", {"ndim": 2}, {"ndim": 2})
+
+    np.random.seed(0)
+    x = np.random.rand(11, 2)
+    assert np.array_equal(ke.mean(x, num_workers=2, chunk_size=4, backend="process"), ke.mean(x))
+
+
+@pytest.mark.parametrize("embedding", embedding_names)
+def test_kernel_embedding_mean_float32(embedding):
+    kernel_name, measure_name = embedding
+    ke = get_embedding(kernel_name, measure_name, {"ndim": 2, "lengthscales": [0.05, 2.0]}, {"ndim": 2})
+
+    np.random.seed(0)
+    x = np.random.rand(50, 2)
+    res = ke.mean(x)
+    res_32 = ke.mean(x, dtype=np.float32)
+    assert res_32.dtype == np.float32
+    assert np.max(np.abs(res_32 - res)) <= 1e-5 * np.max(np.abs(res))
+
+    with pytest.raises(ValueError):
+        ke.mean(x, dtype=int)
+
+
+@pytest.mark.parametrize("kernel_name", ["expquad", "matern12", "matern32", "wendland0", "wendland2"])
+@pytest.mark.parametrize("lengthscale", [0.002, 0.05, 20.0])
+def test_kernel_embedding_mean_gaussian_extreme_lengthscales(kernel_name, lengthscale):
+    # the Gaussian embeddings are evaluated in forms that neither overflow nor cancel for extreme lengthscales
+    ke = get_embedding(kernel_name, "gaussian", {"lengthscales": [lengthscale]}, {"variances": [2.0]})
+    k = ke.kernel.get_kernel_from_dim(0)
+    x = np.array([[-5.0], [0.0], [0.7]])
+
+    def integrand(t, x_i):
+        return k.evaluate(x_i, np.array([t]))[0, 0] * norm.pdf(t, 0.0, np.sqrt(2.0))
+
+    res = ke.mean(x)
+    for i in range(x.shape[0]):
+        lb, ub = x[i, 0] - 40 * lengthscale, x[i, 0] + 40 * lengthscale
+        res_quad = quad(integrand, lb, ub, args=(x[i],), points=[x[i, 0]], epsabs=0, epsrel=1e-12, limit=200)[0]
+        assert res[i] == pytest.approx(res_quad, rel=1e-9)
+
+
+@pytest.mark.parametrize("embedding", embedding_names)
+@pytest.mark.parametrize("lengthscale", [0.05, 0.7, 20.0])
+def test_kernel_embedding_mean_of_mean(embedding, lengthscale):
+    kernel_name, measure_name = embedding
+    config_kernel = {"lengthscales": [lengthscale]}
+    if measure_name == "gaussian":
+        ke = get_embedding(kernel_name, measure_name, config_kernel, {"variances": [1.7]})
+        lb, ub = -40.0, 40.0
+        density = norm(0.0, np.sqrt(1.7)).pdf
+    else:
+        ke = get_embedding(kernel_name, measure_name, config_kernel, {"bounds": [(-0.3, 1.2)], "normalize": True})
+        lb, ub = -0.3, 1.2
+        density = uniform(-0.3, 1.5).pdf
+
+    # the mean of the closed-form kernel mean under the measure
+    res_quad = quad(lambda t: ke.mean(np.array([[t]]))[0] * density(t), lb, ub, epsabs=0, epsrel=1e-12, limit=500)[0]
+    assert ke.mean_of_mean() == pytest.approx(res_quad, rel=1e-10)
+
+    # the product over dimensions, cached on the embedding
+    ke_2d = get_embedding(kernel_name, measure_name, {"ndim": 2, "lengthscales": [lengthscale, 1.0]}, {"ndim": 2})
+    ke_1d = get_embedding(kernel_name, measure_name, {"lengthscales": [1.0]})
+    expected = get_embedding(kernel_name, measure_name, config_kernel).mean_of_mean() * ke_1d.mean_of_mean()
+    assert ke_2d.mean_of_mean() == pytest.approx(expected, rel=1e-14)
+    assert ke_2d.mean_of_mean() is ke_2d.mean_of_mean()
@@ -0,0 +1,88 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary.embeddings.mean_funcs_1d import (
+    expquad_gaussian_mean_func_1d,
+    expquad_lebesgue_mean_func_1d,
+    matern12_gaussian_mean_func_1d,
+    matern12_lebesgue_mean_func_1d,
+    matern32_gaussian_mean_func_1d,
+    matern32_lebesgue_mean_func_1d,
+    matern52_lebesgue_mean_func_1d,
+    matern72_lebesgue_mean_func_1d,
+    matern_lebesgue_mean_func_1d,
+    wendland0_gaussian_mean_func_1d,
+    wendland0_lebesgue_mean_func_1d,
+    wendland2_gaussian_mean_func_1d,
+)
+from kernel_embedding_dictionary.embeddings.mean_funcs_1d_numba import _LOOPS, NUMBA_AVAILABLE, mean_1d
+
+LEBESGUE = {"lb": -1.0, "ub": 2.0, "density": 1 / 3}
+GAUSSIAN = {"mean": 0.0, "variance": 1.3}
+MEAN_FUNCS = [
+    (expquad_lebesgue_mean_func_1d, {"ell": 0.8, **LEBESGUE}),
+    (expquad_gaussian_mean_func_1d, {"ell": 0.8, "mean": 0.4, "variance": 1.3}),
+    (matern_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 5.5, **LEBESGUE}),
+    (matern12_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 0.5, **LEBESGUE}),
+    (matern12_gaussian_mean_func_1d, {"ell": 0.8, "nu": 0.5, "mean": 0.4, "variance": 1.3}),
+    (matern12_gaussian_mean_func_1d, {"ell": 0.01, "nu": 0.5, **GAUSSIAN}),
+    (matern32_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 1.5, **LEBESGUE}),
+    (matern32_gaussian_mean_func_1d, {"ell": 0.8, "nu": 1.5, "mean": 0.4, "variance": 1.3}),
+    (matern32_gaussian_mean_func_1d, {"ell": 0.01, "nu": 1.5, **GAUSSIAN}),
+    (matern52_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 2.5, **LEBESGUE}),
+    (matern72_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 3.5, **LEBESGUE}),
+    (wendland0_lebesgue_mean_func_1d, {"ell": 0.8, "order": 0, **LEBESGUE}),
+    (wendland0_gaussian_mean_func_1d, {"ell": 0.8, "order": 0, **GAUSSIAN}),
+    (wendland0_gaussian_mean_func_1d, {"ell": 20.0, "order": 0, **GAUSSIAN}),
+    (wendland2_gaussian_mean_func_1d, {"ell": 0.8, "order": 2, **GAUSSIAN}),
+    (wendland2_gaussian_mean_func_1d, {"ell": 20.0, "order": 2, **GAUSSIAN}),
+]
+
+
+@pytest.mark.parametrize("mean_func, params", MEAN_FUNCS)
+def test_mean_1d(mean_func, params):
+    x = np.linspace(-4, 5, 19)
+    expected = mean_func(x, **params)
+
+    # the public function uses Numba if available and the NumPy mean function otherwise
+    res = mean_1d(mean_func, x[:, None], **params)
+    assert res.shape == (19,)
+    assert np.allclose(res, expected, rtol=1e-12, atol=1e-15)
+
+    # the loop itself, compiled or as plain Python
+    res_loop = np.empty(19)
+    _LOOPS[mean_func](x, res_loop, **params)
+    assert np.allclose(res_loop, expected, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize(
+    "mean_func, params",
+    MEAN_FUNCS + [(matern_lebesgue_mean_func_1d, {"ell": 0.3, "nu": nu, **LEBESGUE}) for nu in [0.5, 4.5, 10.5]],
+)
+def test_mean_1d_compiled(mean_func, params):
+    pytest.importorskip("numba")
+    assert NUMBA_AVAILABLE
+
+    np.random.seed(0)
+    x = 9 * np.random.rand(501) - 4
+
+    res = mean_1d(mean_func, x[:, None], **params)
+    assert np.allclose(res, mean_func(x, **params), rtol=1e-12, atol=1e-15)
+
+
+def test_mean_1d_raises():
+
+    # no compiled version
+    def mean_func(x, ell):
+        return x
+
+    with pytest.raises(ValueError):
+        mean_1d(mean_func, np.zeros(3), ell=1.0)
+
+    # wendland-gaussian only for centered measures
+    with pytest.raises(ValueError):
+        _LOOPS[wendland2_gaussian_mean_func_1d](np.zeros(3), np.empty(3), ell=1.0, order=2, mean=1.0, variance=1.0)
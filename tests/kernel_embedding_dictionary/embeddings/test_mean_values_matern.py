@@ -4,6 +4,7 @@
 
 import numpy as np
 import pytest
+from scipy.integrate import quad
 
 from kernel_embedding_dictionary._get_embedding import get_embedding
 
@@ -90,3 +91,16 @@ def test_embedding_mean_values_closed_form(nu_set, fixture_name, request):
         print(res)
         print(res_explicit)
         assert res[i] == pytest.approx(res_explicit[i])
+
+
+@pytest.mark.parametrize("nu", [4.5, 10.5, 60.5, 200.5])
+def test_embedding_mean_values_large_nu(nu):
+    # the polynomial coefficients are computed in log space, hence large nu must neither overflow nor lose accuracy
+    ke = get_embedding("matern", "lebesgue", {"nu": nu, "lengthscales": [0.4]}, {"bounds": [(-0.5, 1.0)]})
+    k = ke.kernel.get_kernel_from_dim(0)
+    x = np.array([[-0.5], [0.1], [0.9]])
+
+    res = ke.mean(x)
+    for i in range(x.shape[0]):
+        res_quad = quad(lambda t: k.evaluate(x[i], np.array([t]))[0, 0], -0.5, 1.0, points=[x[i, 0]])[0]
+        assert res[i] == pytest.approx(res_quad, rel=1e-10)
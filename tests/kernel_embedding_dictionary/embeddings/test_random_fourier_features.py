@@ -0,0 +1,105 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary import get_embedding
+from kernel_embedding_dictionary.embeddings import RandomFourierFeatures
+from kernel_embedding_dictionary.kernels import ExpQuadKernel, Wendland0Kernel
+from kernel_embedding_dictionary.measures import GaussianMeasure, LebesgueMeasure
+
+feature_names = [
+    ("expquad", "lebesgue"),
+    ("expquad", "gaussian"),
+    ("matern", "lebesgue"),
+    ("matern32", "lebesgue"),
+    ("matern32", "gaussian"),
+    ("matern52", "lebesgue"),
+    ("matern72", "lebesgue"),
+]
+
+
+def tensor_quadrature(measure, num_nodes):
+    # tensor Gauss rule that is exact up to high polynomial degree, used to integrate the features
+    nodes, weights = [], []
+    for dim in range(measure.ndim):
+        params = measure.get_param_dict_from_dim(dim)
+        if measure.name == "gaussian":
+            t, w = np.polynomial.hermite_e.hermegauss(num_nodes)
+            nodes.append(params["mean"] + np.sqrt(params["variance"]) * t)
+            weights.append(w / np.sqrt(2 * np.pi))
+        else:
+            t, w = np.polynomial.legendre.leggauss(num_nodes)
+            half_width = 0.5 * (params["ub"] - params["lb"])
+            nodes.append(params["lb"] + half_width * (t + 1))
+            weights.append(params["density"] * half_width * w)
+    x = np.stack(np.meshgrid(*nodes, indexing="ij"), axis=-1).reshape(-1, measure.ndim)
+    w = np.prod(np.stack(np.meshgrid(*weights, indexing="ij"), axis=-1).reshape(-1, measure.ndim), axis=1)
+    return x, w
+
+
+@pytest.mark.parametrize("kernel_name,measure_name", feature_names)
+def test_random_fourier_features_mean_features(kernel_name, measure_name):
+    measure_config = {"ndim": 2, "bounds": [(-1, 0.5), (0, 1)], "means": [0.5, -0.3], "variances": [0.3, 0.8]}
+    ke = get_embedding(kernel_name, measure_name, {"lengthscales": [1.0, 2.0]}, measure_config)
+
+    np.random.seed(0)
+    rff = RandomFourierFeatures(ke.kernel, ke.measure, num_features=20)
+    x, w = tensor_quadrature(ke.measure, 80)
+    assert rff.mean_features.shape == (20,)
+    assert np.allclose(rff.mean_features, w @ rff.features(x), atol=1e-8)
+
+
+@pytest.mark.parametrize("kernel_name,measure_name", feature_names)
+def test_random_fourier_features_approximation(kernel_name, measure_name):
+    ke = get_embedding(kernel_name, measure_name, {"ndim": 2, "lengthscales": [0.5]}, {"ndim": 2})
+
+    np.random.seed(0)
+    rff = RandomFourierFeatures(ke.kernel, ke.measure, num_features=20000)
+    x = np.random.rand(20, 2)
+    phi = rff.features(x)
+    assert phi.shape == (20, 20000)
+    assert np.allclose(phi @ phi.T, ke.kernel.evaluate(x, x), atol=0.05)
+    assert np.allclose(rff.mean(x), ke.mean(x), atol=0.02)
+
+
+def test_random_fourier_features_quadrature_weights():
+    k = ExpQuadKernel({"ndim": 2, "lengthscales": [0.5]})
+    m = GaussianMeasure({"ndim": 2})
+
+    np.random.seed(0)
+    rff = RandomFourierFeatures(k, m, num_features=50)
+    x = m.sample(500)
+    weights = rff.quadrature_weights(x)
+    assert weights.shape == (500,)
+    assert rff.mmd(x, weights) < 1e-3
+    assert rff.mmd(x, weights) < rff.mmd(x)
+
+
+def test_random_fourier_features_raises():
+    k = ExpQuadKernel({"ndim": 2})
+    m = LebesgueMeasure({"ndim": 2})
+
+    with pytest.raises(ValueError):
+        RandomFourierFeatures(ExpQuadKernel({"ndim": 1}), m, 10)
+
+    with pytest.raises(ValueError):
+        RandomFourierFeatures(Wendland0Kernel({"ndim": 2}), m, 10)
+
+    with pytest.raises(ValueError):
+        RandomFourierFeatures(k, m, 0)
+
+    rff = RandomFourierFeatures(k, m, 10)
+    with pytest.raises(ValueError):
+        rff.features(np.ones([5, 3]))
+
+    with pytest.raises(ValueError):
+        rff.features(np.ones(5))
+
+    with pytest.raises(ValueError):
+        rff.quadrature_weights(np.ones([5, 2]), nugget=0)
+
+    with pytest.raises(ValueError):
+        rff.mmd(np.ones([5, 2]), np.ones(4))
@@ -2,9 +2,12 @@
 # SPDX-License-Identifier: MIT
 
 
+import tracemalloc
+
+import numpy as np
 import pytest
 
-from kernel_embedding_dictionary.kernels import ExpQuadKernel, ExpQuadKernelUni
+from kernel_embedding_dictionary.kernels import ExpQuadKernel, ExpQuadKernelUni, ProductKernel
 
 
 # tests for ExpQuadKernelUni start here
@@ -39,6 +42,16 @@ def test_expquad_kernel_uni_raises():
         ExpQuadKernelUni(wrong_ell)
 
 
+def test_expquad_kernel_uni_evaluations():
+
+    ell = 1.5
+    k = ExpQuadKernelUni(ell)
+    x1 = np.array([0.0, 1.0])
+    x2 = np.array([0.0, -2.0, 3.0])
+    expected = np.exp(-((x1[:, None] - x2[None, :]) ** 2) / (2 * ell**2))
+    assert np.allclose(k.evaluate(x1, x2), expected)
+
+
 # tests for ExpQuadKernel start here
 def test_expquad_kernel_defaults():
 
@@ -79,3 +92,48 @@ def test_expquad_kernel_raises():
     wrong_c = {"ndim": 1, "lengthscales": [1.0, 1.0]}
     with pytest.raises(ValueError):
         ExpQuadKernel(wrong_c)
+
+
+def test_expquad_kernel_fused_evaluate():
+
+    np.random.seed(0)
+    c = {"ndim": 5, "lengthscales": [0.3, 1.0, 2.5, 0.8, 1.7]}
+    k = ExpQuadKernel(c)
+
+    def evaluate_per_dim(x1, x2):
+        # the per-dimension product of the base class is the reference for the fused evaluation
+        K = np.empty([x1.shape[0], x2.shape[0]])
+        work = np.empty(ProductKernel._work_size(k, K.shape, K.dtype))
+        ProductKernel._evaluate(k, x1, x2, K, work, ProductKernel._prepare(k, x2))
+        return K
+
+    x1 = np.random.randn(7, 5)
+    x2 = np.random.randn(4, 5)
+    assert np.allclose(k.evaluate(x1, x2), evaluate_per_dim(x1, x2), rtol=1e-10, atol=1e-14)
+
+    # identical points give one up to rounding
+    assert np.allclose(np.diag(k.evaluate(x1, x1)), 1.0, rtol=0, atol=1e-12)
+
+    # points far from the origin
+    x1 = x1 + 1e4
+    x2 = x2 + 1e4
+    assert np.allclose(k.evaluate(x1, x2), evaluate_per_dim(x1, x2), rtol=1e-6, atol=1e-10)
+
+
+def test_expquad_kernel_fused_evaluate_no_allocation():
+
+    np.random.seed(0)
+    k = ExpQuadKernel({"ndim": 64})
+    x1 = np.random.rand(2000, 64)
+    x2 = np.random.rand(300, 64)
+    out = np.empty([2000, 300])
+    work = np.empty(k._work_size(out.shape, out.dtype))
+    prepared = k._prepare(x2)
+
+    # the scaled x1 and its norms go to work, the scaled x2 and its norms are prepared once per evaluate call
+    tracemalloc.start()
+    k._evaluate(x1, x2, out, work, prepared)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak <= 2**18
+    assert np.array_equal(out, k.evaluate(x1, x2, tile_size=2000))
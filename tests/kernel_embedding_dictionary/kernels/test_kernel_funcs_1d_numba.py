@@ -0,0 +1,94 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d import (
+    expquad_kernel_func_1d,
+    matern12_kernel_func_1d,
+    matern32_kernel_func_1d,
+    matern52_kernel_func_1d,
+    matern72_kernel_func_1d,
+    matern_kernel_func_1d,
+    wendland0_kernel_func_1d,
+    wendland2_kernel_func_1d,
+)
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d_numba import (
+    NUMBA_AVAILABLE,
+    _gram_loop,
+    _loop_args,
+    _paired_loop,
+    kernel_gram_1d,
+    kernel_paired_1d,
+)
+
+KERNEL_FUNCS = [
+    (expquad_kernel_func_1d, {"ell": 0.8}),
+    (matern_kernel_func_1d, {"ell": 0.8, "nu": 5.5}),
+    (matern12_kernel_func_1d, {"ell": 0.8, "nu": 0.5}),
+    (matern32_kernel_func_1d, {"ell": 0.8, "nu": 1.5}),
+    (matern52_kernel_func_1d, {"ell": 0.8, "nu": 2.5}),
+    (matern72_kernel_func_1d, {"ell": 0.8, "nu": 3.5}),
+    (wendland0_kernel_func_1d, {"ell": 0.8, "order": 0}),
+    (wendland2_kernel_func_1d, {"ell": 0.8, "order": 2}),
+]
+
+
+@pytest.mark.parametrize("kernel_func, params", KERNEL_FUNCS)
+def test_kernel_gram_1d(kernel_func, params):
+    x1 = np.linspace(-1, 2, 7)
+    x2 = np.linspace(-2, 1, 5)
+    K_expected = kernel_func(x1[:, None], x2[None, :], **params)
+
+    # the public function uses Numba if available and the NumPy kernel function otherwise
+    K = kernel_gram_1d(kernel_func, x1, x2, **params)
+    assert K.shape == (7, 5)
+    assert np.allclose(K, K_expected, rtol=1e-13, atol=1e-15)
+
+    # the loop itself, compiled or as plain Python
+    K_loop = np.empty([7, 5])
+    _gram_loop(x1, x2, *_loop_args(kernel_func, params), K_loop)
+    assert np.allclose(K_loop, K_expected, rtol=1e-13, atol=1e-15)
+
+
+@pytest.mark.parametrize("kernel_func, params", KERNEL_FUNCS)
+def test_kernel_paired_1d(kernel_func, params):
+    x1 = np.linspace(-1, 2, 7)
+    x2 = np.linspace(-2, 1, 7)
+    k_expected = kernel_func(x1, x2, **params)
+
+    assert np.allclose(kernel_paired_1d(kernel_func, x1, x2, **params), k_expected, rtol=1e-13, atol=1e-15)
+
+    k_loop = np.empty(7)
+    _paired_loop(x1, x2, *_loop_args(kernel_func, params), k_loop)
+    assert np.allclose(k_loop, k_expected, rtol=1e-13, atol=1e-15)
+
+
+@pytest.mark.parametrize(
+    "kernel_func, params",
+    KERNEL_FUNCS + [(matern_kernel_func_1d, {"ell": 0.3, "nu": nu}) for nu in [0.5, 4.5, 10.5]],
+)
+def test_kernel_1d_compiled(kernel_func, params):
+    pytest.importorskip("numba")
+    assert NUMBA_AVAILABLE
+
+    np.random.seed(0)
+    x1 = 6 * np.random.rand(301) - 3
+    x2 = 6 * np.random.rand(203) - 3
+
+    K = kernel_gram_1d(kernel_func, x1, x2, **params)
+    assert np.allclose(K, kernel_func(x1[:, None], x2[None, :], **params), rtol=1e-12, atol=1e-15)
+
+    k = kernel_paired_1d(kernel_func, x1[:203], x2, **params)
+    assert np.allclose(k, kernel_func(x1[:203], x2, **params), rtol=1e-12, atol=1e-15)
+
+
+def test_kernel_gram_1d_raises():
+
+    def kernel_func(x1, x2, ell):
+        return x1 * x2
+
+    with pytest.raises(ValueError):
+        _loop_args(kernel_func, {"ell": 1.0})
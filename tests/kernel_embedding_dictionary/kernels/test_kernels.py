@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: MIT
 
 
+import tracemalloc
+
 import numpy as np
 import pytest
 
@@ -15,6 +17,7 @@ from kernel_embedding_dictionary.kernels import (
     Wendland0Kernel,
     Wendland2Kernel,
 )
+from kernel_embedding_dictionary.parallel import DEFAULT_BLOCK_SIZE
 
 
 @pytest.fixture()
@@ -149,3 +152,402 @@ def test_kernel_uni_raises(kernel_name, request):
         k.evaluate(wrong_x, x)
     with pytest.raises(ValueError):
         k.evaluate(x, wrong_x)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_tiled(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(7, 2)
+    x2 = np.random.rand(5, 2)
+    res = k.evaluate(x1, x2)
+
+    for tile_size in [1, 3, 7, 10]:
+        assert np.allclose(k.evaluate(x1, x2, tile_size=tile_size), res, rtol=1e-12, atol=1e-14)
+
+    # the result is accumulated in the given buffer, previous content is overwritten
+    out = np.full([7, 5], np.nan)
+    res_out = k.evaluate(x1, x2, out=out, tile_size=2)
+    assert res_out is out
+    assert np.allclose(out, res, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_tiled_raises(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    x1 = np.random.rand(3, 2)
+    x2 = np.random.rand(4, 2)
+
+    # out has wrong shape
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2, out=np.empty([4, 3]))
+
+    # tile size is not positive
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2, tile_size=0)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_to_file(kernel_name, request, tmp_path):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(10, 2)
+    x2 = np.random.rand(6, 2)
+    filename = str(tmp_path / "gram.npy")
+
+    calls = []
+    K = k.evaluate_to_file(x1, x2, filename, tile_size=4, progress=lambda done, total: calls.append((done, total)))
+    assert calls == [(4, 10), (8, 10), (10, 10)]
+    assert np.allclose(K, k.evaluate(x1, x2), rtol=1e-12, atol=1e-14)
+    assert np.allclose(np.load(filename), k.evaluate(x1, x2), rtol=1e-12, atol=1e-14)
+    assert not (tmp_path / "gram.npy.progress").exists()
+
+
+def test_kernel_evaluate_to_file_resumes(expquad, tmp_path):
+    k = expquad
+
+    np.random.seed(0)
+    x1 = np.random.rand(10, 2)
+    x2 = np.random.rand(6, 2)
+    filename = str(tmp_path / "gram.npy")
+
+    def interrupt(done, total):
+        if done >= 6:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        k.evaluate_to_file(x1, x2, filename, tile_size=3, progress=interrupt)
+    assert (tmp_path / "gram.npy.progress").exists()
+
+    # only the remaining tiles are evaluated
+    calls = []
+    K = k.evaluate_to_file(x1, x2, filename, tile_size=3, progress=lambda done, total: calls.append(done))
+    assert calls == [9, 10]
+    assert np.allclose(K, k.evaluate(x1, x2), rtol=1e-12, atol=1e-14)
+
+    # an unfinished file of another shape is not resumed
+    with pytest.raises(KeyboardInterrupt):
+        k.evaluate_to_file(x1, x2, filename, tile_size=3, progress=interrupt)
+    with pytest.raises(ValueError):
+        k.evaluate_to_file(x1[:5], x2, filename, tile_size=3)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_gram(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x = np.random.rand(9, 2)
+    res = k.evaluate(x, x)
+
+    for tile_size in [1, 4, 9, 20]:
+        K = k.gram(x, tile_size=tile_size)
+        assert np.allclose(K, res, rtol=1e-12, atol=1e-14)
+        assert np.all(K == K.T)
+
+        K_packed = k.gram(x, packed=True, tile_size=tile_size)
+        assert K_packed.shape == (9 * 10 // 2,)
+        assert np.allclose(K_packed, res[np.triu_indices(9)], rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_gram_raises(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    # wrong dimensionality
+    with pytest.raises(ValueError):
+        k.gram(np.random.rand(3, 3))
+
+    # tile size is not positive
+    with pytest.raises(ValueError):
+        k.gram(np.random.rand(3, 2), tile_size=0)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_paired(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(6, 2)
+    x2 = np.random.rand(6, 2)
+
+    res = k.evaluate_paired(x1, x2)
+    assert res.shape == (6,)
+    assert np.allclose(res, np.diag(k.evaluate(x1, x2)), rtol=1e-12, atol=1e-14)
+
+    res = k.diag(x1)
+    assert res.shape == (6,)
+    assert np.allclose(res, np.diag(k.evaluate(x1, x1)), rtol=1e-12, atol=1e-12)
+
+    # different number of points
+    with pytest.raises(ValueError):
+        k.evaluate_paired(x1, x2[:5])
+
+    # wrong dimensionality
+    with pytest.raises(ValueError):
+        k.evaluate_paired(np.random.rand(6, 3), np.random.rand(6, 3))
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_column_and_rows(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(6, 2)
+    x2 = np.random.rand(4, 2)
+    K = k.evaluate(x1, x2)
+
+    res = k.evaluate_column(x1, x2, 2)
+    assert res.shape == (6,)
+    assert np.allclose(res, K[:, 2])
+    assert np.allclose(k.evaluate_column(x1, x2, -1), K[:, -1])
+
+    res = k.evaluate_rows(x1, x2, [4, 0, 4])
+    assert res.shape == (3, 4)
+    assert np.allclose(res, K[[4, 0, 4]])
+
+    out = np.empty([2, 4])
+    res = k.evaluate_rows(x1, x2, np.array([1, 3]), out=out)
+    assert res is out
+    assert np.allclose(out, K[[1, 3]])
+
+    # index out of range
+    with pytest.raises(ValueError):
+        k.evaluate_column(x1, x2, 4)
+
+    # rows not one-dimensional
+    with pytest.raises(ValueError):
+        k.evaluate_rows(x1, x2, np.zeros([2, 2], dtype=int))
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_float32(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(6, 2)
+    x2 = np.random.rand(4, 2)
+    K = k.evaluate(x1, x2)
+
+    res = k.evaluate(x1, x2, dtype=np.float32)
+    assert res.dtype == np.float32
+    assert np.allclose(res, K, atol=1e-6)
+
+    # the type of out is used by default
+    out = np.empty([6, 4], dtype=np.float32)
+    assert k.evaluate(x1, x2, out=out, tile_size=4) is out
+    assert np.array_equal(out, res)
+
+    assert k.gram(x1, dtype=np.float32).dtype == np.float32
+    assert k.gram(x1, packed=True, dtype=np.float32).dtype == np.float32
+    assert k.diag(x1, dtype=np.float32).dtype == np.float32
+    assert k.evaluate_column(x1, x2, 1, dtype=np.float32).dtype == np.float32
+    assert np.allclose(k.gram(x1, dtype=np.float32), k.gram(x1), atol=1e-6)
+
+    # out and dtype must agree, and dtype must be a floating point type
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2, out=out, dtype=np.float64)
+
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2, dtype=int)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_batch(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(6, 2)
+    x2 = np.random.rand(4, 2)
+    lengthscales = np.array([[0.5, 1.0], [2.0, 0.3], [1.0, 1.0]])
+
+    res = k.evaluate_batch(x1, x2, lengthscales)
+    assert res.shape == (3, 6, 4)
+    for b, ell in enumerate(lengthscales):
+        k_b = type(k)({"lengthscales": list(ell)})
+        assert np.allclose(res[b], k_b.evaluate(x1, x2), rtol=1e-12, atol=1e-14)
+
+    res = k.evaluate_batch(x1, x2, lengthscales, dtype=np.float32)
+    assert res.dtype == np.float32
+    assert np.allclose(res, k.evaluate_batch(x1, x2, lengthscales), atol=1e-6)
+
+    # wrong shape of lengthscales
+    with pytest.raises(ValueError):
+        k.evaluate_batch(x1, x2, lengthscales[:, :1])
+
+    # non-positive lengthscales
+    with pytest.raises(ValueError):
+        k.evaluate_batch(x1, x2, -lengthscales)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_stacked(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(5, 6, 2) + np.arange(5)[:, None, None]
+    x2 = np.random.rand(5, 4, 2) + np.arange(5)[:, None, None]
+
+    res = k.evaluate(x1, x2)
+    assert res.shape == (5, 6, 4)
+    for b in range(5):
+        assert np.allclose(res[b], k.evaluate(x1[b], x2[b]), rtol=1e-12, atol=1e-14)
+
+    # tiles and workers split the problems
+    out = np.empty([5, 6, 4])
+    assert k.evaluate(x1, x2, out=out, tile_size=2, num_workers=2) is out
+    assert np.array_equal(out, k.evaluate(x1, x2, tile_size=2))
+
+    res_32 = k.evaluate(x1, x2, dtype=np.float32)
+    assert res_32.dtype == np.float32
+    assert np.allclose(res_32, res, atol=1e-6)
+
+    # an empty batch
+    assert k.evaluate(x1[:0], x2[:0]).shape == (0, 6, 4)
+
+    # mismatch of batched and non-batched points, of problems, and of dimensionality
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2[0])
+
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2[:4])
+
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2[:, :, :1])
+
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2, out=np.empty([5, 4, 6]))
+
+
+def test_kernel_evaluate_batch_nu(matern, matern32):
+
+    np.random.seed(0)
+    x1 = np.random.rand(6, 2)
+    x2 = np.random.rand(4, 2)
+    lengthscales = np.array([[0.5, 1.0], [2.0, 0.3], [1.0, 1.0]])
+    nu = np.array([0.5, 2.5, 5.5])
+
+    res = matern.evaluate_batch(x1, x2, lengthscales, nu=nu)
+    for b in range(3):
+        k_b = MaternKernel({"lengthscales": list(lengthscales[b]), "nu": nu[b]})
+        assert np.allclose(res[b], k_b.evaluate(x1, x2), rtol=1e-12, atol=1e-14)
+
+    # repeated values of nu are evaluated together
+    nu_repeated = np.array([2.5, 0.5, 2.5])
+    res = matern.evaluate_batch(x1, x2, lengthscales, nu=nu_repeated)
+    for b in range(3):
+        k_b = MaternKernel({"lengthscales": list(lengthscales[b]), "nu": nu_repeated[b]})
+        assert np.allclose(res[b], k_b.evaluate(x1, x2), rtol=1e-12, atol=1e-14)
+
+    # nu must have shape (B,) and be half-integer
+    with pytest.raises(ValueError):
+        matern.evaluate_batch(x1, x2, lengthscales, nu=nu[:2])
+
+    with pytest.raises(ValueError):
+        matern.evaluate_batch(x1, x2, lengthscales, nu=np.array([0.5, 1.0, 1.5]))
+
+    # nu is fixed for the other Matern kernels
+    with pytest.raises(ValueError):
+        matern32.evaluate_batch(x1, x2, lengthscales, nu=nu)
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_kernel_evaluate_parallel(kernel_name, backend, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(2 * DEFAULT_BLOCK_SIZE + 11, 2)
+    x2 = np.random.rand(5, 2)
+
+    # bitwise identical to the plain serial evaluation, for the default tiles and for given ones
+    res_serial = k.evaluate(x1, x2)
+    for num_workers in [2, 3, 7]:
+        assert np.array_equal(k.evaluate(x1, x2, num_workers=num_workers, backend=backend), res_serial)
+        res_tiled = k.evaluate(x1, x2, tile_size=4)
+        assert np.array_equal(k.evaluate(x1, x2, tile_size=4, num_workers=num_workers, backend=backend), res_tiled)
+
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2, num_workers=0)
+
+    with pytest.raises(ValueError):
+        k.evaluate(x1, x2, num_workers=2, backend="unknown_backend")
+
+
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_tiled_memory(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x = np.random.rand(900, 2)
+    out = np.empty([900, 900])
+    k.evaluate(x, x, out=out, tile_size=300)
+
+    # at most two scratch tiles, independent of the dimensionality, and the fixed-size buffers of the ufuncs
+    tracemalloc.start()
+    k.evaluate(x, x, out=out, tile_size=300)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak <= 2 * out.nbytes / 3 + 2**18
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("kernel_name", kernel_list)
+def test_kernel_evaluate_tile_no_allocation(kernel_name, dtype, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(600, 2).astype(dtype)
+    x2 = np.random.rand(900, 2).astype(dtype)
+    out = np.empty([600, 900], dtype=dtype)
+    work = np.empty(k._work_size(out.shape, out.dtype), dtype=dtype)
+    prepared = k._prepare(x2)
+
+    # scratch space and x2-dependent arrays are allocated once per evaluate call, not per tile
+    tracemalloc.start()
+    k._evaluate(x1, x2, out, work, prepared)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak <= 2**18
+    assert np.array_equal(out, k.evaluate(x1, x2, tile_size=600, dtype=dtype))
+
+    x1_stacked = x1.reshape(3, 200, 2)
+    x2_stacked = x2.reshape(3, 300, 2)
+    out = np.empty([3, 200, 300], dtype=dtype)
+    prepared = k._prepare(x2_stacked)
+
+    tracemalloc.start()
+    k._evaluate_stacked(x1_stacked, x2_stacked, out, work, prepared)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak <= 2**18
+    assert np.array_equal(out, k.evaluate(x1_stacked, x2_stacked, tile_size=3, dtype=dtype))
+
+
+def test_kernel_evaluate_parallel_high_dim():
+    k = ExpQuadKernel({"ndim": 64})
+
+    np.random.seed(0)
+    x = np.random.rand(1001, 64)
+
+    # the fused evaluation rounds per tile, hence the tiles must not depend on the number of workers
+    res_serial = k.evaluate(x, x)
+    for num_workers in [4, 7, 16]:
+        assert np.array_equal(k.evaluate(x, x, num_workers=num_workers), res_serial)
+
+
+@pytest.mark.parametrize("kernel_name", ["expquad", "matern"])
+def test_kernel_evaluate_process_backend(kernel_name, request):
+    k = request.getfixturevalue(kernel_name)
+
+    np.random.seed(0)
+    x1 = np.random.rand(11, 2)
+    x2 = np.random.rand(5, 2)
+
+    out = np.empty([11, 5])
+    res = k.evaluate(x1, x2, out=out, tile_size=3, num_workers=2, backend="process")
+    assert res is out
+    assert np.array_equal(res, k.evaluate(x1, x2, tile_size=3))
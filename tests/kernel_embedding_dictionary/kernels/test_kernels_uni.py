@@ -12,6 +12,7 @@ from kernel_embedding_dictionary.kernels import (
     Matern52KernelUni,
     Matern72KernelUni,
     MaternKernelUni,
+    UnivariateKernel,
     Wendland0KernelUni,
     Wendland2KernelUni,
 )
@@ -127,3 +128,107 @@ def test_kernel_uni_raises(kernel_uni_name, request):
 
     with pytest.raises(ValueError):
         k.evaluate(x, wrong_x)
+
+
+@pytest.mark.parametrize("kernel_uni_name", kernel_uni_list)
+def test_kernel_uni_evaluate_matches_pair_loop(kernel_uni_name, request):
+    k = request.getfixturevalue(kernel_uni_name)
+
+    x1 = np.array([-1.2, 0.0, 0.3, 0.35, 2.0])
+    x2 = np.array([0.1, 0.3, 0.5, 1.4])
+
+    # the scalar loop is the ground truth for the vectorized evaluation
+    res = k.evaluate(x1, x2)
+    res_loop = k._evaluate_loop(x1, x2)
+    assert np.allclose(res, res_loop, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("kernel_uni_name", kernel_uni_list)
+def test_kernel_uni_evaluate_paired(kernel_uni_name, request):
+    k = request.getfixturevalue(kernel_uni_name)
+
+    x1 = np.array([-1.2, 0.0, 0.3, 0.35, 2.0])
+    x2 = np.array([0.1, 0.3, 0.5, 1.4, 2.0])
+
+    res = k.evaluate_paired(x1, x2)
+    assert res.shape == (5,)
+    assert np.allclose(res, np.diag(k.evaluate(x1, x2)), rtol=1e-12, atol=1e-14)
+    assert np.allclose(res, np.diag(k._evaluate_loop(x1, x2)), rtol=1e-12, atol=1e-14)
+
+    res = k.diag(x1)
+    assert res.shape == (5,)
+    assert np.allclose(res, np.diag(k.evaluate(x1, x1)), rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("kernel_uni_name", kernel_uni_list)
+def test_kernel_uni_evaluate_stacked(kernel_uni_name, request):
+    k = request.getfixturevalue(kernel_uni_name)
+
+    np.random.seed(0)
+    x1 = np.random.randn(3, 5)
+    x2 = np.random.randn(3, 4)
+
+    res = k._evaluate_stacked(x1, x2)
+    assert res.shape == (3, 5, 4)
+    for b in range(3):
+        assert np.allclose(res[b], k.evaluate(x1[b], x2[b]), rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("kernel_uni_name", kernel_uni_list)
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_kernel_uni_evaluate_into(kernel_uni_name, dtype, request):
+    k = request.getfixturevalue(kernel_uni_name)
+
+    np.random.seed(0)
+    x1 = np.random.randn(3, 5).astype(dtype)
+    x2 = np.random.randn(3, 4).astype(dtype)
+    rtol = 1e-12 if dtype == np.float64 else 1e-5
+
+    # the in-place evaluation matches the kernel function
+    out = np.empty([5, 4], dtype=dtype)
+    k._evaluate_into(x1[0], x2[0], out, np.empty_like(out))
+    assert np.allclose(out, k.evaluate(x1[0], x2[0]), rtol=rtol, atol=rtol * 1e-2)
+
+    out = np.empty([3, 5, 4], dtype=dtype)
+    k._evaluate_stacked_into(x1, x2, out, np.empty_like(out))
+    assert np.allclose(out, k._evaluate_stacked(x1, x2), rtol=rtol, atol=rtol * 1e-2)
+
+
+class PairOnlyKernelUni(UnivariateKernel):
+    """Custom kernel without a vectorized kernel function."""
+
+    @property
+    def param_dict(self) -> dict:
+        return {}
+
+    def _evaluate_pair(self, x1: float, x2: float) -> float:
+        return float(np.exp(-abs(x1 - x2)))
+
+
+def test_kernel_uni_pair_only():
+    k = PairOnlyKernelUni()
+    k_ref = Matern12KernelUni(ell=1.0)
+
+    np.random.seed(0)
+    x1 = np.random.randn(3, 5)
+    x2 = np.random.randn(3, 4)
+
+    # evaluated by the scalar loops
+    assert np.allclose(k.evaluate(x1[0], x2[0]), k_ref.evaluate(x1[0], x2[0]), rtol=1e-12, atol=1e-14)
+    assert np.allclose(k.evaluate_paired(x1[0], x1[1]), k_ref.evaluate_paired(x1[0], x1[1]), rtol=1e-12, atol=1e-14)
+    assert np.allclose(k._evaluate_stacked(x1, x2), k_ref._evaluate_stacked(x1, x2), rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("kernel_uni_name", kernel_uni_list)
+def test_kernel_uni_evaluate_paired_raises(kernel_uni_name, request):
+    k = request.getfixturevalue(kernel_uni_name)
+
+    x = np.array([1.0, 1.0, 1.0])
+
+    # wrong shape
+    with pytest.raises(ValueError):
+        k.evaluate_paired(x, np.array([[1.0], [1.0], [1.0]]))
+
+    # different number of points
+    with pytest.raises(ValueError):
+        k.evaluate_paired(x, np.array([1.0, 1.0]))
@@ -4,8 +4,10 @@
 
 import numpy as np
 import pytest
+from scipy.special import factorial
 
 from kernel_embedding_dictionary.kernels import (
+    ExpQuadKernelUni,
     Matern12Kernel,
     Matern12KernelUni,
     Matern32Kernel,
@@ -17,6 +19,7 @@ from kernel_embedding_dictionary.kernels import (
     MaternKernel,
     MaternKernelUni,
 )
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d import matern_poly_coefs
 
 
 # tests for MaternKernelUni start here
@@ -73,22 +76,46 @@ def test_matern_kernel_uni_evaluations():
     # Matern 1/2
     k1 = Matern12KernelUni(ell=ell)
     k2 = MaternKernelUni(nu=0.5, ell=ell)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
 
     # Matern 3/2
     k1 = Matern32KernelUni(ell=ell)
     k2 = MaternKernelUni(nu=1.5, ell=ell)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
 
     # Matern 5/2
     k1 = Matern52KernelUni(ell=ell)
     k2 = MaternKernelUni(nu=2.5, ell=ell)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
 
     # Matern 7/2
     k1 = Matern72KernelUni(ell=ell)
     k2 = MaternKernelUni(nu=3.5, ell=ell)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
+
+
+def test_matern_kernel_uni_large_nu():
+
+    # the Matern kernel converges to the exponentiated quadratic kernel as nu grows
+    ell = 0.7
+    x = np.linspace(-3, 3, 25)
+    k = MaternKernelUni(nu=400.5, ell=ell)
+    K = k.evaluate(x, x)
+    assert np.all(np.isfinite(K))
+    assert np.allclose(np.diag(K), 1.0)
+    assert np.allclose(K, ExpQuadKernelUni(ell=ell).evaluate(x, x), atol=5e-3)
+
+
+def test_matern_kernel_poly_coefs():
+
+    # log-space coefficients against the factorial formula; they are cached per n
+    for n in range(8):
+        ks = np.arange(n + 1)
+        coefs = (
+            factorial(n) / factorial(2 * n) * 2.0 ** (n - ks) * factorial(n + ks) / factorial(ks) / factorial(n - ks)
+        )
+        assert np.allclose(matern_poly_coefs(n), coefs[::-1], rtol=1e-12)
+        assert matern_poly_coefs(n) is matern_poly_coefs(n)
 
 
 # tests for MaternKernel start here
@@ -170,25 +197,25 @@ def test_matern_kernel_evaluations():
     c2 = {"nu": 0.5, "ndim": 2, "lengthscales": [1.0, 0.5]}
     k1 = Matern12Kernel(c1)
     k2 = MaternKernel(c2)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
 
     # # Matern 3/2
     c1 = {"ndim": 2, "lengthscales": [1.0, 0.5]}
     c2 = {"nu": 1.5, "ndim": 2, "lengthscales": [1.0, 0.5]}
     k1 = Matern32Kernel(c1)
     k2 = MaternKernel(c2)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
 
     # # Matern 5/2
     c1 = {"ndim": 2, "lengthscales": [1.0, 0.5]}
     c2 = {"nu": 2.5, "ndim": 2, "lengthscales": [1.0, 0.5]}
     k1 = Matern52Kernel(c1)
     k2 = MaternKernel(c2)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
 
     # # Matern 7/2
     c1 = {"ndim": 2, "lengthscales": [1.0, 0.5]}
     c2 = {"nu": 3.5, "ndim": 2, "lengthscales": [1.0, 0.5]}
     k1 = Matern72Kernel(c1)
     k2 = MaternKernel(c2)
-    assert (k1.evaluate(x, x) == k2.evaluate(x, x)).all
+    assert np.allclose(k1.evaluate(x, x), k2.evaluate(x, x), rtol=1e-12, atol=1e-14)
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: MIT
 
 
+import numpy as np
 import pytest
+from scipy.sparse import csr_matrix
 
 from kernel_embedding_dictionary.kernels import Wendland0Kernel, Wendland0KernelUni
 
@@ -85,3 +87,29 @@ def test_wendland0_kernel_raises():
     wrong_c = {"ndim": 1, "lengthscales": [1.0, 1.0]}
     with pytest.raises(ValueError):
         Wendland0Kernel(wrong_c)
+
+
+def test_wendland0_kernel_evaluate_sparse():
+
+    np.random.seed(0)
+    c = {"ndim": 3, "lengthscales": [0.1, 0.2, 0.15]}
+    k = Wendland0Kernel(c)
+
+    x1 = np.random.rand(40, 3)
+    x2 = np.random.rand(30, 3)
+    x2[:5] = x1[:5]  # some identical points
+
+    K_sparse = k.evaluate_sparse(x1, x2)
+    K_dense = k.evaluate(x1, x2)
+    assert isinstance(K_sparse, csr_matrix)
+    assert K_sparse.shape == (40, 30)
+    assert K_sparse.nnz == np.count_nonzero(K_dense)
+    assert np.allclose(K_sparse.toarray(), K_dense, rtol=1e-12, atol=1e-14)
+
+    # no pair within the support
+    K_sparse = k.evaluate_sparse(x1, x2 + 10.0)
+    assert K_sparse.nnz == 0
+
+    # wrong dimensionality
+    with pytest.raises(ValueError):
+        k.evaluate_sparse(x1[:, :2], x2[:, :2])
@@ -0,0 +1,70 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary import get_embedding
+from kernel_embedding_dictionary.kernels import ExpQuadKernelUni, Wendland0KernelUni, Wendland2KernelUni
+from kernel_embedding_dictionary.linalg import BandedGram, banded_quadrature_weights
+
+
+@pytest.mark.parametrize("kernel", [Wendland0KernelUni(ell=0.05), Wendland2KernelUni(ell=0.08)])
+def test_banded_gram_values(kernel):
+
+    np.random.seed(0)
+    x = np.random.rand(200)
+    K = kernel.evaluate(x, x)
+
+    gram = BandedGram(kernel, x)
+    assert 0 < gram.bandwidth < 200
+    assert gram.banded.shape == (gram.bandwidth + 1, 200)
+    assert np.allclose(gram.to_dense(), K, rtol=1e-12, atol=1e-14)
+
+    # matvec, solve and logdet against the dense Gram matrix
+    v = np.random.randn(200)
+    V = np.random.randn(200, 3)
+    assert np.allclose(gram.matvec(v), K @ v)
+    assert np.allclose(gram.matvec(V), K @ V)
+    assert np.allclose(gram.solve(v), np.linalg.solve(K, v))
+    assert np.allclose(gram.solve(V), np.linalg.solve(K, V))
+    assert np.isclose(gram.logdet(), np.linalg.slogdet(K)[1])
+
+
+def test_banded_gram_no_overlap():
+
+    # points further apart than the support give a diagonal Gram matrix
+    kernel = Wendland0KernelUni(ell=0.5)
+    x = np.array([3.0, 0.0, 1.0, 2.0])
+    gram = BandedGram(kernel, x)
+    assert gram.bandwidth == 0
+    assert np.allclose(gram.to_dense(), np.eye(4))
+
+
+def test_banded_gram_raises():
+
+    # kernel without compact support
+    with pytest.raises(ValueError):
+        BandedGram(ExpQuadKernelUni(ell=1.0), np.random.rand(5))
+
+    # x has wrong shape
+    with pytest.raises(ValueError):
+        BandedGram(Wendland0KernelUni(ell=1.0), np.random.rand(5, 1))
+
+
+def test_banded_quadrature_weights():
+
+    np.random.seed(0)
+    ke = get_embedding("wendland0", "lebesgue", {"lengthscales": [0.05]}, {"bounds": [(0.0, 1.0)]})
+    x = np.random.rand(100)
+
+    K = ke.kernel.evaluate(x[:, None], x[:, None])
+    z = ke.mean(x[:, None])
+    weights = banded_quadrature_weights(ke, x)
+    assert np.allclose(weights, np.linalg.solve(K, z))
+
+    # embedding must be one-dimensional
+    ke_2d = get_embedding("wendland0", "lebesgue", {"ndim": 2}, {"ndim": 2})
+    with pytest.raises(ValueError):
+        banded_quadrature_weights(ke_2d, x)
@@ -0,0 +1,56 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary.kernels import ExpQuadKernel, Matern32Kernel
+from kernel_embedding_dictionary.linalg import fast_gauss_transform
+
+
+@pytest.mark.parametrize("ndim", [1, 2, 3])
+@pytest.mark.parametrize("lengthscale", [0.1, 0.7])
+@pytest.mark.parametrize("tol", [1e-3, 1e-8])
+def test_fast_gauss_transform_values(ndim, lengthscale, tol):
+    k = ExpQuadKernel({"ndim": ndim, "lengthscales": [lengthscale]})
+
+    np.random.seed(0)
+    x = np.random.rand(300, ndim)
+    y = np.random.rand(200, ndim)
+    weights = np.random.randn(200)
+
+    res = fast_gauss_transform(k, x, y, weights, tol=tol)
+    res_true = k.evaluate(x, y) @ weights
+    assert res.shape == (300,)
+    assert np.max(np.abs(res - res_true)) <= tol * np.sum(np.abs(weights))
+
+
+def test_fast_gauss_transform_anisotropic():
+    k = ExpQuadKernel({"ndim": 2, "lengthscales": [0.05, 2.0]})
+
+    np.random.seed(1)
+    x = np.random.rand(100, 2)
+    y = np.random.rand(500, 2)
+    weights = np.random.rand(500)
+
+    res = fast_gauss_transform(k, x, y, weights, tol=1e-6, cluster_radius=0.3)
+    assert np.max(np.abs(res - k.evaluate(x, y) @ weights)) <= 1e-6 * np.sum(weights)
+
+
+def test_fast_gauss_transform_raises():
+    x = np.random.rand(5, 2)
+    weights = np.ones(5)
+
+    with pytest.raises(ValueError):
+        fast_gauss_transform(Matern32Kernel({"ndim": 2}), x, x, weights)
+
+    k = ExpQuadKernel({"ndim": 2})
+    with pytest.raises(ValueError):
+        fast_gauss_transform(k, x, x, np.ones(4))
+
+    with pytest.raises(ValueError):
+        fast_gauss_transform(k, x, x, weights, tol=0)
+
+    with pytest.raises(ValueError):
+        fast_gauss_transform(k, x, x[:, :1], weights)
@@ -0,0 +1,80 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary import get_embedding
+from kernel_embedding_dictionary.linalg import NystromApproximation
+
+embedding_names = [
+    ("expquad", "lebesgue"),
+    ("expquad", "gaussian"),
+    ("matern32", "lebesgue"),
+    ("matern52", "lebesgue"),
+    ("wendland0", "gaussian"),
+]
+
+
+@pytest.mark.parametrize("kernel_name,measure_name", embedding_names)
+def test_nystrom_exact_at_landmarks(kernel_name, measure_name):
+    ke = get_embedding(kernel_name, measure_name, {"ndim": 2}, {"ndim": 2})
+
+    np.random.seed(0)
+    z = ke.measure.sample(30)
+    nystrom = NystromApproximation(ke, landmarks=z)
+    assert nystrom.rank <= 30
+    factor = nystrom.factor(z)
+    assert factor.shape == (30, nystrom.rank)
+    assert np.allclose(factor @ factor.T, ke.kernel.evaluate(z, z), atol=1e-6)
+    assert np.allclose(nystrom.mean(z), ke.mean(z), atol=1e-6)
+
+
+@pytest.mark.parametrize("kernel_name,measure_name", embedding_names)
+def test_nystrom_quadrature(kernel_name, measure_name):
+    ke = get_embedding(kernel_name, measure_name, {"ndim": 2}, {"ndim": 2})
+
+    np.random.seed(1)
+    nystrom = NystromApproximation(ke, num_landmarks=40)
+    assert nystrom.landmarks.shape == (40, 2)
+
+    x = ke.measure.sample(300)
+    factor = nystrom.factor(x)
+    nugget = 1e-4
+    weights = nystrom.quadrature_weights(x, nugget=nugget)
+
+    # compare to the dense solve with the approximate Gram matrix
+    gram = factor @ factor.T + nugget * np.eye(300)
+    z = nystrom.mean(x)
+    assert np.allclose(weights, np.linalg.solve(gram, z))
+
+    variance = nystrom.integral_variance(x, nugget=nugget)
+    variance_dense = nystrom.mean_coefs @ nystrom.mean_coefs - z @ np.linalg.solve(gram, z)
+    assert np.isclose(variance, variance_dense, atol=1e-8)
+    assert variance >= 0
+
+    assert nystrom.mmd(x, weights) < nystrom.mmd(x)
+
+
+def test_nystrom_raises():
+    ke = get_embedding("expquad", "gaussian", {"ndim": 2}, {"ndim": 2})
+
+    with pytest.raises(ValueError):
+        NystromApproximation(ke)
+
+    with pytest.raises(ValueError):
+        NystromApproximation(ke, num_landmarks=5, landmarks=np.ones([5, 2]))
+
+    with pytest.raises(ValueError):
+        NystromApproximation(ke, num_landmarks=0)
+
+    nystrom = NystromApproximation(ke, num_landmarks=5)
+    with pytest.raises(ValueError):
+        nystrom.quadrature_weights(np.ones([3, 2]), nugget=0)
+
+    with pytest.raises(ValueError):
+        nystrom.mmd(np.ones([3, 2]), np.ones(2))
+
+    with pytest.raises(ValueError):
+        nystrom.factor(np.ones([3, 3]))
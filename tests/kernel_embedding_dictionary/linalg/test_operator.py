@@ -0,0 +1,97 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+from scipy.sparse.linalg import cg
+
+from kernel_embedding_dictionary import get_embedding
+from kernel_embedding_dictionary.kernels import (
+    ExpQuadKernel,
+    Matern12Kernel,
+    Matern32Kernel,
+    Matern52Kernel,
+    Matern72Kernel,
+    MaternKernel,
+    Wendland0Kernel,
+    Wendland2Kernel,
+)
+from kernel_embedding_dictionary.linalg import KernelLinearOperator
+
+kernel_types = [
+    ExpQuadKernel,
+    MaternKernel,
+    Matern12Kernel,
+    Matern32Kernel,
+    Matern52Kernel,
+    Matern72Kernel,
+    Wendland0Kernel,
+    Wendland2Kernel,
+]
+
+
+@pytest.mark.parametrize("kernel_type", kernel_types)
+def test_kernel_linear_operator_values(kernel_type):
+    k = kernel_type({"ndim": 2})
+
+    np.random.seed(0)
+    x1 = np.random.rand(11, 2)
+    x2 = np.random.rand(7, 2)
+    K = k.evaluate(x1, x2)
+
+    op = KernelLinearOperator(k, x1, x2, block_size=3)
+    assert op.shape == (11, 7)
+
+    v = np.random.randn(7)
+    V = np.random.randn(7, 3)
+    u = np.random.randn(11)
+    U = np.random.randn(11, 2)
+    assert np.allclose(op @ v, K @ v)
+    assert np.allclose(op @ V, K @ V)
+    assert np.allclose(op.T @ u, K.T @ u)
+    assert np.allclose(op.T @ U, K.T @ U)
+
+    # x2 defaults to x1
+    op = KernelLinearOperator(k, x1, block_size=4)
+    assert op.shape == (11, 11)
+    assert np.allclose(op @ u, k.evaluate(x1, x1) @ u)
+
+
+def test_kernel_linear_operator_float32():
+    k = Matern32Kernel({"ndim": 2})
+
+    np.random.seed(0)
+    x = np.random.rand(11, 2)
+    v = np.random.rand(11).astype(np.float32)
+
+    op = KernelLinearOperator(k, x, block_size=4, dtype=np.float32)
+    assert op.dtype == np.float32
+    res = op @ v
+    assert res.dtype == np.float32
+    assert np.allclose(res, k.evaluate(x, x) @ v, rtol=1e-5)
+
+
+def test_kernel_linear_operator_cg():
+
+    np.random.seed(0)
+    ke = get_embedding("matern12", "lebesgue", {"ndim": 2}, {"ndim": 2})
+    x = np.random.rand(30, 2)
+    z = ke.mean(x)
+
+    op = KernelLinearOperator(ke.kernel, x, block_size=8)
+    weights, info = cg(op, z, rtol=1e-10)
+    assert info == 0
+    assert np.allclose(weights, np.linalg.solve(ke.kernel.evaluate(x, x), z), rtol=1e-6, atol=1e-6)
+
+
+def test_kernel_linear_operator_raises():
+    k = ExpQuadKernel({"ndim": 2})
+
+    # wrong dimensionality
+    with pytest.raises(ValueError):
+        KernelLinearOperator(k, np.random.rand(5, 3))
+
+    # block size not positive
+    with pytest.raises(ValueError):
+        KernelLinearOperator(k, np.random.rand(5, 2), block_size=0)
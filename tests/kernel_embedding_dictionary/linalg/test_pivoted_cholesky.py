@@ -0,0 +1,105 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+from scipy.sparse.linalg import cg
+
+from kernel_embedding_dictionary.kernels import (
+    ExpQuadKernel,
+    Matern12Kernel,
+    Matern32Kernel,
+    Matern52Kernel,
+    MaternKernel,
+    Wendland0Kernel,
+    Wendland2Kernel,
+)
+from kernel_embedding_dictionary.linalg import PivotedCholesky
+
+kernel_types = [
+    ExpQuadKernel,
+    MaternKernel,
+    Matern12Kernel,
+    Matern32Kernel,
+    Matern52Kernel,
+    Wendland0Kernel,
+    Wendland2Kernel,
+]
+
+
+@pytest.mark.parametrize("kernel_type", kernel_types)
+def test_pivoted_cholesky_full_rank(kernel_type):
+    k = kernel_type({"ndim": 2, "lengthscales": [0.5]})
+
+    np.random.seed(0)
+    x = np.random.rand(30, 2)
+    chol = PivotedCholesky(k, x, tol=0)
+    L = chol.factor
+    assert L.shape == (30, chol.rank)
+    assert np.allclose(L @ L.T, k.evaluate(x, x), atol=1e-8)
+    assert len(np.unique(chol.pivots)) == chol.rank
+
+
+@pytest.mark.parametrize("kernel_type", kernel_types)
+def test_pivoted_cholesky_low_rank(kernel_type):
+    k = kernel_type({"ndim": 2, "lengthscales": [0.5]})
+
+    np.random.seed(0)
+    x = np.random.rand(200, 2)
+    K = k.evaluate(x, x)
+
+    # stops at the maximal rank, and the residual is positive semi-definite with the reported trace
+    chol = PivotedCholesky(k, x, max_rank=20)
+    assert chol.rank == 20
+    residual = K - chol.factor @ chol.factor.T
+    assert np.isclose(chol.trace_error, np.trace(residual))
+    assert np.linalg.eigvalsh(residual).min() > -1e-8
+
+    # stops at the tolerance
+    chol = PivotedCholesky(k, x, tol=1e-2)
+    assert chol.trace_error <= 1e-2 * np.trace(K)
+
+
+def test_pivoted_cholesky_preconditioner():
+    k = Matern32Kernel({"ndim": 2, "lengthscales": [0.3]})
+
+    np.random.seed(0)
+    x = np.random.rand(500, 2)
+    nugget = 1e-3
+    A = k.evaluate(x, x) + nugget * np.eye(500)
+    b = np.random.randn(500)
+
+    chol = PivotedCholesky(k, x, max_rank=100)
+    M = chol.preconditioner(nugget)
+    L = chol.factor
+    assert np.allclose(M @ np.eye(500), np.linalg.inv(L @ L.T + nugget * np.eye(500)))
+
+    num_iterations = []
+    for preconditioner in [None, M]:
+        iterations = []
+        sol, info = cg(A, b, M=preconditioner, rtol=1e-8, maxiter=2000, callback=iterations.append)
+        num_iterations.append(len(iterations))
+        assert info == 0
+        assert np.allclose(A @ sol, b, atol=1e-5)
+    assert num_iterations[1] < num_iterations[0]
+
+
+def test_pivoted_cholesky_raises():
+    k = ExpQuadKernel({"ndim": 2})
+    x = np.random.rand(10, 2)
+
+    with pytest.raises(ValueError):
+        PivotedCholesky(k, x, max_rank=0)
+
+    with pytest.raises(ValueError):
+        PivotedCholesky(k, x, max_rank=11)
+
+    with pytest.raises(ValueError):
+        PivotedCholesky(k, x, tol=-1)
+
+    with pytest.raises(ValueError):
+        PivotedCholesky(k, np.random.rand(10, 3))
+
+    with pytest.raises(ValueError):
+        PivotedCholesky(k, x).preconditioner(0)
@@ -0,0 +1,107 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary import get_embedding
+from kernel_embedding_dictionary.kernels import (
+    Matern12KernelUni,
+    Matern32KernelUni,
+    Matern52KernelUni,
+    Matern72KernelUni,
+    MaternKernelUni,
+    Wendland0KernelUni,
+)
+from kernel_embedding_dictionary.linalg import StateSpaceGram, state_space_quadrature_weights
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [
+        Matern12KernelUni(ell=0.5),
+        Matern32KernelUni(ell=0.5),
+        Matern52KernelUni(ell=0.3),
+        Matern72KernelUni(ell=0.3),
+        MaternKernelUni(nu=2.5, ell=0.3),
+        MaternKernelUni(nu=4.5, ell=0.1),
+    ],
+)
+def test_state_space_gram_values(kernel):
+
+    np.random.seed(0)
+    x = np.random.rand(40) * 4
+    K = kernel.evaluate(x, x)
+
+    gram = StateSpaceGram(kernel, x)
+    assert gram.state_dim == int(kernel.nu) + 1
+    assert np.allclose(gram.to_dense(), K, rtol=1e-10, atol=1e-12)
+
+    # matvec, solve and logdet against the dense Gram matrix
+    v = np.random.randn(40)
+    V = np.random.randn(40, 3)
+    assert np.allclose(gram.matvec(v), K @ v)
+    assert np.allclose(gram.matvec(V), K @ V)
+    assert np.allclose(K @ gram.solve(v), v, rtol=1e-6, atol=1e-6)
+    assert np.allclose(K @ gram.solve(V), V, rtol=1e-6, atol=1e-6)
+    assert np.isclose(gram.logdet(), np.linalg.slogdet(K)[1], rtol=1e-6)
+
+
+def test_state_space_gram_raises():
+
+    # kernel without state-space representation
+    with pytest.raises(ValueError):
+        StateSpaceGram(Wendland0KernelUni(ell=1.0), np.random.rand(5))
+
+    # x has wrong shape
+    with pytest.raises(ValueError):
+        StateSpaceGram(Matern12KernelUni(ell=1.0), np.random.rand(5, 1))
+
+
+@pytest.mark.parametrize(
+    "kernel", [Matern12KernelUni(ell=0.3), Matern32KernelUni(ell=0.01), MaternKernelUni(nu=4.5, ell=0.3)]
+)
+def test_state_space_gram_singular(kernel):
+
+    # duplicate points
+    x = np.array([0.0, 0.5, 0.5, 1.0])
+    gram = StateSpaceGram(kernel, x)
+    assert np.allclose(gram.to_dense(), kernel.evaluate(x, x))
+
+    with pytest.raises(ValueError):
+        gram.solve(np.ones(4))
+
+    with pytest.raises(ValueError):
+        gram.logdet()
+
+    # near-duplicate points
+    with pytest.raises(ValueError):
+        StateSpaceGram(kernel, np.array([0.0, 0.5, 0.5 + 1e-13, 1.0])).logdet()
+
+
+def test_state_space_gram_singular_many_points():
+
+    # random points, some of which nearly coincide relative to the lengthscale
+    np.random.seed(0)
+    gram = StateSpaceGram(Matern32KernelUni(ell=0.01), np.random.rand(100000))
+    with pytest.raises(ValueError):
+        gram.solve(np.ones(100000))
+
+
+@pytest.mark.parametrize("kernel_name", ["matern12", "matern32", "matern52", "matern72", "matern"])
+def test_state_space_quadrature_weights(kernel_name):
+
+    np.random.seed(0)
+    ke = get_embedding(kernel_name, "lebesgue", {"lengthscales": [0.1]}, {"bounds": [(0.0, 2.0)]})
+    x = np.random.rand(50) * 2
+
+    K = ke.kernel.evaluate(x[:, None], x[:, None])
+    z = ke.mean(x[:, None])
+    weights = state_space_quadrature_weights(ke, x)
+    assert np.allclose(K @ weights, z, rtol=1e-6, atol=1e-8)
+
+    # embedding must be one-dimensional
+    ke_2d = get_embedding(kernel_name, "lebesgue", {"ndim": 2}, {"ndim": 2})
+    with pytest.raises(ValueError):
+        state_space_quadrature_weights(ke_2d, x)
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 
+import numpy as np
 import pytest
 
 from kernel_embedding_dictionary.measures import GaussianMeasure, GaussianMeasureUni
@@ -135,3 +136,28 @@ def test_gaussian_measure_raises():
     wrong_c = {"ndim": 2, "variances": [1.0, 2.0, 2.0]}
     with pytest.raises(ValueError):
         GaussianMeasure(wrong_c)
+
+
+def test_gaussian_measure_batch_param_dicts():
+
+    m = GaussianMeasure({"means": [0.5, 1.0], "variances": [1.0, 2.0]})
+    means = np.array([[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]])
+    params = m.get_batch_param_dicts(means=means)
+    assert len(params) == 2
+    assert np.array_equal(params[1]["mean"], [1.0, 3.0, 5.0])
+
+    # missing parameters are those of the measure
+    assert np.array_equal(params[1]["variance"], [2.0, 2.0, 2.0])
+
+    # no parameters, wrong shapes and non-positive variances
+    with pytest.raises(ValueError):
+        m.get_batch_param_dicts()
+
+    with pytest.raises(ValueError):
+        m.get_batch_param_dicts(means=means[:, :1])
+
+    with pytest.raises(ValueError):
+        m.get_batch_param_dicts(means=means, variances=np.ones([2, 2]))
+
+    with pytest.raises(ValueError):
+        m.get_batch_param_dicts(variances=-np.ones([3, 2]))
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 
+import numpy as np
 import pytest
 
 from kernel_embedding_dictionary.measures import LebesgueMeasure, LebesgueMeasureUni
@@ -135,3 +136,24 @@ def test_lebesgue_measure_raises():
     wrong_c = {"ndim": 1, "bounds": [(0.0, 1.0), (0.0, 1.0)]}
     with pytest.raises(ValueError):
         LebesgueMeasure(wrong_c)
+
+
+def test_lebesgue_measure_batch_param_dicts():
+
+    bounds = np.array([[(0.0, 1.0), (1.0, 3.0)], [(-1.0, 3.0), (0.0, 0.5)]])
+    params = LebesgueMeasure({"ndim": 2}).get_batch_param_dicts(bounds=bounds)
+    assert len(params) == 2
+    assert np.array_equal(params[0]["lb"], [0.0, -1.0])
+    assert np.array_equal(params[0]["ub"], [1.0, 3.0])
+    assert np.array_equal(params[1]["density"], [1.0, 1.0])
+
+    # the density of normalized measures
+    params = LebesgueMeasure({"ndim": 2, "normalize": True}).get_batch_param_dicts(bounds=bounds)
+    assert np.allclose(params[1]["density"], [0.5, 2.0])
+
+    # wrong shape and bounds in wrong order
+    with pytest.raises(ValueError):
+        LebesgueMeasure({"ndim": 2}).get_batch_param_dicts(bounds=bounds[:, :1])
+
+    with pytest.raises(ValueError):
+        LebesgueMeasure({"ndim": 2}).get_batch_param_dicts(bounds=bounds[..., ::-1])
@@ -0,0 +1,159 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+from scipy import special
+
+from kernel_embedding_dictionary import backend
+from kernel_embedding_dictionary.embeddings.mean_funcs_1d import (
+    expquad_gaussian_mean_func_1d,
+    expquad_lebesgue_mean_func_1d,
+    matern12_gaussian_mean_func_1d,
+    matern12_lebesgue_mean_func_1d,
+    matern32_gaussian_mean_func_1d,
+    matern32_lebesgue_mean_func_1d,
+    matern52_lebesgue_mean_func_1d,
+    matern72_lebesgue_mean_func_1d,
+    matern_lebesgue_mean_func_1d,
+    wendland0_gaussian_mean_func_1d,
+    wendland0_lebesgue_mean_func_1d,
+    wendland2_gaussian_mean_func_1d,
+)
+from kernel_embedding_dictionary.kernels.kernel_funcs_1d import (
+    expquad_kernel_func_1d,
+    matern12_kernel_func_1d,
+    matern32_kernel_func_1d,
+    matern52_kernel_func_1d,
+    matern72_kernel_func_1d,
+    matern_kernel_func_1d,
+    wendland0_kernel_func_1d,
+    wendland2_kernel_func_1d,
+)
+
+KERNEL_FUNCS = [
+    (expquad_kernel_func_1d, {"ell": 0.8}),
+    (matern_kernel_func_1d, {"ell": 0.8, "nu": 4.5}),
+    (matern12_kernel_func_1d, {"ell": 0.8, "nu": 0.5}),
+    (matern32_kernel_func_1d, {"ell": 0.8, "nu": 1.5}),
+    (matern52_kernel_func_1d, {"ell": 0.8, "nu": 2.5}),
+    (matern72_kernel_func_1d, {"ell": 0.8, "nu": 3.5}),
+    (wendland0_kernel_func_1d, {"ell": 0.8, "order": 0}),
+    (wendland2_kernel_func_1d, {"ell": 0.8, "order": 2}),
+]
+
+LEBESGUE = {"lb": -1.0, "ub": 2.0, "density": 1 / 3}
+GAUSSIAN = {"mean": 0.0, "variance": 1.3}
+MEAN_FUNCS = [
+    (expquad_lebesgue_mean_func_1d, {"ell": 0.8, **LEBESGUE}),
+    (expquad_gaussian_mean_func_1d, {"ell": 0.8, **GAUSSIAN}),
+    (matern_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 4.5, **LEBESGUE}),
+    (matern12_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 0.5, **LEBESGUE}),
+    (matern12_gaussian_mean_func_1d, {"ell": 0.8, "nu": 0.5, **GAUSSIAN}),
+    (matern32_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 1.5, **LEBESGUE}),
+    (matern32_gaussian_mean_func_1d, {"ell": 0.8, "nu": 1.5, **GAUSSIAN}),
+    (matern52_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 2.5, **LEBESGUE}),
+    (matern72_lebesgue_mean_func_1d, {"ell": 0.8, "nu": 3.5, **LEBESGUE}),
+    (wendland0_lebesgue_mean_func_1d, {"ell": 0.8, "order": 0, **LEBESGUE}),
+    (wendland0_gaussian_mean_func_1d, {"ell": 0.8, "order": 0, **GAUSSIAN}),
+    (wendland0_gaussian_mean_func_1d, {"ell": 20.0, "order": 0, **GAUSSIAN}),
+    (wendland2_gaussian_mean_func_1d, {"ell": 0.8, "order": 2, **GAUSSIAN}),
+    (wendland2_gaussian_mean_func_1d, {"ell": 20.0, "order": 2, **GAUSSIAN}),
+]
+
+
+# arrays other than numpy's are resolved with array-api-compat
+def _array_api_strict():
+    pytest.importorskip("array_api_compat")
+    xp = pytest.importorskip("array_api_strict")
+    return xp.asarray
+
+
+def _torch():
+    pytest.importorskip("array_api_compat")
+    torch = pytest.importorskip("torch")
+    return lambda a: torch.asarray(a, device="cpu")
+
+
+def _jax():
+    pytest.importorskip("array_api_compat")
+    jax = pytest.importorskip("jax")
+    jax.config.update("jax_enable_x64", True)
+    return lambda a: jax.device_put(jax.numpy.asarray(a), jax.devices("cpu")[0])
+
+
+FRAMEWORKS = [_array_api_strict, _torch, _jax]
+
+
+def _to_numpy(a):
+    return np.from_dlpack(a)
+
+
+def test_get_namespace_numpy():
+
+    assert backend.get_namespace() is np
+    assert backend.get_namespace(1.0, 2) is np
+    assert backend.get_namespace(np.ones(3), np.float32(1.0), 0.5) is np
+
+
+@pytest.mark.parametrize(
+    "fallback, reference",
+    [
+        (backend._erf, special.erf),
+        (backend._erfc, special.erfc),
+        (backend._erfcx, special.erfcx),
+        (backend._log_ndtr, special.log_ndtr),
+    ],
+)
+def test_special_fallbacks_match_scipy(fallback, reference):
+    # the array API implementations, which are used for array types without native special functions
+    x = np.concatenate([np.linspace(-25, 25, 5001), np.logspace(-12, 0, 50), -np.logspace(-12, 0, 50)])
+    assert np.allclose(fallback(np, x), reference(x), rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_special_functions_frameworks(framework):
+    asarray = framework()
+    x = np.linspace(-8, 8, 101)
+    for func, reference in [
+        (backend.erf, special.erf),
+        (backend.erfc, special.erfc),
+        (backend.erfcx, special.erfcx),
+        (backend.ndtr, special.ndtr),
+        (backend.log_ndtr, special.log_ndtr),
+    ]:
+        assert np.allclose(_to_numpy(func(asarray(x))), reference(x), rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+@pytest.mark.parametrize("func, params", KERNEL_FUNCS)
+def test_kernel_funcs_frameworks(framework, func, params):
+    asarray = framework()
+    x1 = np.linspace(-1, 2, 7)[:, None]
+    x2 = np.linspace(-2, 1, 5)[None, :]
+    res = func(asarray(x1), asarray(x2), **params)
+    assert np.allclose(_to_numpy(res), func(x1, x2, **params), rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+@pytest.mark.parametrize("func, params", MEAN_FUNCS)
+def test_mean_funcs_frameworks(framework, func, params):
+    asarray = framework()
+    x = np.linspace(-3, 4, 15)
+    res = func(asarray(x), **params)
+    assert res.shape == (15,)
+    assert np.allclose(_to_numpy(res), func(x, **params), rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("func, params", MEAN_FUNCS)
+def test_mean_funcs_jax_jit(func, params):
+    asarray = _jax()
+    jax = pytest.importorskip("jax")
+    x = np.linspace(-3, 4, 15)
+
+    def mean_func(x):
+        return func(x, **params)
+
+    res = jax.jit(mean_func)(asarray(x))
+    assert np.allclose(_to_numpy(res), func(x, **params), rtol=1e-12, atol=1e-15)
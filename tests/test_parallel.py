@@ -0,0 +1,71 @@
+# Copyright 2025 The KED Authors. All Rights Reserved.
+# SPDX-License-Identifier: MIT
+
+
+import numpy as np
+import pytest
+
+from kernel_embedding_dictionary.parallel import DEFAULT_BLOCK_SIZE, get_blocks, run_blocks, run_blocks_in_processes
+
+
+def test_get_blocks():
+
+    assert get_blocks(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert get_blocks(10, 20) == [(0, 10)]
+    assert get_blocks(0, 3) == []
+
+    # default block size splits across workers
+    # the default block size does not depend on the number of workers
+    assert get_blocks(10) == [(0, 10)]
+    assert get_blocks(2 * DEFAULT_BLOCK_SIZE + 1) == [
+        (0, DEFAULT_BLOCK_SIZE),
+        (DEFAULT_BLOCK_SIZE, 2 * DEFAULT_BLOCK_SIZE),
+        (2 * DEFAULT_BLOCK_SIZE, 2 * DEFAULT_BLOCK_SIZE + 1),
+    ]
+
+
+def test_get_blocks_raises():
+
+    with pytest.raises(ValueError):
+        get_blocks(10, 0)
+
+    with pytest.raises(ValueError):
+        get_blocks(10, -1)
+
+
+@pytest.mark.parametrize("num_workers", [1, 2, 5])
+def test_run_blocks(num_workers):
+
+    res = np.zeros(10)
+
+    def func(start, stop):
+        res[start:stop] = np.arange(start, stop)
+
+    run_blocks(func, get_blocks(10, 3), num_workers)
+    assert np.array_equal(res, np.arange(10))
+
+
+def test_run_blocks_propagates_errors():
+
+    def func(start, stop):
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        run_blocks(func, get_blocks(10, 3), 2)
+
+
+def write_block(obj, arrays, start, stop):
+    arrays["out"][start:stop] = obj * arrays["x"][start:stop]
+
+
+def test_run_blocks_in_processes():
+
+    x = np.arange(10.0)
+    out = np.zeros(10)
+    arrays = {"x": x, "out": out}
+
+    run_blocks_in_processes(write_block, 2.0, arrays, ["out"], get_blocks(10, 3), 2)
+    assert np.array_equal(out, 2.0 * x)
+
+    # inputs are not modified
+    assert np.array_equal(x, np.arange(10.0))